@@ -1,13 +1,25 @@
 from . import conf, extras
-from ._cli import cli
+from ._caching import cache_clear, cache_info, cache_set_maxsize
+from ._calling import InstantiationError
+from ._cli import acli, cli, prefetch
 from ._fields import MISSING_PUBLIC as MISSING
 from ._instantiators import UnsupportedTypeAnnotationError
+from ._memory import memory_report
+from ._stats import stats
 
 __all__ = [
     "conf",
     "extras",
     "cli",
+    "acli",
+    "prefetch",
+    "cache_clear",
+    "cache_info",
+    "cache_set_maxsize",
+    "stats",
+    "memory_report",
     "MISSING",
+    "InstantiationError",
     "UnsupportedTypeAnnotationError",
 ]
 
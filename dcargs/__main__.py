@@ -0,0 +1,90 @@
+"""Command-line utilities for dcargs. Currently used for generating completion scripts
+when packaging, for example:
+
+    python -m dcargs completion my_package.train:main --shell zsh --prog train
+"""
+import argparse
+import importlib
+import os
+import sys
+from typing import Any, Optional, Sequence
+
+import dcargs
+
+
+def _import_target(target: str) -> Any:
+    """Import a callable specified as `module:attribute`. Nested attributes can be
+    separated by periods, eg `module:Class.method`."""
+    module_name, colon, attribute = target.partition(":")
+    if colon == "" or attribute == "":
+        raise ValueError(
+            f"Expected target in `module:attribute` format, but got {target}."
+        )
+
+    # Match the behavior of `python -m`, and allow importing from the current
+    # directory.
+    if os.curdir not in sys.path:
+        sys.path.insert(0, os.curdir)
+
+    out: Any = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        out = getattr(out, part)
+    return out
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dcargs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    completion_parser = subparsers.add_parser(
+        "completion",
+        help="Print a shell completion script for a dcargs CLI.",
+    )
+    completion_parser.add_argument(
+        "target", help="Callable passed to `dcargs.cli()`, as `module:attribute`."
+    )
+    completion_parser.add_argument(
+        "--shell", default="bash", choices=("bash", "zsh", "tcsh")
+    )
+    completion_parser.add_argument(
+        "--prog",
+        default=None,
+        help="Program name to complete for. Defaults to the name of the callable.",
+    )
+    completion_parser.add_argument(
+        "--dynamic",
+        action="store_true",
+        help=(
+            "Print a script that answers completion queries from an index file, without"
+            " importing the target. Only supported for bash and zsh."
+        ),
+    )
+
+    args = parser.parse_args(argv)
+    assert args.command == "completion"
+    if args.dynamic and args.shell not in ("bash", "zsh"):
+        completion_parser.error("--dynamic is only supported for bash and zsh.")
+
+    f = _import_target(args.target)
+    prog = args.prog if args.prog is not None else f.__name__
+
+    # `dcargs.cli()` prints the script and exits. Failures should still be reported via
+    # the exit code.
+    try:
+        dcargs.cli(
+            f,
+            prog=prog,
+            args=[
+                "--dcargs-print-dynamic-completion"
+                if args.dynamic
+                else "--dcargs-print-completion",
+                args.shell,
+            ],
+        )
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise
+
+
+if __name__ == "__main__":
+    main()
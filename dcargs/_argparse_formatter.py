@@ -1,96 +1,209 @@
 import argparse
 import contextlib
+import contextvars
 import functools
 import itertools
 import shutil
-from typing import Any, ContextManager, Generator
-
-import termcolor
+import textwrap
+import threading
+import types
+from typing import Any, Callable, ContextManager, Generator, List, Optional, TypeVar
 
 from . import _strings
 
-
-def monkeypatch_len(obj: Any) -> int:
-    if isinstance(obj, str):
-        return len(_strings.strip_ansi_sequences(obj))
-    else:
-        return len(obj)
+T = TypeVar("T")
 
 
 def dummy_termcolor_context() -> ContextManager[None]:
-    """Context for turning termcolor off."""
-
-    def dummy_colored(*args, **kwargs) -> str:
-        return args[0]
+    """Context for turning colors off. Only affects the current thread or task."""
 
     @contextlib.contextmanager
     def inner() -> Generator[None, None, None]:
-        orig_colored = termcolor.colored
-        termcolor.colored = dummy_colored
-        yield
-        termcolor.colored = orig_colored
+        token = _strings._colors_enabled.set(False)
+        try:
+            yield
+        finally:
+            _strings._colors_enabled.reset(token)
 
     return inner()
 
 
+# Number of active `ansi_context()`s, across all threads. colorama wraps the global
+# stdout and stderr streams, so we only set it up for the outermost context.
+_ansi_context_count = 0
+_ansi_context_lock = threading.Lock()
+_colorama_context: Optional[ContextManager[Any]] = None
+
+
 def ansi_context() -> ContextManager[None]:
-    """Context for working with ANSI codes + argparse:
-    - Applies a temporary monkey patch for making argparse ignore ANSI codes when
-      wrapping usage text.
-    - Enables support for Windows via colorama.
+    """Context for working with ANSI codes + argparse. Enables support for Windows via
+    colorama.
+
+    Note that our formatter measures text using `_strings.visible_len()`, so no
+    patching of argparse is needed for ANSI sequences to be wrapped correctly.
     """
 
     @contextlib.contextmanager
     def inner() -> Generator[None, None, None]:
-        if not hasattr(argparse, "len"):
-            # Sketchy, but seems to work.
-            argparse.len = monkeypatch_len  # type: ignore
-            try:
-                # Use Colorama to support coloring in Windows shells.
-                import colorama  # type: ignore
-
-                # Notes:
-                #
-                # (1) This context manager looks very nice and local, but under-the-hood
-                # does some global operations which look likely to cause unexpected
-                # behavior if another library relies on `colorama.init()` and
-                # `colorama.deinit()`.
-                #
-                # (2) SSHed into a non-Windows machine from a WinAPI terminal => this
-                # won't work.
-                #
-                # Fixing these issues doesn't seem worth it: it doesn't seem like there
-                # are low-effort solutions for either problem, and more modern terminals
-                # in Windows (PowerShell, MSYS2, ...) do support ANSI codes anyways.
-                with colorama.colorama_text():
-                    yield
-
-            except ImportError:
-                yield
-
-            del argparse.len  # type: ignore
-        else:
-            # No-op when the context manager is nested.
+        _enter_colorama()
+        try:
             yield
+        finally:
+            _exit_colorama()
 
     return inner()
 
 
+def _enter_colorama() -> None:
+    global _ansi_context_count, _colorama_context
+    with _ansi_context_lock:
+        _ansi_context_count += 1
+        if _ansi_context_count > 1:
+            # Already set up by another context.
+            return
+
+        try:
+            # Use Colorama to support coloring in Windows shells.
+            import colorama  # type: ignore
+
+            # Notes:
+            #
+            # (1) This context manager looks very nice and local, but under-the-hood
+            # does some global operations which look likely to cause unexpected
+            # behavior if another library relies on `colorama.init()` and
+            # `colorama.deinit()`.
+            #
+            # (2) SSHed into a non-Windows machine from a WinAPI terminal => this
+            # won't work.
+            #
+            # Fixing these issues doesn't seem worth it: it doesn't seem like there
+            # are low-effort solutions for either problem, and more modern terminals
+            # in Windows (PowerShell, MSYS2, ...) do support ANSI codes anyways.
+            context = colorama.colorama_text()
+            context.__enter__()
+            _colorama_context = context
+        except ImportError:
+            pass
+
+
+def _exit_colorama() -> None:
+    global _ansi_context_count, _colorama_context
+    with _ansi_context_lock:
+        _ansi_context_count -= 1
+        if _ansi_context_count == 0 and _colorama_context is not None:
+            _colorama_context.__exit__(None, None, None)
+            _colorama_context = None
+
+
 def make_formatter_class(field_count: int) -> Any:
-    return functools.partial(_ArgparseHelpFormatter, field_count=field_count)
+    terminal_size = _terminal_size_snapshot.get()
+    return functools.partial(
+        _ArgparseHelpFormatter,
+        field_count=field_count,
+        terminal_size=terminal_size
+        if terminal_size is not None
+        else _TerminalSizeSnapshot(),
+    )
+
+
+class _TerminalSizeSnapshot:
+    """Terminal size, queried at most once. argparse instantiates formatters for every
+    parser and subparser, but we only need the terminal size for formatting
+    helptext."""
+
+    def __init__(self) -> None:
+        self._columns: Optional[int] = None
+
+    @property
+    def columns(self) -> int:
+        if self._columns is None:
+            self._columns = shutil.get_terminal_size().columns
+        return self._columns
+
+
+_terminal_size_snapshot: contextvars.ContextVar[
+    Optional[_TerminalSizeSnapshot]
+] = contextvars.ContextVar("_terminal_size_snapshot", default=None)
+
+
+@contextlib.contextmanager
+def terminal_size_context() -> Generator[None, None, None]:
+    """Context for sharing a single terminal size snapshot between all formatters
+    created within it. Used for each `dcargs.cli()` call."""
+    token = _terminal_size_snapshot.set(_TerminalSizeSnapshot())
+    try:
+        yield
+    finally:
+        _terminal_size_snapshot.reset(token)
+
+
+def terminal_columns() -> int:
+    """Get the number of terminal columns used for formatting helptext."""
+    terminal_size = _terminal_size_snapshot.get()
+    if terminal_size is None:
+        return shutil.get_terminal_size().columns
+    return terminal_size.columns
+
+
+def _len(obj: Any) -> int:
+    return _strings.visible_len(obj) if isinstance(obj, str) else len(obj)
+
+
+def _with_visible_len(f: Callable[..., T]) -> Callable[..., T]:
+    """Copy a function from the standard library, but with `len()` replaced by
+    `_strings.visible_len()`. This lets us reuse upstream logic for measuring and
+    wrapping text that contains ANSI sequences, without patching any modules."""
+    f_globals = dict(f.__globals__)  # type: ignore
+    f_globals["len"] = _len
+    out = types.FunctionType(
+        f.__code__,  # type: ignore
+        f_globals,
+        f.__name__,
+        f.__defaults__,  # type: ignore
+        f.__closure__,  # type: ignore
+    )
+    out.__kwdefaults__ = f.__kwdefaults__  # type: ignore
+    return out
+
+
+_add_argument_with_visible_len = _with_visible_len(argparse.HelpFormatter.add_argument)
+_format_usage_with_visible_len = _with_visible_len(
+    argparse.HelpFormatter._format_usage  # type: ignore
+)
+_wrap_chunks_with_visible_len = _with_visible_len(
+    textwrap.TextWrapper._wrap_chunks  # type: ignore
+)
 
 
 class _ArgparseHelpFormatter(argparse.RawDescriptionHelpFormatter):
-    def __init__(self, prog, *, field_count: int):
+    def __init__(self, prog, *, field_count: int, terminal_size: _TerminalSizeSnapshot):
+        # argparse instantiates formatters in `add_argument()`, but only to validate
+        # metavars with `_format_args()`. We defer the rest of initialization until
+        # it's needed for formatting helptext.
+        self._prog = prog
+        self._field_count = field_count
+        self._terminal_size = terminal_size
+        self._initialized = False
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that haven't been set yet.
+        if name.startswith("__") or self.__dict__.get("_initialized", True):
+            raise AttributeError(name)
+        self._initialize()
+        return getattr(self, name)
+
+    def _initialize(self) -> None:
+        self._initialized = True
+
         indent_increment = 2
-        width = shutil.get_terminal_size().columns - 2
+        width = self._terminal_size.columns - 2
         max_help_position = min(36, width // 3)  # Usual is 24.
 
         # Try to make helptext more concise when we have a lot of fields!
-        if field_count > 16 and width >= 100:  # pragma: no cover
+        if self._field_count > 16 and width >= 100:  # pragma: no cover
             max_help_position = min(96, width // 2)  # Usual is 24.
 
-        super().__init__(prog, indent_increment, max_help_position, width)
+        super().__init__(self._prog, indent_increment, max_help_position, width)
 
     def _format_args(self, action, default_metavar):
         """Override _format_args() to ignore nargs and always expect single string
@@ -98,17 +211,26 @@ class _ArgparseHelpFormatter(argparse.RawDescriptionHelpFormatter):
         get_metavar = self._metavar_formatter(action, default_metavar)
         return get_metavar(1)[0]
 
-    def add_argument(self, action):  # pragma: no cover
+    def add_argument(self, action):
         # Patch to avoid super long arguments from shifting the helptext of all of the
         # fields.
         prev_max_length = self._action_max_length
-        super().add_argument(action)
+        _add_argument_with_visible_len(self, action)
         if (
             self._action_max_length >= 40
             and self._action_max_length > self._max_help_position + 2
         ):
             self._action_max_length = prev_max_length
 
+    def _format_usage(self, usage, actions, groups, prefix):
+        # `--help-group` is listed with other arguments, but left out of usage lines.
+        actions = [
+            action
+            for action in actions
+            if action.option_strings != [_strings.help_group_flag]
+        ]
+        return _format_usage_with_visible_len(self, usage, actions, groups, prefix)
+
     def _format_action(self, action):
         # determine the required width and the entry label
         help_position = min(self._action_max_length + 2, self._max_help_position)
@@ -122,7 +244,7 @@ class _ArgparseHelpFormatter(argparse.RawDescriptionHelpFormatter):
             action_header = "%*s%s\n" % tup
 
         # short action name; start on the same line and pad two spaces
-        elif monkeypatch_len(action_header) <= action_width:
+        elif _strings.visible_len(action_header) <= action_width:
             # Original:
             # tup = self._current_indent, "", action_width, action_header
             # action_header = "%*s%-*s  " % tup
@@ -130,7 +252,7 @@ class _ArgparseHelpFormatter(argparse.RawDescriptionHelpFormatter):
             action_header = (
                 " " * self._current_indent
                 + action_header
-                + " " * (action_width - monkeypatch_len(action_header) + 2)
+                + " " * (action_width - _strings.visible_len(action_header) + 2)
             )
             # </new>
             indent_first = 0
@@ -171,17 +293,63 @@ class _ArgparseHelpFormatter(argparse.RawDescriptionHelpFormatter):
         # return a single string
         return self._join_parts(parts)
 
+    def _expand_help(self, action):  # pragma: no cover
+        # Same as `HelpFormatter._expand_help()`, but shortens large choice sets
+        # instead of joining every choice.
+        params = dict(vars(action), prog=self._prog)
+        for name in list(params):
+            if params[name] is argparse.SUPPRESS:
+                del params[name]
+        for name in list(params):
+            if hasattr(params[name], "__name__"):
+                params[name] = params[name].__name__
+        if params.get("choices") is not None:
+            # <new>
+            choices = list(map(str, _strings.truncate_choices(params["choices"])))
+            # </new>
+            params["choices"] = ", ".join(choices)
+        return self._get_help_string(action) % params
+
+    def _get_help_string(self, action):
+        # Helptext may be generated lazily. See `_arguments.LazyHelptext`.
+        return str(action.help)
+
     def _split_lines(self, text, width):
         text = self._whitespace_matcher.sub(" ", text).strip()
-        # The textwrap module is used only for formatting help.
-        # Delay its import for speeding up the common usage of argparse.
-        import textwrap as textwrap
-
-        # Sketchy, but seems to work.
-        textwrap.len = monkeypatch_len  # type: ignore
-        out = textwrap.wrap(text, width)
-        del textwrap.len  # type: ignore
-        return out
+        return _AnsiTextWrapper(width).wrap(text)
 
     def _fill_text(self, text, width, indent):
         return "".join(indent + line for line in text.splitlines(keepends=True))
+
+
+class _AnsiTextWrapper(textwrap.TextWrapper):
+    """Text wrapper that ignores ANSI sequences when measuring text."""
+
+    def _wrap_chunks(self, chunks: List[str]) -> List[str]:
+        return _wrap_chunks_with_visible_len(self, chunks)
+
+    def _handle_long_word(
+        self,
+        reversed_chunks: List[str],
+        cur_line: List[str],
+        cur_len: int,
+        width: int,
+    ) -> None:
+        # Same as `TextWrapper._handle_long_word()`, but with lengths measured with
+        # `visible_len()`.
+        if width < 1:
+            space_left = 1
+        else:
+            space_left = width - cur_len
+
+        if self.break_long_words:
+            chunk = reversed_chunks[-1]
+            end = _strings.visible_index(chunk, space_left)
+            if self.break_on_hyphens and _strings.visible_len(chunk) > space_left:
+                hyphen = chunk.rfind("-", 0, end)
+                if hyphen > 0 and any(c != "-" for c in chunk[:hyphen]):
+                    end = hyphen + 1
+            cur_line.append(chunk[:end])
+            reversed_chunks[-1] = chunk[end:]
+        elif not cur_line:
+            cur_line.append(reversed_chunks.pop())
@@ -8,8 +8,10 @@ import enum
 import functools
 import itertools
 import shlex
+import types
 from typing import (
     Any,
+    Callable,
     Dict,
     Mapping,
     Optional,
@@ -21,33 +23,29 @@ from typing import (
     Union,
 )
 
-import termcolor
-
-from . import _fields, _instantiators, _resolver, _strings
+from . import _fields, _instantiators, _resolver, _slots, _stats, _strings
 from .conf import _markers
 
-try:
-    # Python >=3.8.
-    from functools import cached_property
-except ImportError:
-    # Python 3.7.
-    from backports.cached_property import cached_property  # type: ignore
-
 
 class _PatchedList(list):
     """Custom tuple type, for avoiding "default not in choices" errors when the default
     is set to MISSING_NONPROP.
 
     This solves a choices error raised by argparse in a very specific edge case:
-    literals in containers as positional arguments."""
+    literals in containers as positional arguments.
+
+    Membership checks are backed by a set, so argparse can validate each input in
+    constant time."""
 
     def __init__(self, li):
         super(_PatchedList, self).__init__(li)
+        self._choices_set = frozenset(self)
 
     def __contains__(self, x: Any) -> bool:
-        return list.__contains__(self, x) or x is _fields.MISSING_NONPROP
+        return x in self._choices_set or x is _fields.MISSING_NONPROP
 
 
+@_slots.add_slots("_lowered")
 @dataclasses.dataclass(frozen=True)
 class ArgumentDefinition:
     """Structure containing everything needed to define an argument."""
@@ -60,12 +58,16 @@ class ArgumentDefinition:
         self, parser: Union[argparse.ArgumentParser, argparse._ArgumentGroup]
     ) -> None:
         """Add a defined argument to a parser."""
-
-        # Get keyword arguments, with None values removed.
-        kwargs = dataclasses.asdict(self.lowered)
-        kwargs.pop("instantiator")
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-        name_or_flag = kwargs.pop("name_or_flag")
+        lowered = self.lowered
+
+        # Get keyword arguments, with None values removed. Values are passed through
+        # as-is; copying them would be expensive for large defaults and choices.
+        kwargs: Dict[str, Any] = {}
+        for name in _ARGPARSE_KWARG_NAMES:
+            value = getattr(lowered, name)
+            if value is not None:
+                kwargs[name] = value
+        name_or_flag = lowered.name_or_flag
         if len(name_or_flag) == 0:
             name_or_flag = _strings.dummy_field_name
 
@@ -79,27 +81,34 @@ class ArgumentDefinition:
             kwargs["choices"] = _PatchedList(kwargs["choices"])
 
         # Note that the name must be passed in as a position argument.
+        _stats.increment("argparse_actions")
         parser.add_argument(name_or_flag, **kwargs)
 
-    @cached_property
+    @property
     def lowered(self) -> LoweredArgumentDefinition:
-        """Lowered argument definition, generated by applying a sequence of rules."""
-        rules = (
-            _rule_handle_defaults,
-            _rule_handle_boolean_flags,
-            _rule_recursive_instantiator_from_type,
-            _rule_convert_defaults_to_strings,
-            _rule_generate_helptext,
-            _rule_set_name_or_flag,
-            _rule_positional_special_handling,
-        )
-        return functools.reduce(
-            lambda lowered, rule: rule(self, lowered),
-            rules,
-            LoweredArgumentDefinition(),
-        )
+        """Lowered argument definition, generated by applying a sequence of rules.
+        Computed on first access, and then cached."""
+        try:
+            return self._lowered  # type: ignore
+        except AttributeError:
+            pass
+
+        # Rules are applied in order to a single mutable builder, which is frozen once
+        # at the end.
+        builder = types.SimpleNamespace(**_LOWERED_DEFAULTS)
+        _rule_handle_defaults(self, builder)
+        _rule_handle_boolean_flags(self, builder)
+        _rule_recursive_instantiator_from_type(self, builder)
+        _rule_generate_helptext(self, builder)
+        _rule_set_name_or_flag(self, builder)
+        _rule_positional_special_handling(self, builder)
+        lowered = LoweredArgumentDefinition(**vars(builder))
+
+        object.__setattr__(self, "_lowered", lowered)
+        return lowered
 
 
+@_slots.add_slots()
 @dataclasses.dataclass(frozen=True)
 class LoweredArgumentDefinition:
     """Contains fields meant to be passed directly into argparse."""
@@ -130,50 +139,67 @@ class LoweredArgumentDefinition:
     # Note: unlike in vanilla argparse, our metavar is always a string. We handle
     # sequences, multiple arguments, etc, manually.
     metavar: Optional[str] = None
-    help: Optional[str] = None
+    help: Optional[Union[str, LazyHelptext]] = None
+
+
+# Fields of `LoweredArgumentDefinition` that are passed to `add_argument()` as keyword
+# arguments. `name_or_flag` is positional, and `default` is overridden.
+_ARGPARSE_KWARG_NAMES = (
+    "dest",
+    "required",
+    "action",
+    "nargs",
+    "choices",
+    "metavar",
+    "help",
+)
+
+
+# Lowering rules update a mutable namespace in place, which is initialized from the
+# fields of `LoweredArgumentDefinition` and converted to one at the end.
+_LOWERED_DEFAULTS = {
+    field.name: field.default for field in dataclasses.fields(LoweredArgumentDefinition)
+}
 
 
 def _rule_handle_defaults(
     arg: ArgumentDefinition,
-    lowered: LoweredArgumentDefinition,
-) -> LoweredArgumentDefinition:
+    lowered: types.SimpleNamespace,
+) -> None:
     """Set `required=True` if a default value is set."""
 
     # Mark lowered as required if a default is set.
-    if arg.field.default in _fields.MISSING_SINGLETONS:
-        return dataclasses.replace(lowered, default=None, required=True)
-
-    return dataclasses.replace(lowered, default=arg.field.default)
+    if _fields.is_missing(arg.field.default):
+        lowered.default = None
+        lowered.required = True
+    else:
+        lowered.default = arg.field.default
 
 
 def _rule_handle_boolean_flags(
     arg: ArgumentDefinition,
-    lowered: LoweredArgumentDefinition,
-) -> LoweredArgumentDefinition:
+    lowered: types.SimpleNamespace,
+) -> None:
     if _resolver.apply_type_from_typevar(arg.field.typ, arg.type_from_typevar) is not bool:  # type: ignore
-        return lowered
+        return
 
     if (
-        arg.field.default in _fields.MISSING_SINGLETONS
+        _fields.is_missing(arg.field.default)
         or arg.field.is_positional()
         or _markers.FLAG_CONVERSION_OFF in arg.field.markers
     ):
         # Treat bools as a normal parameter.
-        return lowered
+        return
     elif arg.field.default is False:
         # Default `False` => --flag passed in flips to `True`.
-        return dataclasses.replace(
-            lowered,
-            action="store_true",
-            instantiator=lambda x: x,  # argparse will directly give us a bool!
-        )
+        lowered.action = "store_true"
+        lowered.instantiator = lambda x: x  # argparse will directly give us a bool!
+        return
     elif arg.field.default is True:
         # Default `True` => --no-flag passed in flips to `False`.
-        return dataclasses.replace(
-            lowered,
-            action="store_false",
-            instantiator=lambda x: x,  # argparse will directly give us a bool!
-        )
+        lowered.action = "store_false"
+        lowered.instantiator = lambda x: x  # argparse will directly give us a bool!
+        return
 
     assert False, (
         "Expected a boolean as a default for {arg.field.name}, but got"
@@ -183,8 +209,8 @@ def _rule_handle_boolean_flags(
 
 def _rule_recursive_instantiator_from_type(
     arg: ArgumentDefinition,
-    lowered: LoweredArgumentDefinition,
-) -> LoweredArgumentDefinition:
+    lowered: types.SimpleNamespace,
+) -> None:
     """The bulkiest bit: recursively analyze the type annotation and use it to determine
     how to instantiate it given some string from the commandline.
 
@@ -194,22 +220,20 @@ def _rule_recursive_instantiator_from_type(
     bit more flexible, and lets us handle more complex types like enums and multi-type
     tuples."""
     if _markers.FIXED in arg.field.markers:
-        return dataclasses.replace(
-            lowered,
-            instantiator=None,
-            metavar=termcolor.colored("{fixed}", color="red"),
-            required=False,
-            default=_fields.MISSING_PROP,
-        )
+        lowered.instantiator = None
+        lowered.metavar = _strings.colored("{fixed}", color="red")
+        lowered.required = False
+        lowered.default = _fields.MISSING_PROP
+        return
     if lowered.instantiator is not None:
-        return lowered
+        return
     try:
         instantiator, metadata = _instantiators.instantiator_from_type(
             arg.field.typ,  # type: ignore
             arg.type_from_typevar,
         )
     except _instantiators.UnsupportedTypeAnnotationError as e:
-        if arg.field.default in _fields.MISSING_SINGLETONS:
+        if _fields.is_missing(arg.field.default):
             raise _instantiators.UnsupportedTypeAnnotationError(
                 "Unsupported type annotation for the field"
                 f" {_strings.make_field_name([arg.prefix, arg.field.name])}. To"
@@ -218,63 +242,79 @@ def _rule_recursive_instantiator_from_type(
         else:
             # For fields with a default, we'll get by even if there's no instantiator
             # available.
-            return dataclasses.replace(
-                lowered,
-                metavar=termcolor.colored("{fixed}", color="red"),
-                required=False,
-                default=_fields.MISSING_PROP,
-            )
-
-    return dataclasses.replace(
-        lowered,
-        instantiator=instantiator,
-        choices=metadata.choices,
-        nargs=metadata.nargs,
-        metavar=metadata.metavar,
-    )
-
+            lowered.metavar = _strings.colored("{fixed}", color="red")
+            lowered.required = False
+            lowered.default = _fields.MISSING_PROP
+            return
 
-def _rule_convert_defaults_to_strings(
-    arg: ArgumentDefinition,
-    lowered: LoweredArgumentDefinition,
-) -> LoweredArgumentDefinition:
-    """Sets all default values to strings, as required as input to our instantiator
-    functions. Special-cased for enums."""
+    lowered.instantiator = instantiator
+    lowered.choices = metadata.choices
+    lowered.nargs = metadata.nargs
+    lowered.metavar = metadata.metavar
 
-    def as_str(x: Any) -> Tuple[str, ...]:
-        if isinstance(x, str):
-            return (x,)
-        elif isinstance(x, enum.Enum):
-            return (x.name,)
-        elif isinstance(x, Mapping):
-            return tuple(itertools.chain(*map(as_str, itertools.chain(*x.items()))))
-        elif isinstance(x, Sequence):
-            return tuple(itertools.chain(*map(as_str, x)))
-        else:
-            return (str(x),)
 
-    if (
-        lowered.default is None
-        or lowered.default in _fields.MISSING_SINGLETONS
-        or lowered.action is not None
-    ):
-        return lowered
+def _default_as_strings(x: Any) -> Tuple[str, ...]:
+    """Convert a default value to strings, in the format expected by our instantiator
+    functions. Special-cased for enums."""
+    if isinstance(x, str):
+        return (x,)
+    elif isinstance(x, enum.Enum):
+        return (x.name,)
+    elif isinstance(x, Mapping):
+        return tuple(
+            itertools.chain(*map(_default_as_strings, itertools.chain(*x.items())))
+        )
+    elif isinstance(x, Sequence):
+        return tuple(itertools.chain(*map(_default_as_strings, x)))
     else:
-        return dataclasses.replace(lowered, default=as_str(lowered.default))
+        return (str(x),)
 
 
 def _rule_generate_helptext(
     arg: ArgumentDefinition,
-    lowered: LoweredArgumentDefinition,
-) -> LoweredArgumentDefinition:
-    """Generate helptext from docstring, argument name, default values."""
+    lowered: types.SimpleNamespace,
+) -> None:
+    """Generate helptext from docstring, argument name, default values.
+
+    Helptext is generated lazily: it's usually not printed, and converting defaults
+    to strings is expensive for large sequences."""
 
     # If the suppress marker is attached, hide the argument.
     if _markers.SUPPRESS in arg.field.markers:
-        return dataclasses.replace(lowered, help=argparse.SUPPRESS)
+        lowered.help = argparse.SUPPRESS
+        return
+
+    # Later rules update some of these values, so we read them now.
+    lowered.help = LazyHelptext(
+        functools.partial(
+            _format_helptext,
+            arg,
+            default=lowered.default,
+            fixed=lowered.instantiator is None,
+            required=lowered.required,
+            action=lowered.action,
+            nargs=lowered.nargs,
+        )
+    )
+
 
+def _format_helptext(
+    arg: ArgumentDefinition,
+    default: Any,
+    fixed: bool,
+    required: bool,
+    action: Optional[str],
+    nargs: Optional[Union[int, str]],
+) -> str:
     help_parts = []
 
+    # Defaults from `default_factory` are only evaluated when helptext is rendered.
+    field_default = arg.field.default
+    if isinstance(field_default, _fields.LazyDefault):
+        field_default = field_default.evaluate()
+    if isinstance(default, _fields.LazyDefault):
+        default = field_default
+
     docstring_help = arg.field.helptext
 
     if docstring_help is not None and docstring_help != "":
@@ -283,28 +323,29 @@ def _rule_generate_helptext(
         docstring_help = docstring_help.replace("%", "%%")
         help_parts.append(docstring_help)
 
-    default = lowered.default
-    if lowered.is_fixed():
+    if fixed:
         # For fixed args, we'll be missing the lowered default. Use field default
         # instead.
-        assert default in _fields.MISSING_SINGLETONS
-        default = arg.field.default
+        assert _fields.is_missing(default)
+        default = field_default
+    elif default is not None and not _fields.is_missing(default) and action is None:
+        default = _default_as_strings(default)
 
-    if not lowered.required:
+    if not required:
         # Include default value in helptext. We intentionally don't use the % template
         # because the types of all arguments are set to strings, which will cause the
         # default to be casted to a string and introduce extra quotation marks.
-        if lowered.instantiator is None:
+        if fixed:
             # Intentionally not quoted via shlex, since this can't actually be passed
             # in via the commandline.
-            default_text = f"(fixed to: {str(arg.field.default)})"
-        elif lowered.action == "store_true":
+            default_text = f"(fixed to: {str(field_default)})"
+        elif action == "store_true":
             default_text = f"(sets: {arg.field.name}=True)"
-        elif lowered.action == "store_false":
+        elif action == "store_false":
             default_text = f"(sets: {arg.field.name}=False)"
         elif arg.field.default is _fields.EXCLUDE_FROM_CALL:
             default_text = "(unset by default)"
-        elif lowered.nargs is not None and hasattr(default, "__iter__"):
+        elif nargs is not None and hasattr(default, "__iter__"):
             # For tuple types, we might have default as (0, 1, 2, 3).
             # For list types, we might have default as [0, 1, 2, 3].
             # For set types, we might have default as {0, 1, 2, 3}.
@@ -316,17 +357,52 @@ def _rule_generate_helptext(
             default_text = f"(default: {' '.join(default_parts)})"
         else:
             default_text = f"(default: {shlex.quote(str(default))})"
-        help_parts.append(termcolor.colored(default_text, attrs=["dark"]))
+        help_parts.append(_strings.colored(default_text, attrs=["dark"]))
     else:
-        help_parts.append(termcolor.colored("(required)", color="red", attrs=["bold"]))
+        help_parts.append(_strings.colored("(required)", color="red", attrs=["bold"]))
+
+    return " ".join(help_parts)
+
 
-    return dataclasses.replace(lowered, help=" ".join(help_parts))
+class LazyHelptext:
+    """Helptext that's generated the first time it's converted to a string. Compares,
+    hashes, and prints like the generated string.
+
+    Argparse expects helptext to be a string; our formatter and completion script
+    generators call `str()` on it first."""
+
+    __slots__ = ("_make", "_text")
+
+    def __init__(self, make: Callable[[], str]) -> None:
+        self._make: Optional[Callable[[], str]] = make
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            assert self._make is not None
+            self._text = self._make()
+            self._make = None
+        return self._text
+
+    def __bool__(self) -> bool:
+        return len(str(self)) > 0
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyHelptext):
+            other = str(other)
+        return str(self) == other
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return repr(str(self))
 
 
 def _rule_set_name_or_flag(
     arg: ArgumentDefinition,
-    lowered: LoweredArgumentDefinition,
-) -> LoweredArgumentDefinition:
+    lowered: types.SimpleNamespace,
+) -> None:
     if arg.field.is_positional():
         name_or_flag = _strings.make_field_name([arg.prefix, arg.field.name])
     elif lowered.action == "store_false":
@@ -336,19 +412,16 @@ def _rule_set_name_or_flag(
     else:
         name_or_flag = "--" + _strings.make_field_name([arg.prefix, arg.field.name])
 
-    return dataclasses.replace(
-        lowered,
-        name_or_flag=name_or_flag,
-        dest=_strings.make_field_name([arg.prefix, arg.field.name]),
-    )
+    lowered.name_or_flag = name_or_flag
+    lowered.dest = _strings.make_field_name([arg.prefix, arg.field.name])
 
 
 def _rule_positional_special_handling(
     arg: ArgumentDefinition,
-    lowered: LoweredArgumentDefinition,
-) -> LoweredArgumentDefinition:
+    lowered: types.SimpleNamespace,
+) -> None:
     if not arg.field.is_positional():
-        return lowered
+        return
 
     metavar = lowered.metavar
     if lowered.required:
@@ -364,10 +437,7 @@ def _rule_positional_special_handling(
             # If lowered.nargs is either + or an int.
             nargs = "*"
 
-    return dataclasses.replace(
-        lowered,
-        dest=None,
-        required=None,  # Can't be passed in for positionals.
-        metavar=metavar,
-        nargs=nargs,
-    )
+    lowered.dest = None
+    lowered.required = None  # Can't be passed in for positionals.
+    lowered.metavar = metavar
+    lowered.nargs = nargs
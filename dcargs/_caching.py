@@ -0,0 +1,224 @@
+"""Central registry for in-memory caches. All caches are bounded, and entries keyed by
+weak-referenceable objects (classes, functions, etc) are dropped when those objects
+are garbage collected. This matters for long-running processes that create types
+dynamically, for example via `dataclasses.make_dataclass()`."""
+from __future__ import annotations
+
+import collections
+import functools
+import threading
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+CallableType = TypeVar("CallableType", bound=Callable)
+
+# Default size limit for each cache.
+DEFAULT_MAXSIZE = 512
+
+# Prefix for storage keys that reference their first element by ID.
+_ANCHORED = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a single cache, analogous to `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class _LruCache:
+    """Thread-safe LRU cache. Keys are tuples; if the first element can be weakly
+    referenced, it's stored by identity and doesn't keep the object alive.
+
+    Note that values may still hold strong references to their keys; these entries
+    are released when they're evicted."""
+
+    def __init__(self, name: str, maxsize: Optional[int]) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[
+            Hashable, Any
+        ] = collections.OrderedDict()
+        # Weak references to anchor objects, and the storage keys that depend on them.
+        self._anchors: Dict[int, Tuple[weakref.ref, Set[Hashable]]] = {}
+        # IDs of anchor objects that have been garbage collected. Weakref callbacks
+        # can run at arbitrary points, including while the lock is held; when the lock
+        # isn't available, eviction is deferred to the next cache access.
+        self._dead_anchors: List[int] = []
+
+    def _storage_key(self, key: Tuple[Any, ...]) -> Tuple[Hashable, Any]:
+        """Get the key used for storage, and the anchor object if the entry should be
+        tied to its lifetime."""
+        anchor = key[0]
+        try:
+            weakref.ref(anchor)
+        except TypeError:
+            return key, None
+        return (_ANCHORED, id(anchor)) + key[1:], anchor
+
+    def _on_collected(self, anchor_id: int, ref: weakref.ref) -> None:
+        self._dead_anchors.append(anchor_id)
+        # Values can reference other objects, like child types, which shouldn't be
+        # kept alive until this cache is used again.
+        if self._lock.acquire(blocking=False):
+            try:
+                self._purge_dead_anchors()
+            finally:
+                self._lock.release()
+
+    def _purge_dead_anchors(self) -> None:
+        while self._dead_anchors:
+            anchor_id = self._dead_anchors.pop()
+            ref_and_keys = self._anchors.pop(anchor_id, None)
+            if ref_and_keys is None:
+                continue
+            for storage_key in ref_and_keys[1]:
+                self._entries.pop(storage_key, None)
+
+    def _evict(self, storage_key: Hashable) -> None:
+        del self._entries[storage_key]
+        if isinstance(storage_key, tuple) and storage_key[0] is _ANCHORED:
+            anchor_id = storage_key[1]
+            storage_keys = self._anchors[anchor_id][1]
+            storage_keys.discard(storage_key)
+            if len(storage_keys) == 0:
+                del self._anchors[anchor_id]
+
+    def get_or_compute(
+        self, key: Optional[Tuple[Any, ...]], compute: Callable[[], Any]
+    ) -> Any:
+        """Get a value from the cache, or compute and store it. If `key` is `None`,
+        the value is computed without being cached."""
+        try:
+            if key is None:
+                raise TypeError()
+            storage_key, anchor = self._storage_key(key)
+            hash(storage_key)
+        except TypeError:
+            # Unhashable keys can't be cached.
+            with self._lock:
+                self.misses += 1
+            return compute()
+
+        with self._lock:
+            self._purge_dead_anchors()
+            if storage_key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(storage_key)
+                return self._entries[storage_key]
+            self.misses += 1
+
+        # Compute outside of the lock; this is often recursive.
+        value = compute()
+
+        with self._lock:
+            self._purge_dead_anchors()
+            if self.maxsize is not None and self.maxsize <= 0:
+                return value
+            self._entries[storage_key] = value
+            if anchor is not None:
+                anchor_id = id(anchor)
+                if anchor_id not in self._anchors:
+                    self._anchors[anchor_id] = (
+                        weakref.ref(
+                            anchor, functools.partial(self._on_collected, anchor_id)
+                        ),
+                        set(),
+                    )
+                self._anchors[anchor_id][1].add(storage_key)
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._evict(next(iter(self._entries)))
+        return value
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            self._purge_dead_anchors()
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._anchors.clear()
+            self._dead_anchors.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def set_maxsize(self, maxsize: Optional[int]) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while maxsize is not None and len(self._entries) > max(maxsize, 0):
+                self._evict(next(iter(self._entries)))
+
+
+_cache_from_name: Dict[str, _LruCache] = {}
+
+
+def cached(
+    name: str,
+    key: Optional[Callable[..., Tuple[Any, ...]]] = None,
+    maxsize: Optional[int] = DEFAULT_MAXSIZE,
+) -> Callable[[CallableType], CallableType]:
+    """Decorator for caching a function in the registry. By default, the positional
+    arguments are used as the cache key; `key` can be used to compute a different
+    key from the same arguments. Calls with unhashable keys are not cached."""
+    assert name not in _cache_from_name, f"Duplicate cache name: {name}"
+    cache = _LruCache(name, maxsize)
+    _cache_from_name[name] = cache
+
+    def decorator(f: CallableType) -> CallableType:
+        @functools.wraps(f)
+        def wrapped(*args: Any) -> Any:
+            cache_key: Optional[Tuple[Any, ...]] = args
+            if key is not None:
+                try:
+                    cache_key = key(*args)
+                except TypeError:
+                    cache_key = None
+            return cache.get_or_compute(cache_key, lambda: f(*args))
+
+        return wrapped  # type: ignore
+
+    return decorator
+
+
+def cache_info() -> Dict[str, CacheInfo]:
+    """Get statistics for all of the in-memory caches used by dcargs, by name. Useful
+    for checking memory usage in long-running processes."""
+    return {name: cache.info() for name, cache in _cache_from_name.items()}
+
+
+def cache_clear() -> None:
+    """Clear all of the in-memory caches used by dcargs, and reset their counters."""
+    for cache in _cache_from_name.values():
+        cache.clear()
+
+
+def cache_set_maxsize(maxsize: Optional[int], name: Optional[str] = None) -> None:
+    """Set the maximum number of entries for the in-memory caches used by dcargs.
+
+    Args:
+        maxsize: New size limit. `None` removes the limit, and `0` disables caching.
+        name: Name of the cache to update, as returned by `cache_info()`. If `None`,
+            all caches are updated.
+    """
+    if name is not None:
+        _cache_from_name[name].set_maxsize(maxsize)
+        return
+    for cache in _cache_from_name.values():
+        cache.set_maxsize(maxsize)
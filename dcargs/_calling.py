@@ -3,11 +3,17 @@ namespaces."""
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import dataclasses
+import inspect
+import itertools
 from typing import Any, Callable, Dict, List, Sequence, Set, Tuple, TypeVar, Union
 
 from typing_extensions import get_args
 
-from . import _arguments, _fields, _parsers, _resolver, _strings
+from . import _arguments, _fields, _lazy, _parsers, _resolver, _strings
+from .conf import _markers
 
 
 class InstantiationError(Exception):
@@ -18,16 +24,192 @@ class InstantiationError(Exception):
 T = TypeVar("T")
 
 
-def call_from_args(
+@dataclasses.dataclass(frozen=True)
+class DeferredCall:
+    """A call to `f`, with arguments that have already been parsed and validated.
+    Arguments can themselves be deferred calls, which are evaluated first."""
+
+    f: Callable
+    args: List[Any]
+    kwargs: Dict[str, Any]
+    lazy: bool
+    """If set, evaluating this call returns a proxy that only calls `f` when used."""
+
+    def evaluate(self) -> Any:
+        if self.lazy:
+            return _lazy.LazyProxy(self.evaluate_now)
+        return self.evaluate_now()
+
+    def evaluate_now(self) -> Any:
+        return self.call_with(
+            [_evaluate(arg) for arg in self.args],
+            {k: _evaluate(v) for k, v in self.kwargs.items()},
+        )
+
+    async def evaluate_async(self) -> Any:
+        """Evaluate from a coroutine. Outputs of coroutine functions are awaited, and
+        nested calls are evaluated concurrently."""
+        if self.lazy:
+            # Lazy calls are still evaluated synchronously, on first use.
+            return _lazy.LazyProxy(self.evaluate_now)
+
+        values = [
+            _evaluate_default(value)
+            for value in itertools.chain(self.args, self.kwargs.values())
+        ]
+        deferred_indices = [
+            i for i, value in enumerate(values) if isinstance(value, DeferredCall)
+        ]
+        if len(deferred_indices) > 0:
+            results = await asyncio.gather(
+                *(values[i].evaluate_async() for i in deferred_indices)
+            )
+            for i, result in zip(deferred_indices, results):
+                values[i] = result
+
+        out = self.call_with(
+            values[: len(self.args)],
+            dict(zip(self.kwargs.keys(), values[len(self.args) :])),
+        )
+        if inspect.isawaitable(out):
+            out = await out
+        return out
+
+    def evaluate_in_thread_pool(self, max_workers: int) -> Any:
+        """Evaluate using a thread pool. Each nested call is submitted as soon as the
+        calls it depends on have finished, so slow calls only hold up their own
+        parents. The outermost call runs on the calling thread, after all of its
+        dependencies.
+
+        Exceptions from nested calls are collected into a single
+        `InstantiationError`; exceptions from the outermost call are raised as-is."""
+        if self.lazy:
+            return self.evaluate()
+
+        # Nested calls in depth-first order, with the parent of each call and the number
+        # of dependencies that haven't been evaluated yet. Keyed by call IDs.
+        nested_calls: List[DeferredCall] = []
+        parent_from_id: Dict[int, DeferredCall] = {}
+        pending_from_id: Dict[int, int] = {}
+
+        def visit(call: DeferredCall) -> None:
+            pending_from_id[id(call)] = 0
+            if call.lazy:
+                return
+            for value in itertools.chain(call.args, call.kwargs.values()):
+                if isinstance(value, DeferredCall):
+                    visit(value)
+                    nested_calls.append(value)
+                    parent_from_id[id(value)] = call
+                    pending_from_id[id(call)] += 1
+
+        visit(self)
+
+        # Outputs, keyed by call IDs.
+        out_from_id: Dict[int, Any] = {}
+
+        def get_output(value: Any) -> Any:
+            if isinstance(value, DeferredCall):
+                return out_from_id[id(value)]
+            return _evaluate_default(value)
+
+        def run(call: DeferredCall) -> Any:
+            if call.lazy:
+                return call.evaluate()
+            return call.call_with(
+                [get_output(arg) for arg in call.args],
+                {k: get_output(v) for k, v in call.kwargs.items()},
+            )
+
+        errors: List[Tuple[DeferredCall, Exception]] = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            call_from_future = {
+                executor.submit(run, call): call
+                for call in nested_calls
+                if pending_from_id[id(call)] == 0
+            }
+            while len(call_from_future) > 0:
+                done, _ = concurrent.futures.wait(
+                    call_from_future, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    call = call_from_future.pop(future)
+                    try:
+                        out_from_id[id(call)] = future.result()
+                    except Exception as e:
+                        # Calls that depend on this one are skipped.
+                        errors.append((call, e))
+                        continue
+
+                    parent = parent_from_id[id(call)]
+                    pending_from_id[id(parent)] -= 1
+                    if pending_from_id[id(parent)] == 0 and parent is not self:
+                        call_from_future[executor.submit(run, parent)] = parent
+
+        if len(errors) > 0:
+            # Report errors in a deterministic order, independent of timing.
+            order_from_id = {id(call): i for i, call in enumerate(nested_calls)}
+            errors.sort(key=lambda error: order_from_id[id(error[0])])
+            raise InstantiationError(
+                f"Failed to instantiate {len(errors)} object(s):\n"
+                + "\n".join(
+                    f"  {getattr(call.f, '__name__', call.f)}:"
+                    f" {type(e).__name__}: {e}"
+                    for call, e in errors
+                )
+            ) from errors[0][1]
+
+        return run(self)
+
+    def call_with(self, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        """Call `f`, given evaluated arguments."""
+        f = self.f
+        if f in (tuple, list, set):
+            if len(args) == 0:
+                # When tuples are used as nested structures (eg Tuple[SomeDataclass]),
+                # we use keyword arguments.
+                return f(kwargs.values())
+            else:
+                # When tuples are directly parsed (eg Tuple[int, int]), we end up with
+                # a single set of positional arguments.
+                assert len(args) == 1
+                return f(args[0])
+        elif f is dict:
+            for arg in args:
+                assert isinstance(arg, dict)
+                kwargs.update(arg)
+            return kwargs
+        else:
+            return f(*args, **kwargs)
+
+
+def _evaluate(value: Any) -> Any:
+    if isinstance(value, DeferredCall):
+        return value.evaluate()
+    return _evaluate_default(value)
+
+
+def _evaluate_default(value: Any) -> Any:
+    """Call `default_factory` for fields that weren't overridden. Factories are called
+    when the call that consumes them is evaluated, so they're deferred for lazy calls
+    as well."""
+    return value.evaluate() if isinstance(value, _fields.LazyDefault) else value
+
+
+def deferred_call_from_args(
     f: Callable[..., T],
     parser_definition: _parsers.ParserSpecification,
     default_instance: Union[T, _fields.NonpropagatingMissingType],
     value_from_prefixed_field_name: Dict[str, Any],
     field_name_prefix: str,
-) -> Tuple[T, Set[str]]:
-    """Call `f` with arguments specified by a dictionary of values from argparse.
+    lazy: bool = False,
+    inside_lazy: bool = False,
+) -> Tuple[DeferredCall, Set[str]]:
+    """Parse and validate arguments for calling `f`, without calling it. Nested
+    callables are also deferred.
 
-    Returns the output of `f` and a set of used arguments."""
+    Returns the deferred call and a set of used arguments. `InstantiationError` is
+    raised for invalid arguments."""
 
     f, type_from_typevar = _resolver.resolve_generic_types(f)
     f = _resolver.narrow_type(f, default_instance)
@@ -48,6 +230,12 @@ def call_from_args(
             _strings.make_field_name([arg.prefix, arg.field.name])
         ] = arg
 
+    def is_outermost_lazy(field: _fields.FieldDefinition) -> bool:
+        """Markers are applied recursively to nested fields, but only the outermost
+        lazy field is wrapped in a proxy. Fields nested within it are instantiated
+        when the proxy is resolved."""
+        return _markers.LAZY in field.markers and not (lazy or inside_lazy)
+
     for field in _fields.field_list_from_callable(
         f, default_instance=default_instance
     ):  # type: ignore
@@ -66,7 +254,7 @@ def call_from_args(
             if not arg.lowered.is_fixed():
                 value = get_value_from_arg(prefixed_field_name)
 
-                if value in _fields.MISSING_SINGLETONS:
+                if _fields.is_missing(value):
                     value = arg.field.default
                 else:
                     if arg.lowered.nargs == "?":
@@ -82,10 +270,10 @@ def call_from_args(
                             f"Parsing error for {arg.lowered.name_or_flag}: {e.args[0]}"
                         )
             else:
-                assert arg.field.default not in _fields.MISSING_SINGLETONS
+                assert not _fields.is_missing(arg.field.default)
                 value = arg.field.default
                 parsed_value = value_from_prefixed_field_name.get(prefixed_field_name)
-                if parsed_value not in _fields.MISSING_SINGLETONS:
+                if not _fields.is_missing(parsed_value):
                     raise InstantiationError(
                         f"{arg.lowered.name_or_flag}={parsed_value} was passed in, but"
                         " is a fixed argument that cannot be parsed"
@@ -97,12 +285,14 @@ def call_from_args(
             # Nested callable.
             if _resolver.unwrap_origin_strip_extras(field_type) is Union:
                 field_type = type(field.default)
-            value, consumed_keywords_child = call_from_args(
+            value, consumed_keywords_child = deferred_call_from_args(
                 field_type,
                 parser_definition,
                 field.default,
                 value_from_prefixed_field_name,
                 field_name_prefix=prefixed_field_name,
+                lazy=is_outermost_lazy(field),
+                inside_lazy=lazy or inside_lazy,
             )
             consumed_keywords |= consumed_keywords_child
         else:
@@ -117,7 +307,7 @@ def call_from_args(
             if subparser_dest in value_from_prefixed_field_name:
                 subparser_name = get_value_from_arg(subparser_dest)
             else:
-                assert subparser_def.default_instance not in _fields.MISSING_SINGLETONS
+                assert not _fields.is_missing(subparser_def.default_instance)
                 default_instance = subparser_def.default_instance
                 # assert default_instance is not None
                 subparser_name = None
@@ -153,12 +343,14 @@ def call_from_args(
                         chosen_f = option
                         break
                 assert chosen_f is not None
-                value, consumed_keywords_child = call_from_args(
+                value, consumed_keywords_child = deferred_call_from_args(
                     chosen_f,
                     subparser_def.parser_from_name[subparser_name],
                     field.default if type(field.default) is chosen_f else None,
                     value_from_prefixed_field_name,
                     field_name_prefix=prefixed_field_name,
+                    lazy=is_outermost_lazy(field),
+                    inside_lazy=lazy or inside_lazy,
                 )
                 consumed_keywords |= consumed_keywords_child
 
@@ -173,20 +365,4 @@ def call_from_args(
     unwrapped_f = _resolver.unwrap_origin_strip_extras(f)
     unwrapped_f = list if unwrapped_f is Sequence else unwrapped_f  # type: ignore
     unwrapped_f = _resolver.narrow_type(unwrapped_f, default_instance)
-    if unwrapped_f in (tuple, list, set):
-        if len(args) == 0:
-            # When tuples are used as nested structures (eg Tuple[SomeDataclass]), we
-            # use keyword arguments.
-            return unwrapped_f(kwargs.values()), consumed_keywords  # type: ignore
-        else:
-            # When tuples are directly parsed (eg Tuple[int, int]), we end up with a
-            # single set of positional arguments.
-            assert len(args) == 1
-            return unwrapped_f(args[0]), consumed_keywords  # type: ignore
-    elif unwrapped_f is dict:
-        for arg in args:
-            assert isinstance(arg, dict)
-            kwargs.update(arg)
-        return kwargs, consumed_keywords  # type: ignore
-    else:
-        return unwrapped_f(*args, **kwargs), consumed_keywords  # type: ignore
+    return DeferredCall(unwrapped_f, args, kwargs, lazy=lazy), consumed_keywords
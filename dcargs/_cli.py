@@ -1,13 +1,45 @@
 """Core public API."""
+from __future__ import annotations
+
 import argparse
+import collections
+import contextvars
 import dataclasses
+import itertools
+import os
+import shlex
+import subprocess
 import sys
+import threading
 import warnings
-from typing import Callable, Optional, Sequence, Type, TypeVar, Union, cast, overload
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Counter,
+    Dict,
+    Generic,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
-from . import _argparse_formatter, _calling, _fields, _parsers
+from . import (
+    _argparse_formatter,
+    _calling,
+    _completion_index,
+    _disk_cache,
+    _fields,
+    _parsers,
+)
 from . import _shtab as shtab
-from . import _strings, conf
+from . import _stats, _strings, conf
 
 OutT = TypeVar("OutT")
 
@@ -28,6 +60,7 @@ def cli(
     description: Optional[str] = None,
     args: Optional[Sequence[str]] = None,
     default: Optional[OutT] = None,
+    max_workers: Optional[int] = None,
 ) -> OutT:
     ...
 
@@ -40,6 +73,7 @@ def cli(
     description: Optional[str] = None,
     args: Optional[Sequence[str]] = None,
     default: Optional[OutT] = None,
+    max_workers: Optional[int] = None,
 ) -> OutT:
     ...
 
@@ -51,6 +85,7 @@ def cli(
     description: Optional[str] = None,
     args: Optional[Sequence[str]] = None,
     default: Optional[OutT] = None,
+    max_workers: Optional[int] = None,
     **deprecated_kwargs,
 ) -> OutT:
     """Call `f(...)`, with arguments populated from an automatically generated CLI
@@ -89,6 +124,13 @@ def cli(
 
     Completion scripts for interactive shells is also provided. To print a script that
     can be used for tab completion, pass in `--dcargs-print-completion {bash/zsh/tcsh}`.
+    If the `DCARGS_CACHE_DIR` environment variable is set, generated scripts are
+    cached in that directory, and are only regenerated when the CLI changes. Rendered
+    helptext is cached in the same directory. For packaging,
+    scripts can also be generated via `python -m dcargs completion module:function`.
+    For very large CLIs, `--dcargs-print-dynamic-completion {bash/zsh}` prints a small
+    script that answers completion queries from an index file instead, without
+    importing the program being completed.
 
     Args:
         f: Callable.
@@ -103,13 +145,229 @@ def cli(
             if `T` is a dataclass, TypedDict, or NamedTuple. Helpful for merging CLI
             arguments with values loaded from elsewhere. (for example, a config object
             loaded from a yaml file)
+        max_workers: If set, nested callables that don't depend on each other are
+            instantiated concurrently, using a thread pool with this many workers.
+            Useful when constructors do blocking I/O. `f` itself is still called
+            from the current thread. Exceptions raised by nested callables are
+            collected into a single `dcargs.InstantiationError`.
 
     Returns:
         The output of `f(...)`.
     """
+    with _stats.counting():
+        spec = _build_spec(
+            f,
+            prog=prog,
+            description=description,
+            default=default,
+            deprecated_kwargs=deprecated_kwargs,
+        )
+        return _evaluate(_parse_deferred_call(spec, args), spec, max_workers)
+
+
+@overload
+async def acli(
+    f: Type[OutT],
+    *,
+    prog: Optional[str] = None,
+    description: Optional[str] = None,
+    args: Optional[Sequence[str]] = None,
+    default: Optional[OutT] = None,
+) -> OutT:
+    ...
+
+
+@overload
+async def acli(
+    f: Callable[..., Awaitable[OutT]],
+    *,
+    prog: Optional[str] = None,
+    description: Optional[str] = None,
+    args: Optional[Sequence[str]] = None,
+    default: Optional[OutT] = None,
+) -> OutT:
+    ...
+
+
+@overload
+async def acli(
+    f: Callable[..., OutT],
+    *,
+    prog: Optional[str] = None,
+    description: Optional[str] = None,
+    args: Optional[Sequence[str]] = None,
+    default: Optional[OutT] = None,
+) -> OutT:
+    ...
+
+
+async def acli(
+    f: Union[Type[OutT], Callable[..., OutT], Callable[..., Awaitable[OutT]]],
+    *,
+    prog: Optional[str] = None,
+    description: Optional[str] = None,
+    args: Optional[Sequence[str]] = None,
+    default: Optional[OutT] = None,
+    **deprecated_kwargs,
+) -> OutT:
+    """Asynchronous version of `dcargs.cli()`, for use with coroutine functions.
+
+    Arguments are parsed the same way as `dcargs.cli()`. When instantiating, `f` and
+    any nested callables that are coroutine functions are awaited. Nested callables
+    are always instantiated before the callables that they're passed into, but
+    siblings that don't depend on each other are awaited concurrently via
+    `asyncio.gather()`.
+
+    Fields marked with `dcargs.conf.Lazy` are still instantiated synchronously, on
+    first access.
+
+    Args:
+        f: Callable or coroutine function.
+        prog: Same as `dcargs.cli()`.
+        description: Same as `dcargs.cli()`.
+        args: Same as `dcargs.cli()`.
+        default: Same as `dcargs.cli()`.
+
+    Returns:
+        The output of `f(...)`, awaited if `f` is a coroutine function.
+    """
+    with _stats.counting():
+        spec = _build_spec(
+            # Coroutine functions are parsed like any other callable; outputs are only
+            # awaited when evaluating.
+            cast(Callable[..., OutT], f),
+            prog=prog,
+            description=description,
+            default=default,
+            deprecated_kwargs=deprecated_kwargs,
+        )
+        deferred_call = _parse_deferred_call(spec, args)
+        return _unwrap_output(spec, await deferred_call.evaluate_async())
+
+
+def prefetch(
+    f: Union[Type[OutT], Callable[..., OutT]],
+    *,
+    prog: Optional[str] = None,
+    description: Optional[str] = None,
+    default: Optional[OutT] = None,
+) -> PrefetchHandle[OutT]:
+    """Start building the parser for `f` in a background thread, and return a handle
+    for using it later. This lets parser construction overlap with other startup
+    work, like importing heavy dependencies:
+
+    ```python
+    handle = dcargs.prefetch(main)
+
+    import torch
+
+    handle.cli()
+    ```
+
+    Arguments mirror `dcargs.cli()`. If building in the background fails, the handle
+    falls back to building the parser synchronously, so errors are raised from
+    `handle.cli()` as usual."""
+    return PrefetchHandle(f, prog=prog, description=description, default=default)
+
+
+class PrefetchHandle(Generic[OutT]):
+    """Handle for a parser that's being built in the background. Returned by
+    `dcargs.prefetch()`."""
+
+    def __init__(
+        self,
+        f: Union[Type[OutT], Callable[..., OutT]],
+        *,
+        prog: Optional[str],
+        description: Optional[str],
+        default: Optional[OutT],
+    ) -> None:
+        self._f = f
+        self._prog = prog
+        self._description = description
+        self._default = default
+        self._built: Optional[Tuple[_CliSpecification, argparse.ArgumentParser]] = None
+        self._background_counters: Counter[str] = collections.Counter()
+
+        # Helptext is colored when the parser is built, so we record the color state.
+        # The background thread runs in a copy of the current context.
+        self._colors_enabled = _strings.colors_enabled()
+        self._thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._build_in_background,),
+            name="dcargs-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _build_spec(self) -> _CliSpecification:
+        return _build_spec(
+            self._f,
+            prog=self._prog,
+            description=self._description,
+            default=self._default,
+            deprecated_kwargs={},
+        )
+
+    def _build_in_background(self) -> None:
+        with _stats.counting() as counters:
+            try:
+                spec = self._build_spec()
+                self._built = (spec, _build_parser(spec))
+            except Exception:
+                # We'll build again when the handle is used, which raises the error in
+                # the calling thread.
+                pass
+        self._background_counters = counters
+
+    def cli(
+        self,
+        *,
+        args: Optional[Sequence[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> OutT:
+        """Same as `dcargs.cli()`, but uses the prefetched parser. Blocks until the
+        background build is done."""
+        self._thread.join()
+        with _stats.counting() as counters:
+            if (
+                self._built is not None
+                and self._colors_enabled == _strings.colors_enabled()
+            ):
+                # Work done in the background is counted towards this call.
+                counters.update(self._background_counters)
+                spec, parser = self._built
+                deferred_call = _parse_deferred_call(spec, args, parser)
+            else:
+                spec = self._build_spec()
+                deferred_call = _parse_deferred_call(spec, args)
+            return _evaluate(deferred_call, spec, max_workers)
+
+
+@dataclasses.dataclass(frozen=True)
+class _CliSpecification:
+    """Everything needed to parse arguments for a callable."""
+
+    f: Callable
+    parser_definition: _parsers.ParserSpecification
+    default_instance: Any
+    dummy_wrapped: bool
+    """If set, `f` is a dummy dataclass, with the output stored in a single field."""
+    prog: Optional[str]
+
+
+def _build_spec(
+    f: Union[Type[OutT], Callable[..., OutT]],
+    *,
+    prog: Optional[str],
+    description: Optional[str],
+    default: Optional[OutT],
+    deprecated_kwargs: Dict[str, Any],
+) -> _CliSpecification:
+    """Map a callable to the relevant CLI arguments and subparsers."""
     if "default_instance" in deprecated_kwargs:
         warnings.warn(
-            "`default_instance=` is deprecated! use `default=` instead.", stacklevel=2
+            "`default_instance=` is deprecated! use `default=` instead.", stacklevel=3
         )
         default = deprecated_kwargs["default_instance"]
     if deprecated_kwargs.get("avoid_subparsers", False):
@@ -117,7 +375,7 @@ def cli(
         warnings.warn(
             "`avoid_subparsers=` is deprecated! use `dcargs.conf.AvoidSubparsers[]`"
             " instead.",
-            stacklevel=2,
+            stacklevel=3,
         )
 
     # Internally, we distinguish between two concepts:
@@ -157,6 +415,51 @@ def cli(
         default_instance=default_instance_internal,  # Overrides for default values.
         prefix="",  # Used for recursive calls.
     )
+    return _CliSpecification(
+        f=f,
+        parser_definition=parser_definition,
+        default_instance=default_instance_internal,
+        dummy_wrapped=dummy_wrapped,
+        prog=prog,
+    )
+
+
+def _build_parser(spec: _CliSpecification) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog=spec.prog,
+        formatter_class=_argparse_formatter.make_formatter_class(
+            len(spec.parser_definition.args)
+        ),
+    )
+    spec.parser_definition.apply(parser)
+    _add_help_group_argument(parser, spec.parser_definition)
+    return parser
+
+
+def _add_help_group_argument(
+    parser: argparse.ArgumentParser, parser_definition: _parsers.ParserSpecification
+) -> None:
+    """Add `--help-group` to a parser, so it shows up in helptext and completion
+    scripts. The flag itself is handled before argparse runs."""
+    if not parser_definition.uses_help_group_flag():
+        return
+    parser.add_argument(
+        _strings.help_group_flag,
+        metavar=_strings.format_metavar("PREFIX"),
+        default=argparse.SUPPRESS,
+        help="show helptext for a single argument group, and exit",
+    )
+
+
+def _parse_deferred_call(
+    spec: _CliSpecification,
+    args: Optional[Sequence[str]],
+    parser: Optional[argparse.ArgumentParser] = None,
+) -> _calling.DeferredCall:
+    """Parse arguments, without calling anything. If `parser` is `None`, it will be
+    built from the specification when needed."""
+    parser_definition = spec.parser_definition
+    prog = spec.prog
 
     # Read and fix arguments. If the user passes in --field_name instead of
     # --field-name, correct for them.
@@ -178,52 +481,89 @@ def cli(
     #
     # Note that shtab also offers an add_argument_to() functions that fulfills a similar
     # goal, but manual parsing of argv is convenient for turning off colors.
-    print_completion = len(args) >= 2 and args[0] == "--dcargs-print-completion"
+    print_completion = len(args) >= 2 and args[0] in (
+        "--dcargs-print-completion",
+        "--dcargs-print-dynamic-completion",
+    )
 
     formatting_context = _argparse_formatter.ansi_context()
-    completion_shell = None
     if print_completion:
         formatting_context = _argparse_formatter.dummy_termcolor_context()
-        completion_shell = args[1]
 
     # Generate parser!
-    with formatting_context:
-        parser = argparse.ArgumentParser(
-            prog=prog,
-            formatter_class=_argparse_formatter.make_formatter_class(
-                len(parser_definition.args)
-            ),
-        )
-        parser_definition.apply(parser)
-
+    with formatting_context, _argparse_formatter.terminal_size_context():
         if print_completion:
-            assert completion_shell in ("bash", "zsh", "tcsh",), (
-                "Shell should be one `bash`, `zsh`, or `tcsh`, but got"
-                f" {completion_shell}"
-            )
             print(
-                shtab.complete(
-                    parser=parser,
-                    shell=completion_shell,
-                    root_prefix=f"dcargs_{parser.prog}",
+                _get_completion_script(
+                    parser_definition,
+                    prog=prog if prog is not None else os.path.basename(sys.argv[0]),
+                    shell=args[1],
+                    dynamic=args[0] == "--dcargs-print-dynamic-completion",
                 )
             )
             raise SystemExit()
 
+        # Print helptext for a single argument group. This skips parser construction
+        # entirely.
+        help_group = _get_help_group(args, parser_definition)
+        if help_group is not None:
+            chunks = parser_definition.format_group_help(
+                help_group,
+                formatter_class=_argparse_formatter.make_formatter_class(
+                    len(parser_definition.args)
+                ),
+            )
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                prog_name = prog if prog is not None else os.path.basename(sys.argv[0])
+                sys.stderr.write(
+                    f"{prog_name}: error: no argument group matches {help_group!r}\n"
+                )
+                raise SystemExit(2)
+            _write_to_pager(itertools.chain([first_chunk], chunks))
+            raise SystemExit(0)
+
+        # Helptext requests are served from the cache when possible, which lets us
+        # skip parser construction. Line wrapping depends on the terminal width, so
+        # it's part of the key; stale widths are evicted with other old entries.
+        help_path = _get_help_path(args)
+        if help_path is not None:
+            help_cache_key = _disk_cache.spec_fingerprint(
+                parser_definition,
+                prog if prog is not None else os.path.basename(sys.argv[0]),
+                help_path,
+                _argparse_formatter.terminal_columns(),
+                _strings.colors_enabled(),
+            )
+            helptext = _disk_cache.read_text("help", help_cache_key)
+            if helptext is not None:
+                sys.stdout.write(helptext)
+                raise SystemExit(0)
+
+        if parser is None:
+            parser = _build_parser(spec)
+
+        if help_path is not None:
+            helptext = _format_subparser_help(parser, help_path)
+            if helptext is not None:
+                _disk_cache.write_text("help", help_cache_key, helptext)
+                sys.stdout.write(helptext)
+                raise SystemExit(0)
+
         value_from_prefixed_field_name = vars(parser.parse_args(args=args))
 
-    if dummy_wrapped:
+    if spec.dummy_wrapped:
         value_from_prefixed_field_name = {
             k.replace(_strings.dummy_field_name, ""): v
             for k, v in value_from_prefixed_field_name.items()
         }
 
     try:
-        # Attempt to call `f` using whatever was passed in.
-        out, consumed_keywords = _calling.call_from_args(
-            f,
+        # Parse and validate arguments for `f`. Calling happens after this.
+        deferred_call, consumed_keywords = _calling.deferred_call_from_args(
+            spec.f,
             parser_definition,
-            default_instance_internal,
+            spec.default_instance,
             value_from_prefixed_field_name,
             field_name_prefix="",
         )
@@ -238,7 +578,180 @@ def cli(
         f"Parsed {value_from_prefixed_field_name.keys()}, but only consumed"
         f" {consumed_keywords}"
     )
+    return deferred_call
+
 
-    if dummy_wrapped:
+def _unwrap_output(spec: _CliSpecification, out: Any) -> Any:
+    if spec.dummy_wrapped:
         out = getattr(out, _strings.dummy_field_name)
     return out
+
+
+def _evaluate(
+    deferred_call: _calling.DeferredCall,
+    spec: _CliSpecification,
+    max_workers: Optional[int],
+) -> Any:
+    out = (
+        deferred_call.evaluate()
+        if max_workers is None
+        else deferred_call.evaluate_in_thread_pool(max_workers)
+    )
+    return _unwrap_output(spec, out)
+
+
+def _get_help_group(
+    args: Sequence[str], parser_definition: _parsers.ParserSpecification
+) -> Optional[str]:
+    """Get the group passed in via `--help-group PREFIX`, if any. Values of other
+    options are skipped, so `--name --help-group` doesn't match."""
+    if (
+        not any(arg.startswith(_strings.help_group_flag) for arg in args)
+        or not parser_definition.uses_help_group_flag()
+    ):
+        return None
+
+    nargs_from_flag = _get_fixed_nargs_from_flag(parser_definition)
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--":
+            break
+        if arg == _strings.help_group_flag and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith(_strings.help_group_flag + "="):
+            return arg.partition("=")[2]
+        i += 1 + nargs_from_flag.get(arg, 0)
+    return None
+
+
+def _get_fixed_nargs_from_flag(
+    parser_definition: _parsers.ParserSpecification,
+) -> Dict[str, int]:
+    """Get the number of values consumed by each option that takes a fixed number of
+    values, in a parser and all of its subparsers. Options with a variable number of
+    values stop at the next flag, so they don't need to be skipped."""
+    out: Dict[str, int] = {}
+    for arg in parser_definition.args:
+        lowered = arg.lowered
+        if (
+            not arg.field.is_positional()
+            and lowered.action is None
+            and isinstance(lowered.nargs, int)
+        ):
+            out[lowered.name_or_flag] = lowered.nargs
+    for subparsers in parser_definition.subparsers_from_name.values():
+        for child in subparsers.parser_from_name.values():
+            out.update(_get_fixed_nargs_from_flag(child))
+    return out
+
+
+def _write_to_pager(chunks: Iterable[str]) -> None:
+    """Write chunks of text to a pager (`$PAGER`, or `less -R` by default) when stdout
+    is a terminal, otherwise directly to stdout. Chunks are written as they are
+    produced."""
+    pager_command = os.environ.get("PAGER", "less -R")
+    if not sys.stdout.isatty() or pager_command.strip() == "":
+        for chunk in chunks:
+            sys.stdout.write(chunk)
+        return
+
+    try:
+        pager = subprocess.Popen(
+            shlex.split(pager_command), stdin=subprocess.PIPE, text=True
+        )
+    except OSError:
+        # Pager not found.
+        for chunk in chunks:
+            sys.stdout.write(chunk)
+        return
+
+    assert pager.stdin is not None
+    try:
+        for chunk in chunks:
+            pager.stdin.write(chunk)
+        pager.stdin.close()
+    except BrokenPipeError:
+        # The pager was closed before we finished writing.
+        pass
+    pager.wait()
+
+
+def _get_help_path(args: Sequence[str]) -> Optional[Tuple[str, ...]]:
+    """If `args` is a (possibly empty) sequence of subcommands followed by a help flag,
+    return the subcommands. Otherwise, returns `None`."""
+    if len(args) == 0 or args[-1] not in ("-h", "--help"):
+        return None
+    if any(arg.startswith("-") for arg in args[:-1]):
+        return None
+    return tuple(args[:-1])
+
+
+def _format_subparser_help(
+    parser: argparse.ArgumentParser, subcommands: Tuple[str, ...]
+) -> Optional[str]:
+    """Format helptext for the parser reached by following a sequence of subcommands.
+    Returns `None` if the subcommands are invalid."""
+    for subcommand in subcommands:
+        if parser._subparsers is None:
+            return None
+        subparsers_action = parser._subparsers._group_actions[0]
+        assert isinstance(subparsers_action, argparse._SubParsersAction)
+        if subcommand not in subparsers_action.choices:
+            return None
+        parser = subparsers_action.choices[subcommand]
+    return parser.format_help()
+
+
+def _get_completion_script(
+    parser_definition: _parsers.ParserSpecification,
+    prog: str,
+    shell: str,
+    dynamic: bool,
+) -> str:
+    """Get a completion script for a parser.
+
+    Completion scripts are cached on disk. Building argparse parsers and traversing
+    them in shtab is expensive for large CLIs, and completion scripts are often
+    regenerated on every shell startup."""
+    cache_key = _disk_cache.spec_fingerprint(parser_definition, prog, shell, dynamic)
+
+    if dynamic:
+        # Dynamic completion: write an index of the parser tree, which is read by a
+        # standalone completer that doesn't need to import dcargs or the user's code.
+        index_path = _disk_cache.get_path("completion_index", cache_key)
+        if index_path is None:
+            raise RuntimeError(
+                "Dynamic completion requires a cache directory, which can be set via"
+                " `DCARGS_CACHE_DIR`."
+            )
+        if not index_path.exists():
+            _disk_cache.write_text(
+                "completion_index",
+                cache_key,
+                _completion_index.dumps_index(
+                    _completion_index.make_index(parser_definition)
+                ),
+            )
+        return _completion_index.make_script(shell, prog, index_path)
+
+    assert shell in ("bash", "zsh", "tcsh"), (
+        "Shell should be one `bash`, `zsh`, or `tcsh`, but got" f" {shell}"
+    )
+    completion_script = _disk_cache.read_text("completion", cache_key)
+    if completion_script is None:
+        parser = argparse.ArgumentParser(
+            prog=prog,
+            formatter_class=_argparse_formatter.make_formatter_class(
+                len(parser_definition.args)
+            ),
+        )
+        parser_definition.apply(parser)
+        _add_help_group_argument(parser, parser_definition)
+        completion_script = shtab.complete(
+            parser=parser,
+            shell=shell,
+            root_prefix=f"dcargs_{parser.prog}",
+        )
+        _disk_cache.write_text("completion", cache_key, completion_script)
+    return completion_script
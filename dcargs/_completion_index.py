@@ -0,0 +1,135 @@
+"""Helpers for dynamic shell completion. Parser specifications are serialized into a
+compact index file, which is read by the standalone completer in
+`_dynamic_completer.py`."""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import shlex
+import sys
+from typing import Any, Dict, List, Optional
+
+from typing_extensions import get_args
+
+from . import _parsers, _resolver, _strings
+
+# Bump this when the index format changes.
+INDEX_FORMAT_VERSION = 1
+
+
+def _get_hint(typ: Any) -> Optional[str]:
+    """Get a completion hint from a type annotation. Currently only used for paths."""
+    typ = _resolver.unwrap_annotated(typ)[0]
+    if isinstance(typ, type) and issubclass(typ, (pathlib.PurePath, os.PathLike)):
+        return "path"
+    for arg in get_args(typ):
+        if _get_hint(arg) is not None:
+            return "path"
+    return None
+
+
+def make_index(parser_definition: _parsers.ParserSpecification) -> Dict[str, Any]:
+    """Serialize the argument and subcommand tree of a parser specification into a
+    JSON-compatible index.
+
+    Each parser is stored once, and referenced by its position in a flat list. Argument
+    specs are formatted as `[nargs, choices, hint]`, where `nargs=0` denotes flags."""
+    parsers: List[Dict[str, Any]] = []
+
+    def add_parser(parser_definition: _parsers.ParserSpecification) -> int:
+        index = len(parsers)
+        parser: Dict[str, Any] = {
+            "options": {"-h": [0, None, None], "--help": [0, None, None]},
+            "positionals": [],
+            "subcommands": [],
+        }
+        parsers.append(parser)
+
+        for arg in parser_definition.args:
+            lowered = arg.lowered
+            if lowered.is_fixed() or lowered.help is argparse.SUPPRESS:
+                continue
+            spec = [
+                0 if lowered.action is not None else lowered.nargs,
+                None if lowered.choices is None else list(lowered.choices),
+                _get_hint(arg.field.typ),
+            ]
+            if arg.field.is_positional():
+                parser["positionals"].append(spec)
+            else:
+                parser["options"][lowered.name_or_flag] = spec
+
+        for subparsers in parser_definition.subparsers_from_name.values():
+            group: Dict[str, int] = {}
+            if subparsers.can_be_none:
+                group[
+                    _strings.subparser_name_from_type(subparsers.prefix, None)
+                ] = add_parser(
+                    _parsers.ParserSpecification(
+                        f=type(None),
+                        description="",
+                        args=[],
+                        helptext_from_nested_class_field_name={},
+                        subparsers_from_name={},
+                        prefix=subparsers.prefix,
+                    )
+                )
+            for name, subparser_def in subparsers.parser_from_name.items():
+                group[name] = add_parser(subparser_def)
+            parser["subcommands"].append(group)
+
+        return index
+
+    add_parser(parser_definition)
+    if parser_definition.uses_help_group_flag():
+        parsers[0]["options"][_strings.help_group_flag] = [1, None, None]
+    return {"version": INDEX_FORMAT_VERSION, "parsers": parsers}
+
+
+def dumps_index(index: Dict[str, Any]) -> str:
+    return json.dumps(index, separators=(",", ":"))
+
+
+def make_script(shell: str, prog: str, index_path: pathlib.Path) -> str:
+    """Make a completion script that answers queries by running the standalone
+    completer on an index file."""
+    if shell not in ("bash", "zsh"):
+        raise ValueError(
+            f"Dynamic completion is only supported for bash and zsh, but got {shell}."
+        )
+    function_name = "_dcargs_dynamic_" + "".join(
+        c if c.isalnum() else "_" for c in prog
+    )
+    completer_path = pathlib.Path(__file__).parent / "_dynamic_completer.py"
+    command = " ".join(
+        map(
+            shlex.quote,
+            (
+                sys.executable,
+                # Skip site initialization; the completer only needs the standard
+                # library.
+                "-S",
+                str(completer_path),
+                str(index_path),
+            ),
+        )
+    )
+
+    lines = [
+        "# AUTOMATICALLY GENERATED by `dcargs`, for dynamic completion.",
+    ]
+    if shell == "zsh":
+        lines.append("autoload -U +X bashcompinit && bashcompinit")
+    lines.extend(
+        [
+            f"{function_name}() {{",
+            "  local IFS=$'\\n'",
+            f'  COMPREPLY=( $({command} "$COMP_LINE" "$COMP_POINT"'
+            ' "${COMP_WORDS[COMP_CWORD]}") )',
+            "}",
+            f"complete -F {function_name} {shlex.quote(prog)}",
+        ]
+    )
+    return "\n".join(lines)
@@ -0,0 +1,206 @@
+"""Helpers for caching generated artifacts (completion scripts, etc) on disk, keyed by
+a fingerprint of the parser specification."""
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pathlib
+import reprlib
+import sys
+import tempfile
+from typing import Any, List, Optional
+
+from . import _arguments, _fields, _parsers
+
+# Bump this when the format of any cached artifact changes.
+_CACHE_FORMAT_VERSION = 2
+
+# Maximum number of artifacts to keep per namespace. When this is exceeded, the least
+# recently used artifacts are deleted. Completion indices aren't evicted: installed
+# completion scripts refer to them by path.
+_MAX_ENTRIES_FROM_NAMESPACE = {"help": 256, "completion": 64}
+
+
+def get_cache_dir() -> Optional[pathlib.Path]:
+    """Get the directory used for caching. Caching is opt-in: it's only enabled when
+    the `DCARGS_CACHE_DIR` environment variable is set to a non-empty path."""
+    cache_dir = os.environ.get("DCARGS_CACHE_DIR", "")
+    return pathlib.Path(cache_dir) if cache_dir != "" else None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_package_version() -> str:
+    """Get the installed version of dcargs, which is included in fingerprints so that
+    artifacts aren't reused after upgrades. When running from a source checkout without
+    package metadata, the latest modification time of our modules is used instead."""
+    try:
+        from importlib.metadata import version
+
+        return version("dcargs")
+    except Exception:
+        # ImportError for Python 3.7, PackageNotFoundError when not installed.
+        pass
+    package_dir = pathlib.Path(__file__).parent
+    return "mtime:" + str(
+        max(path.stat().st_mtime_ns for path in package_dir.glob("**/*.py"))
+    )
+
+
+def _describe_parser(parser_definition: _parsers.ParserSpecification) -> List[Any]:
+    """Structural description of a parser specification. This should contain
+    everything that can affect generated parsers."""
+    return [
+        parser_definition.description,
+        [
+            (
+                arg.prefix,
+                arg.lowered.name_or_flag,
+                arg.lowered.dest,
+                arg.lowered.required,
+                arg.lowered.action,
+                arg.lowered.nargs,
+                None if arg.lowered.choices is None else tuple(arg.lowered.choices),
+                arg.lowered.metavar,
+                _describe_help(arg),
+            )
+            for arg in parser_definition.args
+        ],
+        sorted(parser_definition.helptext_from_nested_class_field_name.items()),
+        [
+            (
+                name,
+                subparsers.description,
+                subparsers.required,
+                subparsers.can_be_none,
+                subparsers.prefix,
+                [
+                    (subparser_name, _describe_parser(subparser_def))
+                    for subparser_name, subparser_def in subparsers.parser_from_name.items()
+                ],
+            )
+            for name, subparsers in parser_definition.subparsers_from_name.items()
+        ],
+    ]
+
+
+def _describe_help(arg: _arguments.ArgumentDefinition) -> Any:
+    """Describe the inputs to an argument's helptext. Rendering the helptext itself
+    would format every default and call every `default_factory`, which would defeat
+    the point of caching it."""
+    help = arg.lowered.help
+    if not isinstance(help, _arguments.LazyHelptext):
+        return help
+    return (
+        arg.field.helptext,
+        repr(arg.field.typ),
+        _describe_default(arg.field.default),
+        _describe_default(arg.lowered.default),
+    )
+
+
+def _describe_default(default: Any) -> str:
+    """Describe a default value, with a bounded length. Sentinels and factories are
+    described by name, since their reprs can contain memory addresses."""
+    if _fields.is_missing(default):
+        return "<missing>"
+    if default is _fields.EXCLUDE_FROM_CALL:
+        return "<excluded>"
+    if isinstance(default, _fields.LazyDefault):
+        factory = default.factory
+        return "<factory {}.{}>".format(
+            getattr(factory, "__module__", None),
+            getattr(factory, "__qualname__", type(factory).__qualname__),
+        )
+    return reprlib.repr(default)
+
+
+def spec_fingerprint(
+    parser_definition: _parsers.ParserSpecification, *extras: Any
+) -> str:
+    """Compute a fingerprint for a parser specification. Extra values that influence
+    the cached artifact (program name, shell, etc) can be passed in as well."""
+    description = repr(
+        (
+            _CACHE_FORMAT_VERSION,
+            _get_package_version(),
+            sys.version_info[:2],
+            _describe_parser(parser_definition),
+            extras,
+        )
+    )
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+def get_path(namespace: str, key: str) -> Optional[pathlib.Path]:
+    """Get the path of a cached artifact. Returns `None` if caching is disabled."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    return cache_dir / namespace / key
+
+
+def read_text(namespace: str, key: str) -> Optional[str]:
+    """Read a cached artifact. Returns `None` on cache misses."""
+    path = get_path(namespace, key)
+    if path is None:
+        return None
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    # Modification times are used to track recency for eviction.
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return text
+
+
+def write_text(namespace: str, key: str, text: str) -> None:
+    """Write an artifact to the cache. Failures are silently ignored; caching should
+    never prevent a CLI from working."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        directory = cache_dir / namespace
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # Write atomically, in case multiple processes are populating the cache.
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, directory / key)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        max_entries = _MAX_ENTRIES_FROM_NAMESPACE.get(namespace, None)
+        if max_entries is not None:
+            _evict(directory, max_entries)
+    except OSError:
+        pass
+
+
+def _evict(directory: pathlib.Path, max_entries: int) -> None:
+    """Delete the least recently used artifacts in a namespace directory, until at most
+    `max_entries` are left. Only called after writes, which are rare."""
+    entries = []
+    for path in directory.iterdir():
+        if path.name.startswith(".tmp-"):
+            continue
+        try:
+            entries.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            # Deleted by another process.
+            pass
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - max_entries]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
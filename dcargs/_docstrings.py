@@ -2,7 +2,6 @@
 
 import collections.abc
 import dataclasses
-import functools
 import inspect
 import io
 import itertools
@@ -12,7 +11,7 @@ from typing import Callable, Dict, Generic, Hashable, List, Optional, Type
 import docstring_parser
 from typing_extensions import get_origin, is_typeddict
 
-from . import _resolver, _strings
+from . import _caching, _resolver, _stats, _strings
 
 
 @dataclasses.dataclass(frozen=True)
@@ -39,10 +38,25 @@ class _ClassTokenization:
     field_data_from_name: Dict[str, _FieldData]
 
     @staticmethod
-    @functools.lru_cache(maxsize=8)
-    def make(clz) -> "_ClassTokenization":
-        """Parse the source code of a class, and cache some tokenization information."""
-        readline = io.BytesIO(inspect.getsource(clz).encode("utf-8")).readline
+    @_caching.cached("docstrings.class_tokenization")
+    def make(clz) -> "Optional[_ClassTokenization]":
+        """Parse the source code of a class, and cache some tokenization information.
+        Returns `None` if the source code can't be found. Failures are cached too;
+        searching for source code can be expensive."""
+        try:
+            _stats.increment("source_lookups")
+            source = inspect.getsource(clz)
+        except OSError as e:
+            # Dynamic dataclasses will result in an OSError -- this is fine, we just
+            # assume there's no docstring.
+            assert "could not find class definition" in e.args[0]
+            return None
+        except TypeError as e:  # pragma: no cover
+            # Notebooks cause “___ is a built-in class” TypeError.
+            assert "built-in class" in e.args[0]
+            return None
+        _stats.increment("tokenizations")
+        readline = io.BytesIO(source.encode("utf-8")).readline
 
         tokens: List[_Token] = []
         tokens_from_logical_line: Dict[int, List[_Token]] = {1: []}
@@ -121,16 +135,8 @@ def get_class_tokenization_with_field(
         # https://github.com/python/typing/issues/777
         assert search_cls is Generic or get_origin(search_cls) is None
 
-        try:
-            tokenization = _ClassTokenization.make(search_cls)  # type: ignore
-        except OSError as e:
-            # Dynamic dataclasses will result in an OSError -- this is fine, we just assume
-            # there's no docstring.
-            assert "could not find class definition" in e.args[0]
-            return None
-        except TypeError as e:  # pragma: no cover
-            # Notebooks cause “___ is a built-in class” TypeError.
-            assert "built-in class" in e.args[0]
+        tokenization = _ClassTokenization.make(search_cls)  # type: ignore
+        if tokenization is None:
             return None
 
         # Grab field-specific tokenization data.
@@ -147,14 +153,13 @@ def get_class_tokenization_with_field(
     return tokenization
 
 
+@_caching.cached("docstrings.field_docstring")
 def get_field_docstring(cls: Type, field_name: str) -> Optional[str]:
     """Get docstring for a field in a class."""
 
-    docstring = inspect.getdoc(cls)
-    if docstring is not None:
-        for param_doc in docstring_parser.parse(docstring).params:
-            if param_doc.arg_name == field_name:
-                return param_doc.description
+    param_docstrings = _get_param_docstrings(cls)
+    if field_name in param_docstrings:
+        return param_docstrings[field_name]
 
     tokenization = get_class_tokenization_with_field(cls, field_name)
     if tokenization is None:  # Currently only happens for dynamic dataclasses.
@@ -244,6 +249,21 @@ def get_field_docstring(cls: Type, field_name: str) -> Optional[str]:
     return None
 
 
+@_caching.cached("docstrings.param_docstrings")
+def _get_param_docstrings(cls: Type) -> Dict[str, Optional[str]]:
+    """Get parameter descriptions from the docstring of a class. The output is cached
+    and shared, so it shouldn't be mutated."""
+    docstring = inspect.getdoc(cls)
+    if docstring is None:
+        return {}
+
+    out: Dict[str, Optional[str]] = {}
+    _stats.increment("docstring_parses")
+    for param_doc in docstring_parser.parse(docstring).params:
+        out.setdefault(param_doc.arg_name, param_doc.description)
+    return out
+
+
 _callable_description_blocklist = set(
     filter(
         lambda x: isinstance(x, Hashable),  # type: ignore
@@ -252,6 +272,7 @@ _callable_description_blocklist = set(
 )
 
 
+@_caching.cached("docstrings.callable_description")
 def get_callable_description(f: Callable) -> str:
     """Get description associated with a callable via docstring parsing.
 
@@ -284,6 +305,7 @@ def get_callable_description(f: Callable) -> str:
         if docstring == default_doc:
             return ""
 
+    _stats.increment("docstring_parses")
     parsed_docstring = docstring_parser.parse(docstring)
     return "\n".join(
         list(
@@ -0,0 +1,128 @@
+"""Minimal completer for dynamic shell completion.
+
+This file is executed directly by completion scripts, and intentionally imports nothing
+but the standard library: neither dcargs nor the user's program (which may import
+heavy dependencies) is loaded when TAB is pressed. Completions are answered from an
+index file, which is generated by `dcargs._completion_index`.
+
+Usage:
+    python -S _dynamic_completer.py INDEX_PATH COMP_LINE COMP_POINT CURRENT_WORD
+"""
+import glob
+import json
+import os
+import shlex
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def _split_line(line: str) -> List[str]:
+    """Split a partial command line into words. Unterminated quotes are common while
+    completing, so we fall back to whitespace splitting."""
+    try:
+        words = shlex.split(line)
+    except ValueError:
+        words = line.split()
+    if line == "" or line[-1].isspace():
+        # Start a new word.
+        words.append("")
+    return words
+
+
+def _complete_paths(current: str) -> List[str]:
+    out = []
+    for path in glob.glob(glob.escape(os.path.expanduser(current)) + "*"):
+        out.append(path + "/" if os.path.isdir(path) else path)
+    return out
+
+
+def _complete_values(spec: Optional[List[Any]], current: str) -> List[str]:
+    """Completions for values of an argument. Argument specs are formatted as
+    [nargs, choices, hint]."""
+    if spec is None:
+        return []
+    _, choices, hint = spec
+    out = list(choices) if choices is not None else []
+    if hint == "path":
+        out.extend(_complete_paths(current))
+    return out
+
+
+def complete(index: Dict[str, Any], words: Sequence[str]) -> List[str]:
+    """Compute completions for the last word in `words`. The program name should be
+    excluded."""
+    parsers = index["parsers"]
+    parser = parsers[0]
+    pending_subcommands = list(parser["subcommands"])
+    positional_count = 0
+
+    # Option that we're currently reading values for, and how many values are left.
+    current_option: Optional[List[Any]] = None
+    remaining_values: Any = 0
+
+    for word in words[:-1]:
+        option_string = word.partition("=")[0]
+        if word.startswith("-") and option_string in parser["options"]:
+            option_spec: List[Any] = parser["options"][option_string]
+            current_option = option_spec
+            remaining_values = option_spec[0]
+            if "=" in word and isinstance(remaining_values, int):
+                remaining_values -= 1
+            if remaining_values == 0:
+                current_option = None
+            continue
+
+        if current_option is not None:
+            # Variable-length arguments consume values until the next option.
+            if isinstance(remaining_values, int):
+                remaining_values -= 1
+                if remaining_values == 0:
+                    current_option = None
+            continue
+
+        if len(pending_subcommands) > 0 and word in pending_subcommands[0]:
+            # Subcommands from the previous parser that haven't been consumed yet are
+            # attached to the leaves of the chosen subparser.
+            parser = parsers[pending_subcommands[0][word]]
+            pending_subcommands = list(parser["subcommands"]) + pending_subcommands[1:]
+            positional_count = 0
+            continue
+
+        positional_count += 1
+
+    current = words[-1] if len(words) > 0 else ""
+    if current_option is not None:
+        candidates = _complete_values(current_option, current)
+    elif current.startswith("-"):
+        candidates = list(parser["options"].keys())
+    else:
+        candidates = []
+        if positional_count < len(parser["positionals"]):
+            candidates.extend(
+                _complete_values(parser["positionals"][positional_count], current)
+            )
+        if len(pending_subcommands) > 0:
+            candidates.extend(pending_subcommands[0].keys())
+
+    return [c for c in candidates if c.startswith(current)]
+
+
+def main(argv: Sequence[str]) -> None:
+    index_path, line, point, shell_word = argv
+    with open(index_path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+
+    # Drop the program name.
+    words = _split_line(line[: int(point)])[1:]
+    current = words[-1] if len(words) > 0 else ""
+
+    # Shells may break words on characters like `:` and `=`, which appear in
+    # subcommand names. The shell will only replace its own version of the current
+    # word, so we strip the rest.
+    strip = len(current) - len(shell_word) if current.endswith(shell_word) else 0
+    for candidate in complete(index, words):
+        sys.stdout.write(candidate[strip:] + "\n")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -9,6 +9,7 @@ import dataclasses
 import enum
 import inspect
 import itertools
+import reprlib
 import typing
 import warnings
 from typing import (
@@ -30,10 +31,20 @@ import typing_extensions
 from typing_extensions import Annotated, get_args, get_type_hints, is_typeddict
 
 from . import conf  # Avoid circular import.
-from . import _docstrings, _instantiators, _resolver, _singleton, _strings
+from . import (
+    _caching,
+    _docstrings,
+    _instantiators,
+    _resolver,
+    _singleton,
+    _slots,
+    _stats,
+    _strings,
+)
 from .conf import _markers
 
 
+@_slots.add_slots()
 @dataclasses.dataclass(frozen=True)
 class FieldDefinition:
     name: str
@@ -63,7 +74,7 @@ class FieldDefinition:
             typ,
             default,
             helptext,
-            frozenset(inferred_markers).union(markers),
+            _markers.interned(itertools.chain(inferred_markers, markers)),
             name_override,
         )
 
@@ -73,7 +84,7 @@ class FieldDefinition:
         return dataclasses.replace(
             self,
             typ=Annotated.__class_getitem__((self.typ,) + markers),  # type: ignore
-            markers=self.markers.union(markers),
+            markers=_markers.interned(itertools.chain(self.markers, markers)),
         )
 
     def is_positional(self) -> bool:
@@ -85,6 +96,19 @@ class FieldDefinition:
         )
 
 
+@dataclasses.dataclass(frozen=True)
+class LazyDefault:
+    """Default value from a `default_factory`, which is only called when the value is
+    needed. This is at most once per `dcargs.cli()` call, if the field isn't overridden
+    from the command-line, and once more each time helptext is rendered. Values are
+    never shared between calls, so mutable defaults are safe."""
+
+    factory: Callable[[], Any]
+
+    def evaluate(self) -> Any:
+        return self.factory()
+
+
 class PropagatingMissingType(_singleton.Singleton):
     pass
 
@@ -126,6 +150,17 @@ try:
 except ImportError:
     pass
 
+# Defaults can be arrays, tensors, or other objects where `==` is expensive or doesn't
+# return a bool, so sentinels are compared by identity. omegaconf's sentinel is the
+# string "???", which may be a different (equal) object after copying.
+_missing_singleton_ids = frozenset(map(id, MISSING_SINGLETONS))
+_missing_strings = frozenset(x for x in MISSING_SINGLETONS if isinstance(x, str))
+
+
+def is_missing(x: Any) -> bool:
+    """Returns True if `x` is one of the sentinels in `MISSING_SINGLETONS`."""
+    return id(x) in _missing_singleton_ids or (type(x) is str and x in _missing_strings)
+
 
 @dataclasses.dataclass(frozen=True)
 class UnsupportedNestedTypeMessage:
@@ -138,6 +173,25 @@ def is_nested_type(typ: Type, default_instance: _DefaultInstance) -> bool:
     """Determine whether a type should be treated as a 'nested type', where a single
     type can be broken down into multiple fields (eg for nested dataclasses or
     classes)."""
+    _stats.increment("nested_type_checks")
+
+    # Lazy defaults are only used for types that are never nested.
+    if isinstance(default_instance, LazyDefault):
+        default_instance = MISSING_NONPROP
+
+    # Results are only cached when there's no default instance; we don't want to
+    # keep user-provided defaults alive.
+    if is_missing(default_instance):
+        return _is_nested_type_cached(typ, default_instance)
+    return _is_nested_type(typ, default_instance)
+
+
+@_caching.cached("fields.is_nested_type")
+def _is_nested_type_cached(typ: Type, default_instance: _DefaultInstance) -> bool:
+    return _is_nested_type(typ, default_instance)
+
+
+def _is_nested_type(typ: Type, default_instance: _DefaultInstance) -> bool:
     return not isinstance(
         _try_field_list_from_callable(typ, default_instance),
         UnsupportedNestedTypeMessage,
@@ -150,6 +204,7 @@ def field_list_from_callable(
 ) -> List[FieldDefinition]:
     """Generate a list of generic 'field' objects corresponding to the inputs of some
     annotated callable."""
+    _stats.increment("field_lists")
     out = _try_field_list_from_callable(f, default_instance)
 
     if isinstance(out, UnsupportedNestedTypeMessage):
@@ -168,6 +223,9 @@ _DefaultInstance = Union[
     Any, PropagatingMissingType, NonpropagatingMissingType, ExcludeFromCallType
 ]
 
+# Types that are never treated as nested, regardless of their value.
+_scalar_types = frozenset({str, int, float, bool, bytes, complex, type(None)})
+
 _known_parsable_types = set(
     filter(
         lambda x: isinstance(x, Hashable),  # type: ignore
@@ -231,7 +289,7 @@ def _try_field_list_from_callable(
     ):
         contained_type: Any
         if len(get_args(f)) == 0:
-            if default_instance in MISSING_SINGLETONS:
+            if is_missing(default_instance):
                 raise _instantiators.UnsupportedTypeAnnotationError(
                     f"Sequence type {cls} needs either an explicit type or a"
                     " default to infer from."
@@ -275,10 +333,10 @@ def _try_field_list_from_typeddict(
 ) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
     field_list = []
     valid_default_instance = (
-        default_instance not in MISSING_SINGLETONS
-        and default_instance is not EXCLUDE_FROM_CALL
+        not is_missing(default_instance) and default_instance is not EXCLUDE_FROM_CALL
     )
     assert not valid_default_instance or isinstance(default_instance, dict)
+    _stats.increment("type_hints")
     for name, typ in get_type_hints(cls, include_extras=True).items():
         if valid_default_instance:
             default = default_instance.get(name, MISSING_PROP)  # type: ignore
@@ -314,6 +372,7 @@ def _try_field_list_from_namedtuple(
     field_defaults = getattr(cls, "_field_defaults")
 
     # Note that _field_types is removed in Python 3.9.
+    _stats.increment("type_hints")
     for name, typ in get_type_hints(cls, include_extras=True).items():
         # Get default, with priority for `default_instance`.
         default = field_defaults.get(name, MISSING_NONPROP)
@@ -365,7 +424,7 @@ def _field_list_from_tuple(
     # Infer more specific type when tuple annotation isn't subscripted. This generally
     # doesn't happen
     if len(children) == 0:
-        if default_instance in MISSING_SINGLETONS:
+        if is_missing(default_instance):
             raise _instantiators.UnsupportedTypeAnnotationError(
                 "If contained types of a tuple are not specified in the annotation, a"
                 " default instance must be specified."
@@ -375,7 +434,7 @@ def _field_list_from_tuple(
             children = tuple(type(x) for x in default_instance)
 
     if (
-        default_instance in MISSING_SINGLETONS
+        is_missing(default_instance)
         # EXCLUDE_FROM_CALL indicates we're inside a TypedDict, with total=False.
         or default_instance is EXCLUDE_FROM_CALL
     ):
@@ -418,7 +477,7 @@ def _try_field_list_from_sequence(
     # When no default instance is specified:
     #     If we have List[int] => this can be parsed as a single field.
     #     If we have List[SomeStruct] => OK.
-    if default_instance in MISSING_SINGLETONS and not is_nested_type(
+    if is_missing(default_instance) and not is_nested_type(
         contained_type, MISSING_NONPROP
     ):
         return UnsupportedNestedTypeMessage(
@@ -428,13 +487,18 @@ def _try_field_list_from_sequence(
     # If we have a default instance:
     #     [int, int, int] => this can be parsed as a single field.
     #     [SomeStruct, int, int] => OK.
+    #
+    # Defaults can be very long, so we skip elements with scalar types and avoid
+    # formatting the whole sequence.
     if isinstance(default_instance, Iterable) and all(
-        [not is_nested_type(type(x), x) for x in default_instance]
+        type(x) in _scalar_types or not is_nested_type(type(x), x)
+        for x in default_instance
     ):
         return UnsupportedNestedTypeMessage(
-            f"Sequence with default {default_instance} should be parsed directly!"
+            f"Sequence with default {reprlib.repr(default_instance)} should be parsed"
+            " directly!"
         )
-    if default_instance in MISSING_SINGLETONS:
+    if is_missing(default_instance):
         # We use the broader error type to prevent it from being caught by
         # is_possibly_nested_type(). This is for sure a bad annotation!
         raise _instantiators.UnsupportedTypeAnnotationError(
@@ -459,7 +523,7 @@ def _try_field_list_from_dict(
     f: Union[Callable, Type],
     default_instance: _DefaultInstance,
 ) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
-    if default_instance in MISSING_SINGLETONS:
+    if is_missing(default_instance):
         return UnsupportedNestedTypeMessage(
             "Nested dictionary structures must have a default instance specified."
         )
@@ -484,7 +548,7 @@ def _try_field_list_from_general_callable(
     default_instance: _DefaultInstance,
 ) -> Union[List[FieldDefinition], UnsupportedNestedTypeMessage]:
     # Handle general callables.
-    if default_instance not in MISSING_SINGLETONS:
+    if not is_missing(default_instance):
         return UnsupportedNestedTypeMessage(
             "`default_instance` is supported only for select types:"
             " dataclasses, lists, NamedTuple, TypedDict, etc."
@@ -516,12 +580,14 @@ def _field_list_from_params(
     docstring = inspect.getdoc(f)
     docstring_from_arg_name = {}
     if docstring is not None:
+        _stats.increment("docstring_parses")
         for param_doc in docstring_parser.parse(docstring).params:
             docstring_from_arg_name[param_doc.arg_name] = param_doc.description
     del docstring
 
     # This will throw a type error for torch.device, typing.Dict, etc.
     try:
+        _stats.increment("type_hints")
         hints = get_type_hints(f, include_extras=True)
     except TypeError:
         return UnsupportedNestedTypeMessage(f"Could not get hints for {f}!")
@@ -589,10 +655,7 @@ def _get_dataclass_field_default(
         return MISSING_PROP
 
     # Try grabbing default from parent instance.
-    if (
-        parent_default_instance not in MISSING_SINGLETONS
-        and parent_default_instance is not None
-    ):
+    if not is_missing(parent_default_instance) and parent_default_instance is not None:
         # Populate default from some parent, eg `default_instance` in `dcargs.cli()`.
         if hasattr(parent_default_instance, field.name):
             return getattr(parent_default_instance, field.name)
@@ -605,7 +668,7 @@ def _get_dataclass_field_default(
             )
 
     # Try grabbing default from dataclass field.
-    if field.default not in MISSING_SINGLETONS:
+    if not is_missing(field.default):
         default = field.default
         # Note that dataclasses.is_dataclass() will also return true for dataclass
         # _types_, not just instances.
@@ -626,8 +689,33 @@ def _get_dataclass_field_default(
         dataclasses.is_dataclass(field.type)
         and field.default_factory is field.type
     ):
+        if _default_factory_can_be_deferred(field.type):
+            return LazyDefault(field.default_factory)
         return field.default_factory()
 
     # Otherwise, no default. This is different from MISSING, because MISSING propagates
     # to children. We could revisit this design to make it clearer.
     return MISSING_NONPROP
+
+
+@_caching.cached("fields.default_factory_can_be_deferred")
+def _default_factory_can_be_deferred(typ: Type) -> bool:
+    """Returns True if the default for a field can be evaluated lazily. This is the case
+    for types that are parsed directly, where defaults are only needed for
+    instantiation and helptext.
+
+    Nested types, booleans (which may become flags), and dictionaries (which become
+    nested when a default is set) need defaults when the parser is built."""
+    typ = _resolver.unwrap_annotated(typ)[0]
+    if typ is bool or _resolver.unwrap_origin_strip_extras(typ) in (
+        dict,
+        collections.abc.Mapping,
+    ):
+        return False
+    try:
+        if is_nested_type(typ, MISSING_NONPROP):
+            return False
+        _instantiators.instantiator_from_type(typ, {})
+    except _instantiators.UnsupportedTypeAnnotationError:
+        return False
+    return True
@@ -34,11 +34,13 @@ import collections.abc
 import dataclasses
 import enum
 import inspect
+import re
 from collections import deque
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Hashable,
     Iterable,
     List,
@@ -53,7 +55,7 @@ from typing import (
 
 from typing_extensions import Annotated, Final, Literal, get_args, get_origin
 
-from . import _strings
+from . import _caching, _stats, _strings
 
 _StandardInstantiator = Callable[[List[str]], Any]
 # Special case: the only time that argparse doesn't give us a string is when the
@@ -75,9 +77,19 @@ class InstantiatorMetadata:
     # sequences, multiple arguments, etc, manually.
     metavar: str
     choices: Optional[Tuple[str, ...]]
+    # Hashed copy of `choices`, for constant-time membership checks.
+    choices_set: Optional[FrozenSet[str]] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.choices_set = None if self.choices is None else frozenset(self.choices)
+
+    def choices_match(self, strings: List[str]) -> bool:
+        return self.choices_set is None or self.choices_set.issuperset(strings)
 
     def check_choices(self, strings: List[str]) -> None:
-        if self.choices is not None and any(s not in self.choices for s in strings):
+        if not self.choices_match(strings):
             raise ValueError(f"invalid choice: {strings} (choose from {self.choices}))")
 
 
@@ -93,6 +105,15 @@ _builtin_set = set(
 )
 
 
+@_caching.cached(
+    "instantiators.instantiator_from_type",
+    # Metavars depend on whether colors are enabled.
+    key=lambda typ, type_from_typevar: (
+        typ,
+        frozenset(type_from_typevar.items()),
+        _strings.colors_enabled(),
+    ),
+)
 def instantiator_from_type(
     typ: Type, type_from_typevar: Dict[TypeVar, Type]
 ) -> Tuple[Instantiator, InstantiatorMetadata]:
@@ -103,6 +124,7 @@ def instantiator_from_type(
       strings. The latter applies when argparse's `nargs` parameter is set.
     - A metadata structure, which specifies parameters for argparse.
     """
+    _stats.increment("instantiators")
 
     # Resolve typevars.
     if typ in type_from_typevar:
@@ -126,7 +148,7 @@ def instantiator_from_type(
 
         return instantiator, InstantiatorMetadata(
             nargs=1,
-            metavar="{" + _strings.format_metavar("None") + "}",
+            metavar=_strings.choices_metavar(("None",)),
             choices=("None",),
         )
 
@@ -215,7 +237,7 @@ def instantiator_from_type(
         nargs=1,
         metavar=_strings.format_metavar(typ.__name__.upper())
         if auto_choices is None
-        else "{" + ",".join(map(_strings.format_metavar, map(str, auto_choices))) + "}",
+        else _strings.choices_metavar(auto_choices),
         choices=auto_choices,
     )
 
@@ -331,6 +353,24 @@ def _instantiator_from_tuple(
             assert isinstance(b.nargs, int)
             nargs += b.nargs
 
+        # Fast path for tuples of scalars: convert strings directly, without slicing.
+        converters = tuple(
+            _scalar_converter_from_type(t, type_from_typevar) for t in types
+        )
+        if all(converter is not None for converter in converters):
+
+            def scalar_tuple_instantiator(strings: List[str]) -> Any:
+                assert len(strings) == nargs
+                return tuple(
+                    convert(s) for convert, s in zip(converters, strings)  # type: ignore
+                )
+
+            return scalar_tuple_instantiator, InstantiatorMetadata(
+                nargs=nargs,
+                metavar=" ".join(m.metavar for m in metas),
+                choices=None,
+            )
+
         def fixed_length_tuple_instantiator(strings: List[str]) -> Any:
             assert len(strings) == nargs
 
@@ -426,14 +466,22 @@ def _instantiator_from_union(
     metavar: str
     metavar = _join_union_metavars(map(lambda x: cast(str, x.metavar), metas))
 
-    def union_instantiator(strings: List[str]) -> Any:
+    # Cheap checks for ruling out options before calling their instantiators. Most
+    # inputs match exactly one option, so we can usually skip the exception-driven
+    # fallback.
+    prefilters = [
+        _make_union_prefilter(t, meta, type_from_typevar)
+        for t, meta in zip(options, metas)
+    ]
+
+    def get_errors(strings: List[str]) -> List[str]:
+        """Get an error message for each option. Only called when all options
+        fail."""
         metadata: InstantiatorMetadata
         errors = []
         for i, (instantiator, metadata) in enumerate(zip(instantiators, metas)):
             # Check choices.
-            if metadata.choices is not None and any(
-                x not in metadata.choices for x in strings
-            ):
+            if not metadata.choices_match(strings):
                 errors.append(
                     f"{options[i]}: {strings} does not match choices {metadata.choices}"
                 )
@@ -442,18 +490,30 @@ def _instantiator_from_union(
             # Try passing input into instantiator.
             if len(strings) == metadata.nargs or (metadata.nargs == "+"):
                 try:
-                    return instantiator(strings)  # type: ignore
+                    instantiator(strings)  # type: ignore
                 except ValueError as e:
-                    # Failed, try next instantiator.
                     errors.append(f"{options[i]}: {e.args[0]}")
             else:
                 errors.append(
                     f"{options[i]}: input length {len(strings)} did not match expected"
                     f" argument count {metadata.nargs}"
                 )
+        return errors
+
+    def union_instantiator(strings: List[str]) -> Any:
+        for prefilter, instantiator in zip(prefilters, instantiators):
+            if not prefilter(strings):
+                continue
+            try:
+                return instantiator(strings)  # type: ignore
+            except ValueError:
+                # Failed, try next instantiator.
+                continue
+
+        # Error messages are only built when all options fail.
         raise ValueError(
             f"no type in {options} could be instantiated from"
-            f" {strings}.\n\nGot errors:  \n- " + "\n- ".join(errors)
+            f" {strings}.\n\nGot errors:  \n- " + "\n- ".join(get_errors(strings))
         )
 
     return union_instantiator, InstantiatorMetadata(
@@ -463,6 +523,44 @@ def _instantiator_from_union(
     )
 
 
+# Supersets of the strings accepted by `int()` and `float()`. Note that `\d` matches all
+# Unicode decimal characters, which are also accepted.
+_int_like_pattern = re.compile(r"\s*[+-]?[\d_]+\s*")
+_float_like_pattern = re.compile(
+    r"\s*[+-]?(?:[\d_.eE+-]+|inf|infinity|nan)\s*", re.IGNORECASE
+)
+
+
+def _make_union_prefilter(
+    typ: Type, meta: InstantiatorMetadata, type_from_typevar: Dict[TypeVar, Type]
+) -> Callable[[List[str]], bool]:
+    """Make a function for quickly ruling out union options. Returns False if the
+    option's instantiator will definitely fail for a list of strings. Should never
+    return False for valid inputs."""
+    typ = _unwrap_scalar_type(typ, type_from_typevar)
+
+    nargs = meta.nargs
+    choices = meta.choices_set
+    pattern = (
+        _int_like_pattern
+        if typ is int
+        else _float_like_pattern
+        if typ is float
+        else None
+    )
+
+    def prefilter(strings: List[str]) -> bool:
+        if nargs != "+" and len(strings) != nargs:
+            return False
+        if choices is not None and not choices.issuperset(strings):
+            return False
+        if pattern is not None and not all(map(pattern.fullmatch, strings)):
+            return False
+        return True
+
+    return prefilter
+
+
 def _instantiator_from_dict(
     typ: Type, type_from_typevar: Dict[TypeVar, Type]
 ) -> Tuple[Instantiator, InstantiatorMetadata]:
@@ -496,18 +594,8 @@ def _instantiator_from_dict(
             v = strings[index : index + val_nargs]
             index += val_nargs
 
-            if key_meta.choices is not None and any(
-                kj not in key_meta.choices for kj in k
-            ):
-                raise ValueError(
-                    f"invalid choice: {k} (choose from {key_meta.choices}))"
-                )
-            if val_meta.choices is not None and any(
-                vj not in val_meta.choices for vj in v
-            ):
-                raise ValueError(
-                    f"invalid choice: {v} (choose from {val_meta.choices}))"
-                )
+            key_meta.check_choices(k)
+            val_meta.check_choices(v)
             out[key_instantiator(k)] = val_instantiator(v)  # type: ignore
         return out
 
@@ -538,6 +626,22 @@ def _instantiator_from_sequence(
         type_from_typevar,
         allow_sequences="fixed_length",
     )
+    meta = InstantiatorMetadata(
+        nargs="+",
+        metavar=_strings.multi_metavar_from_single(inner_meta.metavar),
+        choices=inner_meta.choices,
+    )
+    assert container_type is not None
+
+    # Fast path for sequences of scalars: convert all strings in one pass, without
+    # slicing.
+    convert = _scalar_converter_from_type(contained_type, type_from_typevar)
+    if convert is not None:
+
+        def scalar_sequence_instantiator(strings: List[str]) -> Any:
+            return container_type(map(convert, strings))  # type: ignore
+
+        return scalar_sequence_instantiator, meta
 
     def sequence_instantiator(strings: List[str]) -> Any:
         # Validate nargs.
@@ -553,14 +657,116 @@ def _instantiator_from_sequence(
         step = inner_meta.nargs if isinstance(inner_meta.nargs, int) else 1
         for i in range(0, len(strings), step):
             out.append(make(strings[i : i + inner_meta.nargs]))  # type: ignore
-        assert container_type is not None
-        return container_type(out)
+        return container_type(out)  # type: ignore
 
-    return sequence_instantiator, InstantiatorMetadata(
-        nargs="+",
-        metavar=_strings.multi_metavar_from_single(inner_meta.metavar),
-        choices=inner_meta.choices,
-    )
+    return sequence_instantiator, meta
+
+
+def _unwrap_scalar_type(typ: Type, type_from_typevar: Dict[TypeVar, Type]) -> Type:
+    """Resolve typevars and strip Annotated/Final wrappers."""
+    while True:
+        if typ in type_from_typevar:
+            typ = type_from_typevar[typ]  # type: ignore
+        elif get_origin(typ) in (Annotated, Final):
+            typ = get_args(typ)[0]
+        else:
+            break
+    return typ
+
+
+def _scalar_table_from_type(typ: Type) -> Optional[Dict[str, Any]]:
+    """For types with a fixed set of choices (bools, enums, literals, and None), get a
+    mapping from strings to values."""
+    if typ is NoneType:
+        return {"None": None}
+    elif typ is bool:
+        return {"True": True, "False": False}
+    elif isinstance(typ, type) and issubclass(typ, enum.Enum):
+        return {x.name: x for x in typ}
+    elif get_origin(typ) is Literal:
+        value_from_string: Dict[str, Any] = {}
+        for choice in get_args(typ):
+            value_from_string.setdefault(
+                choice.name if isinstance(choice, enum.Enum) else str(choice), choice
+            )
+        return value_from_string
+    return None
+
+
+def _scalar_converter_from_type(
+    typ: Type, type_from_typevar: Dict[TypeVar, Type]
+) -> Optional[Callable[[str], Any]]:
+    """For scalar types that are parsed from a single string (int, float, str, bool,
+    enums, literals, and unions over them), return a function that converts one
+    string. Choices are validated by the converter, using a lookup table. Returns
+    `None` for other types.
+
+    Used for instantiating sequences of scalars without going through the general
+    per-element instantiators."""
+    typ = _unwrap_scalar_type(typ, type_from_typevar)
+
+    if typ in (int, float, str):
+        return typ
+
+    if get_origin(typ) is Union:
+        return _scalar_union_converter(typ, type_from_typevar)
+
+    value_from_string = _scalar_table_from_type(typ)
+    if value_from_string is None:
+        return None
+
+    def convert(string: str) -> Any:
+        try:
+            return value_from_string[string]  # type: ignore
+        except KeyError:
+            raise ValueError(
+                f"invalid choice: {string} (choose from {tuple(value_from_string)})"  # type: ignore
+            )
+
+    return convert
+
+
+def _scalar_union_converter(
+    typ: Type, type_from_typevar: Dict[TypeVar, Type]
+) -> Optional[Callable[[str], Any]]:
+    """Converter for unions over scalar types. Each string is dispatched using a cheap
+    check per option; see `_scalar_converter_from_type()`."""
+    options = list(get_args(typ))
+    if NoneType in options:
+        # Match the ordering in `_instantiator_from_union()`.
+        options.remove(NoneType)
+        options.insert(0, NoneType)
+
+    # For each option: a check that rules out strings, and a converter.
+    dispatch: List[Tuple[Callable[[str], Any], Callable[[str], Any]]] = []
+    for option in options:
+        option = _unwrap_scalar_type(option, type_from_typevar)
+        value_from_string = _scalar_table_from_type(option)
+        if value_from_string is not None:
+            dispatch.append((value_from_string.__contains__, value_from_string.get))
+            continue
+
+        convert = _scalar_converter_from_type(option, type_from_typevar)
+        if convert is None:
+            return None
+        if option is int:
+            dispatch.append((_int_like_pattern.fullmatch, convert))
+        elif option is float:
+            dispatch.append((_float_like_pattern.fullmatch, convert))
+        else:
+            dispatch.append((lambda string: True, convert))
+
+    def convert_union(string: str) -> Any:
+        for matches, convert in dispatch:
+            if not matches(string):
+                continue
+            try:
+                return convert(string)
+            except ValueError:
+                continue
+        raise ValueError(f"no type in {options} could be instantiated from {string}")
+
+    return convert_union
 
 
 def _instantiator_from_literal(
@@ -568,13 +774,15 @@ def _instantiator_from_literal(
 ) -> Tuple[Instantiator, InstantiatorMetadata]:
     choices = get_args(typ)
     str_choices = tuple(x.name if isinstance(x, enum.Enum) else str(x) for x in choices)
+    value_from_string = _scalar_table_from_type(typ)
+    assert value_from_string is not None
     return (
         # Note that if string is not in str_choices, it will be caught from setting
         # `choices` below.
-        lambda strings: choices[str_choices.index(strings[0])],
+        lambda strings: value_from_string[strings[0]],  # type: ignore
         InstantiatorMetadata(
             nargs=1,
-            metavar="{" + ",".join(map(_strings.format_metavar, str_choices)) + "}",
+            metavar=_strings.choices_metavar(str_choices),
             choices=str_choices,
         ),
     )
@@ -0,0 +1,154 @@
+"""Proxy objects for lazily instantiated fields; see `dcargs.conf.Lazy`."""
+from __future__ import annotations
+
+import operator
+import threading
+from typing import Any, Callable, Dict
+
+
+class LazyProxy:
+    """Thread-safe proxy that calls a factory the first time it's used, and forwards
+    everything to the result.
+
+    Attribute access (including `__class__`, so `isinstance()` checks pass), common
+    operators, and protocols like iteration and pickling are forwarded. If the factory
+    raises an exception, it will be called again on the next access."""
+
+    __slots__ = ("_lazy_factory", "_lazy_lock", "_lazy_value")
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        object.__setattr__(self, "_lazy_factory", factory)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+
+    def __getattribute__(self, name: str) -> Any:
+        return getattr(resolve(self), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(resolve(self), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(resolve(self), name)
+
+    def __dir__(self):
+        return dir(resolve(self))
+
+    def __repr__(self) -> str:
+        return repr(resolve(self))
+
+    def __str__(self) -> str:
+        return str(resolve(self))
+
+    def __bool__(self) -> bool:
+        return bool(resolve(self))
+
+    def __hash__(self) -> int:
+        return hash(resolve(self))
+
+    def __len__(self) -> int:
+        return len(resolve(self))
+
+    def __iter__(self):
+        return iter(resolve(self))
+
+    def __contains__(self, item: Any) -> bool:
+        return item in resolve(self)
+
+    def __getitem__(self, key: Any) -> Any:
+        return resolve(self)[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        resolve(self)[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del resolve(self)[key]
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return resolve(self)(*args, **kwargs)
+
+    def __enter__(self) -> Any:
+        return resolve(self).__enter__()
+
+    def __exit__(self, *args) -> Any:
+        return resolve(self).__exit__(*args)
+
+    def __reduce_ex__(self, protocol):
+        # Pickle and copy the underlying object.
+        return resolve(self).__reduce_ex__(protocol)
+
+
+def _make_forwarded_operator(op: Callable[..., Any], reflected: bool) -> Any:
+    if reflected:
+        return lambda self, other: op(other, resolve(self))
+    return lambda self, *args: op(resolve(self), *args)
+
+
+_op: Callable[..., Any]
+
+# Comparison, arithmetic, and bitwise operators.
+for _name, _op in {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "matmul": operator.matmul,
+    "truediv": operator.truediv,
+    "floordiv": operator.floordiv,
+    "mod": operator.mod,
+    "pow": operator.pow,
+    "and": operator.and_,
+    "or": operator.or_,
+    "xor": operator.xor,
+    "lshift": operator.lshift,
+    "rshift": operator.rshift,
+}.items():
+    setattr(LazyProxy, f"__{_name}__", _make_forwarded_operator(_op, reflected=False))
+    if _name not in ("eq", "ne", "lt", "le", "gt", "ge"):
+        setattr(
+            LazyProxy, f"__r{_name}__", _make_forwarded_operator(_op, reflected=True)
+        )
+_unary_operators: Dict[str, Callable[[Any], Any]] = {
+    "neg": operator.neg,
+    "pos": operator.pos,
+    "abs": operator.abs,
+    "invert": operator.invert,
+    "int": int,
+    "float": float,
+    "index": operator.index,
+}
+for _name, _op in _unary_operators.items():
+    setattr(LazyProxy, f"__{_name}__", _make_forwarded_operator(_op, reflected=False))
+
+
+def resolve(proxy: LazyProxy) -> Any:
+    """Get the object behind a lazy proxy, calling the factory if needed."""
+    try:
+        return object.__getattribute__(proxy, "_lazy_value")
+    except AttributeError:
+        pass
+
+    with object.__getattribute__(proxy, "_lazy_lock"):
+        # Check again: another thread may have called the factory while we were
+        # waiting for the lock.
+        try:
+            return object.__getattribute__(proxy, "_lazy_value")
+        except AttributeError:
+            pass
+
+        value = object.__getattribute__(proxy, "_lazy_factory")()
+        object.__setattr__(proxy, "_lazy_value", value)
+        object.__setattr__(proxy, "_lazy_factory", None)
+        return value
+
+
+def is_evaluated(proxy: LazyProxy) -> bool:
+    """Returns True if the factory of a lazy proxy has already been called."""
+    try:
+        object.__getattribute__(proxy, "_lazy_value")
+        return True
+    except AttributeError:
+        return False
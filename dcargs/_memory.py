@@ -0,0 +1,228 @@
+"""Tools for measuring how much memory is used by parser specifications and argparse
+parsers. See `dcargs.memory_report()`."""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import sys
+import tracemalloc
+import types
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, TypeVar, Union
+
+from . import _arguments, _cli, _parsers, _strings
+
+OutT = TypeVar("OutT")
+
+# Objects of these types are shared across the process, so we don't attribute them to
+# individual parsers.
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.CodeType,
+    types.BuiltinFunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class MemoryReport:
+    """Memory used by the parser for a callable. Returned by `dcargs.memory_report()`.
+
+    Sizes are attributed to prefixes, which correspond to argument groups: `""` for
+    the root, `"inner"` for arguments of a nested field `inner`, etc. Objects shared
+    between prefixes are counted once, for the first prefix that references them."""
+
+    spec_bytes: int
+    """Memory allocated while building the parser specification, as measured by
+    `tracemalloc`. This includes entries added to dcargs's in-memory caches."""
+    parser_bytes: int
+    """Memory allocated while building the argparse parser, as measured by
+    `tracemalloc`."""
+    spec_bytes_from_prefix: Dict[str, int]
+    """Sizes of specification object graphs: argument definitions, including lowered
+    arguments and field defaults, and the parser specifications that contain them."""
+    parser_bytes_from_prefix: Dict[str, int]
+    """Sizes of argparse object graphs: actions, and the parsers that contain them.
+    Subparsers are attributed to the prefix of their subcommand."""
+
+    def __str__(self) -> str:
+        prefixes = sorted(
+            self.spec_bytes_from_prefix.keys() | self.parser_bytes_from_prefix.keys(),
+            key=lambda prefix: -self.spec_bytes_from_prefix.get(prefix, 0)
+            - self.parser_bytes_from_prefix.get(prefix, 0),
+        )
+        width = max([len("(root)")] + [len(prefix) for prefix in prefixes])
+        lines = [
+            f"Allocated while building specification: {_format_bytes(self.spec_bytes)}",
+            f"Allocated while building parser: {_format_bytes(self.parser_bytes)}",
+            "",
+            f"{'prefix':<{width}}  {'spec':>10}  {'argparse':>10}",
+        ]
+        for prefix in prefixes:
+            lines.append(
+                f"{prefix if prefix != '' else '(root)':<{width}}"
+                f"  {_format_bytes(self.spec_bytes_from_prefix.get(prefix, 0)):>10}"
+                f"  {_format_bytes(self.parser_bytes_from_prefix.get(prefix, 0)):>10}"
+            )
+        return "\n".join(lines)
+
+
+def memory_report(
+    f: Union[Type[OutT], Callable[..., OutT]],
+    *,
+    default: Optional[OutT] = None,
+) -> MemoryReport:
+    """Build the parser for `f` without parsing anything, and report how much memory
+    it uses. Useful for finding the parts of a large config that are expensive to keep
+    around in long-running processes that build many CLIs.
+
+    Results depend on the state of dcargs's in-memory caches; for consistent numbers,
+    call `dcargs.cache_clear()` first.
+
+    Args:
+        f: Callable.
+        default: Same as `dcargs.cli()`.
+
+    Returns:
+        Memory usage, which can be printed as a table.
+    """
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        spec = _cli._build_spec(
+            f,
+            prog=None,
+            description=None,
+            default=default,
+            deprecated_kwargs={},
+        )
+        spec_done = tracemalloc.get_traced_memory()[0]
+        parser = _cli._build_parser(spec)
+        parser_done = tracemalloc.get_traced_memory()[0]
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    # Argparse actions are matched to prefixes by their first option string, or their
+    # destination for positional arguments and subparsers.
+    prefix_from_action_key: Dict[str, str] = {}
+    spec_bytes_from_prefix: Dict[str, int] = {}
+    seen: Set[int] = set()
+
+    def visit_spec(parser_definition: _parsers.ParserSpecification) -> None:
+        for arg in parser_definition.args:
+            prefix_from_action_key[_action_key_from_arg(arg)] = arg.prefix
+            _add(spec_bytes_from_prefix, arg.prefix, _graph_size(arg, seen))
+        for subparsers in parser_definition.subparsers_from_name.values():
+            prefix_from_action_key[
+                _strings.make_subparser_dest(subparsers.prefix)
+            ] = subparsers.prefix
+            for child in subparsers.parser_from_name.values():
+                visit_spec(child)
+            _add(
+                spec_bytes_from_prefix,
+                subparsers.prefix,
+                _graph_size(subparsers, seen),
+            )
+        _add(
+            spec_bytes_from_prefix,
+            parser_definition.prefix,
+            _graph_size(parser_definition, seen),
+        )
+
+    visit_spec(spec.parser_definition)
+
+    parser_bytes_from_prefix: Dict[str, int] = {}
+    seen = set()
+
+    def visit_parser(parser: argparse.ArgumentParser, parser_prefix: str) -> None:
+        for action in parser._actions:
+            key = action.option_strings[0] if action.option_strings else action.dest
+            prefix = prefix_from_action_key.get(key, parser_prefix)
+            if isinstance(action, argparse._SubParsersAction):
+                for child in action.choices.values():
+                    if id(child) not in seen:
+                        visit_parser(child, prefix)
+            # Actions reference the parser or group that contains them, which is
+            # counted separately. Lazily generated helptext references argument
+            # definitions, which are counted as part of the specification.
+            _add(
+                parser_bytes_from_prefix,
+                prefix,
+                _graph_size(
+                    action,
+                    seen,
+                    stop_at=(
+                        argparse._ActionsContainer,
+                        _arguments.ArgumentDefinition,
+                    ),
+                ),
+            )
+        _add(
+            parser_bytes_from_prefix,
+            parser_prefix,
+            _graph_size(parser, seen, stop_at=(argparse.ArgumentParser,)),
+        )
+
+    visit_parser(parser, "")
+
+    return MemoryReport(
+        spec_bytes=spec_done - start,
+        parser_bytes=parser_done - spec_done,
+        spec_bytes_from_prefix=spec_bytes_from_prefix,
+        parser_bytes_from_prefix=parser_bytes_from_prefix,
+    )
+
+
+def _action_key_from_arg(arg: _arguments.ArgumentDefinition) -> str:
+    name_or_flag = arg.lowered.name_or_flag
+    return name_or_flag if len(name_or_flag) > 0 else _strings.dummy_field_name
+
+
+def _add(bytes_from_prefix: Dict[str, int], prefix: str, size: int) -> None:
+    bytes_from_prefix[prefix] = bytes_from_prefix.get(prefix, 0) + size
+
+
+def _graph_size(root: Any, seen: Set[int], stop_at: Tuple[Type[Any], ...] = ()) -> int:
+    """Total size of all objects reachable from `root`, skipping objects in `seen` and
+    objects that are shared across the process. `seen` is updated in place.
+
+    Objects that are instances of `stop_at`, other than the root, aren't followed."""
+    total = 0
+    stack = [root]
+    while len(stack) > 0:
+        obj = stack.pop()
+        if (
+            id(obj) in seen
+            or isinstance(obj, _SHARED_TYPES)
+            or (obj is not root and isinstance(obj, stop_at))
+        ):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, types.FunctionType):
+            # Don't follow function globals, which would reach entire modules. Closure
+            # variables and defaults are specific to the function.
+            for cell in obj.__closure__ or ():
+                try:
+                    stack.append(cell.cell_contents)
+                except ValueError:
+                    # Empty cell.
+                    pass
+            stack.extend(obj.__defaults__ or ())
+        else:
+            stack.extend(gc.get_referents(obj))
+    return total
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024  # type: ignore
+    return f"{size:.1f} GiB"
@@ -4,9 +4,20 @@ from __future__ import annotations
 import argparse
 import dataclasses
 import itertools
-from typing import Any, Callable, Dict, List, Optional, Set, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
-import termcolor
 from typing_extensions import get_args, get_origin
 
 from . import (
@@ -16,6 +27,8 @@ from . import (
     _fields,
     _instantiators,
     _resolver,
+    _slots,
+    _stats,
     _strings,
 )
 from .conf import _markers, _subcommands
@@ -23,6 +36,11 @@ from .conf import _markers, _subcommands
 T = TypeVar("T")
 
 
+def _format_group_name(nested_field_name: str) -> str:
+    return _strings.colored((nested_field_name + " arguments").strip(), attrs=["bold"])
+
+
+@_slots.add_slots()
 @dataclasses.dataclass(frozen=True)
 class ParserSpecification:
     """Each parser contains a list of arguments and optionally some subparsers."""
@@ -184,6 +202,35 @@ class ParserSpecification:
             prefix=prefix,
         )
 
+    def has_argument(self, name_or_flag: str) -> bool:
+        """Check if an argument with a given name or flag exists in this parser, or in
+        any of its subparsers."""
+        if any(arg.lowered.name_or_flag == name_or_flag for arg in self.args):
+            return True
+        return any(
+            child.has_argument(name_or_flag)
+            for subparsers in self.subparsers_from_name.values()
+            for child in subparsers.parser_from_name.values()
+        )
+
+    def has_argument_groups(self) -> bool:
+        """Check if any arguments belong to nested groups, in this parser or in any of
+        its subparsers."""
+        if any(_strings.make_field_name([arg.prefix]) != "" for arg in self.args):
+            return True
+        return any(
+            child.has_argument_groups()
+            for subparsers in self.subparsers_from_name.values()
+            for child in subparsers.parser_from_name.values()
+        )
+
+    def uses_help_group_flag(self) -> bool:
+        """Check if `--help-group` should be added. It's only useful when there are
+        nested groups, and arguments that already use the name take precedence."""
+        return self.has_argument_groups() and not self.has_argument(
+            _strings.help_group_flag
+        )
+
     def apply(self, parser: argparse.ArgumentParser) -> None:
         """Create defined arguments and subparsers."""
 
@@ -191,19 +238,14 @@ class ParserSpecification:
         parser.description = self.description
 
         # Make argument groups.
-        def format_group_name(nested_field_name: str) -> str:
-            return termcolor.colored(
-                (nested_field_name + " arguments").strip(), attrs=["bold"]
-            )
-
         group_from_prefix: Dict[str, argparse._ArgumentGroup] = {
             "": parser._action_groups[1],
         }
 
         # Break some API boundaries to rename the optional group.
-        parser._action_groups[1].title = format_group_name("")
+        parser._action_groups[1].title = _format_group_name("")
         positional_group = parser.add_argument_group(
-            termcolor.colored("positional arguments", attrs=["bold"])
+            _strings.colored("positional arguments", attrs=["bold"])
         )
         parser._action_groups = parser._action_groups[::-1]
 
@@ -215,7 +257,7 @@ class ParserSpecification:
                 and arg.prefix not in group_from_prefix
             ):
                 group_from_prefix[arg.prefix] = parser.add_argument_group(
-                    format_group_name(arg.prefix),
+                    _format_group_name(arg.prefix),
                     description=self.helptext_from_nested_class_field_name.get(
                         arg.prefix
                     ),
@@ -243,7 +285,57 @@ class ParserSpecification:
                     self, prev_subparser_tree_nodes
                 )
 
+    def format_group_help(self, group: str, formatter_class: Any) -> Iterator[str]:
+        """Format helptext for a single argument group, and all groups nested within
+        it. Subparsers are searched as well.
+
+        Helptext is yielded one group at a time, and only arguments in the requested
+        groups are passed to argparse; this is much cheaper than formatting the full
+        parser for large configs."""
+
+        def in_group(prefix: str) -> bool:
+            return prefix == group or prefix.startswith(group + ".")
+
+        # Subparsers often share groups, which we only want to print once.
+        seen_chunks: Set[str] = set()
+
+        def visit(parser_definition: ParserSpecification) -> Iterator[str]:
+            args_from_prefix: Dict[str, List[_arguments.ArgumentDefinition]] = {}
+            for arg in parser_definition.args:
+                if arg.lowered.help is not argparse.SUPPRESS and in_group(arg.prefix):
+                    args_from_prefix.setdefault(arg.prefix, []).append(arg)
+
+            for prefix, args in args_from_prefix.items():
+                parser = argparse.ArgumentParser(
+                    formatter_class=formatter_class, add_help=False
+                )
+                argparse_group = parser.add_argument_group(
+                    _format_group_name(prefix),
+                    description=parser_definition.helptext_from_nested_class_field_name.get(
+                        prefix
+                    ),
+                )
+                for arg in args:
+                    arg.add_argument(argparse_group)
+
+                formatter = parser._get_formatter()
+                formatter.start_section(argparse_group.title)
+                formatter.add_text(argparse_group.description)
+                formatter.add_arguments(argparse_group._group_actions)
+                formatter.end_section()
+                chunk = formatter.format_help()
+                if chunk not in seen_chunks:
+                    seen_chunks.add(chunk)
+                    yield chunk
+
+            for subparsers in parser_definition.subparsers_from_name.values():
+                for subparser_def in subparsers.parser_from_name.values():
+                    yield from visit(subparser_def)
 
+        return visit(self)
+
+
+@_slots.add_slots()
 @dataclasses.dataclass(frozen=True)
 class SubparsersSpecification:
     """Structure for defining subparsers. Each subparser is a parser with a name."""
@@ -326,16 +418,13 @@ class SubparsersSpecification:
 
         # Optional if: type hint is Optional[], or a default instance is provided.
         required = True
-        if field.default not in _fields.MISSING_SINGLETONS:
+        if not _fields.is_missing(field.default):
             required = False
 
         # If there are any required arguments in the default subparser, we should mark
         # the subparser group as a whole as required.
         default_name = None
-        if (
-            field.default is not None
-            and field.default not in _fields.MISSING_SINGLETONS
-        ):
+        if field.default is not None and not _fields.is_missing(field.default):
             # It's really hard to concretize a generic type at runtime, so we just...
             # don't. :-)
             if hasattr(type(field.default), "__parameters__"):
@@ -379,7 +468,7 @@ class SubparsersSpecification:
         description_parts = []
         if field.helptext is not None:
             description_parts.append(field.helptext)
-        if not required and field.default not in _fields.MISSING_SINGLETONS:
+        if not required and not _fields.is_missing(field.default):
             description_parts.append(f" (default: {default_name})")
         description = (
             # We use `None` instead of an empty string to prevent a line break from
@@ -399,7 +488,7 @@ class SubparsersSpecification:
             prefix=prefix,
             required=required,
             default_instance=field.default,
-            # if field.default not in _fields.MISSING_SINGLETONS
+            # if not _fields.is_missing(field.default)
             # else None,
             can_be_none=options != options_no_none,
         )
@@ -429,11 +518,12 @@ class SubparsersSpecification:
         subparser_tree_nodes: List[argparse.ArgumentParser] = []
         for p in prev_subparser_tree_nodes:
             # Add subparsers to every node in previous level of the tree.
+            _stats.increment("argparse_actions")
             argparse_subparsers = p.add_subparsers(
                 dest=_strings.make_subparser_dest(self.prefix),
                 description=self.description,
                 required=self.required,
-                title=termcolor.colored(title, attrs=["bold"]),
+                title=_strings.colored(title, attrs=["bold"]),
                 metavar=metavar,
             )
 
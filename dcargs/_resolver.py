@@ -18,6 +18,8 @@ from typing import (
 
 from typing_extensions import Annotated, get_args, get_origin, get_type_hints
 
+from . import _caching, _stats
+
 TypeOrCallable = TypeVar("TypeOrCallable", Type, Callable)
 
 
@@ -68,9 +70,14 @@ def resolve_generic_types(
 
 def resolved_fields(cls: Type) -> List[dataclasses.Field]:
     """Similar to dataclasses.fields, but resolves forward references."""
+    return list(_resolved_fields(cls))
+
 
+@_caching.cached("resolver.resolved_fields")
+def _resolved_fields(cls: Type) -> Tuple[dataclasses.Field, ...]:
     assert dataclasses.is_dataclass(cls)
     fields = []
+    _stats.increment("type_hints")
     annotations = get_type_hints(cls, include_extras=True)
     for field in dataclasses.fields(cls):
         # Avoid mutating original field.
@@ -81,7 +88,7 @@ def resolved_fields(cls: Type) -> List[dataclasses.Field]:
 
         fields.append(field)
 
-    return fields
+    return tuple(fields)
 
 
 def is_namedtuple(cls: Type) -> bool:
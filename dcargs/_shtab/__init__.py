@@ -147,6 +147,56 @@ def get_public_subcommands(sub):
     return {k for k, v in sub.choices.items() if id(v) in public_parsers}
 
 
+class ParserSignatures(object):
+    """
+    Structural signatures for parsers, used to emit shared completion code for
+    identical subparsers. These are common: subcommands that follow a group of
+    subcommands are duplicated for every member of the group.
+
+    Structures are interned to integer ids, so comparing signatures is cheap and
+    computing them is linear in the number of distinct parsers.
+    """
+
+    def __init__(self) -> None:
+        self._id_from_structure: Dict[Any, int] = {}
+        self._id_from_parser: Dict[int, int] = {}
+
+    def get(self, parser: ArgumentParser) -> int:
+        """Get the signature id of a parser."""
+        parser_id = id(parser)
+        if parser_id not in self._id_from_parser:
+            structure = (
+                str(parser.description or ""),
+                tuple(map(self._get_action_structure, parser._actions)),
+            )
+            self._id_from_parser[parser_id] = self._id_from_structure.setdefault(
+                structure, len(self._id_from_structure)
+            )
+        return self._id_from_parser[parser_id]
+
+    def _get_action_structure(self, action: Action) -> Any:
+        if isinstance(action.choices, dict):
+            public_cmds = get_public_subcommands(action)
+            choices: Any = tuple(
+                (cmd, self.get(subparser))
+                for cmd, subparser in action.choices.items()
+                if cmd in public_cmds
+            )
+        elif action.choices:
+            choices = tuple(map(repr, action.choices))
+        else:
+            choices = None
+        return (
+            type(action),
+            tuple(action.option_strings),
+            action.dest,
+            action.nargs,
+            action.help if action.help == SUPPRESS else str(action.help or ""),
+            choices,
+            repr(getattr(action, "complete", None)),
+        )
+
+
 def get_bash_commands(root_parser, root_prefix, choice_functions=None):
     """
     Recursive subcommand parser traversal, returning lists of information on
@@ -159,6 +209,7 @@ def get_bash_commands(root_parser, root_prefix, choice_functions=None):
       compgens  : list of shtab `.complete` functions corresponding to actions
       choices  : list of choices corresponding to actions
       nargs  : list of number of args allowed for each action (if not 0 or 1)
+      aliases  : list of prefixes that reuse definitions from an identical parser
     """
     choice_type2fn = {k: v["bash"] for k, v in CHOICE_FUNCTIONS.items()}
     if choice_functions:
@@ -175,6 +226,10 @@ def get_bash_commands(root_parser, root_prefix, choice_functions=None):
             [],
         )
 
+    signatures = ParserSignatures()
+    prefix_from_signature = {}
+    aliases = []
+
     def recurse(parser, prefix):
         """recurse through subparsers, appending to the return lists"""
         subparsers = []
@@ -183,6 +238,16 @@ def get_bash_commands(root_parser, root_prefix, choice_functions=None):
         choices = []
         nargs = []
 
+        # identical parsers share definitions; the completion function switches to
+        # the aliased prefix when a subcommand is entered
+        signature = signatures.get(parser)
+        if signature in prefix_from_signature:
+            aliases.append(
+                "{}_alias={}".format(prefix, prefix_from_signature[signature])
+            )
+            return subparsers, option_strings, compgens, choices, nargs
+        prefix_from_signature[signature] = prefix
+
         # temp lists for recursion results
         sub_subparsers = []
         sub_option_strings = []
@@ -340,7 +405,7 @@ def get_bash_commands(root_parser, root_prefix, choice_functions=None):
 
         return subparsers, option_strings, compgens, choices, nargs
 
-    return recurse(root_parser, root_prefix)
+    return (*recurse(root_parser, root_prefix), aliases)
 
 
 @mark_completer("bash")
@@ -351,9 +416,14 @@ def complete_bash(parser, root_prefix=None, preamble="", choice_functions=None):
     See `complete` for arguments.
     """
     root_prefix = wordify("_shtab_" + (root_prefix or parser.prog))
-    subparsers, option_strings, compgens, choices, nargs = get_bash_commands(
-        parser, root_prefix, choice_functions=choice_functions
-    )
+    (
+        subparsers,
+        option_strings,
+        compgens,
+        choices,
+        nargs,
+        aliases,
+    ) = get_bash_commands(parser, root_prefix, choice_functions=choice_functions)
 
     # References:
     # - https://www.gnu.org/software/bash/manual/html_node/
@@ -374,6 +444,8 @@ ${choices}
 
 ${nargs}
 
+${aliases}
+
 ${preamble}
 # $1=COMP_WORDS[1]
 _shtab_compgen_files() {
@@ -392,6 +464,11 @@ _shtab_replace_nonword() {
 
 # set default values (called for the initial parser & any subparsers)
 _set_parser_defaults() {
+  local alias_var="${prefix}_alias"
+  if [ -n "${!alias_var}" ]; then
+    prefix="${!alias_var}"
+  fi
+
   local subparsers_var="${prefix}_subparsers[@]"
   sub_parsers=${!subparsers_var}
 
@@ -495,6 +572,7 @@ complete -o filenames -F ${root_prefix} ${prog}"""
         compgens="\n".join(compgens),
         choices="\n".join(choices),
         nargs="\n".join(nargs),
+        aliases="\n".join(aliases),
         preamble=(
             "\n# Custom Preamble\n" + preamble + "\n# End Custom Preamble\n"
             if preamble
@@ -561,7 +639,7 @@ def complete_zsh(parser, root_prefix=None, preamble="", choice_functions=None):
     def format_positional(opt):
         return '"{nargs}:{help}:{pattern}"'.format(
             nargs={"+": "(*)", "*": "(*):"}.get(opt.nargs, ""),
-            help=escape_zsh((opt.help or opt.dest).strip().split("\n")[0]),
+            help=escape_zsh(str(opt.help or opt.dest).strip().split("\n")[0]),
             pattern=complete2pattern(opt.complete, "zsh", choice_type2fn)
             if hasattr(opt, "complete")
             else (
@@ -588,6 +666,10 @@ def complete_zsh(parser, root_prefix=None, preamble="", choice_functions=None):
         }
     }
 
+    # identical subparsers share option arrays and functions
+    signatures = ParserSignatures()
+    prefix_from_signature = {signatures.get(parser): root_prefix}
+
     def recurse(parser, prefix, paths=None):
         paths = paths or []
         subcmds = []
@@ -606,6 +688,23 @@ def complete_zsh(parser, root_prefix=None, preamble="", choice_functions=None):
                         continue
                     log.debug("subcommand:%s", cmd)
 
+                    new_pref = prefix + "_" + wordify(cmd)
+                    signature = signatures.get(subparser)
+                    if signature in prefix_from_signature:
+                        alias = prefix_from_signature[signature]
+                        all_commands[new_pref] = {
+                            "cmd": cmd,
+                            "help": (subparser.description or "")
+                            .strip()
+                            .split("\n")[0],
+                            "paths": [*paths, cmd],
+                            "commands": all_commands[alias]["commands"],
+                            "alias": alias,
+                        }
+                        subcmds.append(new_pref)
+                        log.debug("subcommand:%s:alias:%s", cmd, alias)
+                        continue
+
                     # optionals
                     arguments = [
                         format_optional(opt)
@@ -621,7 +720,6 @@ def complete_zsh(parser, root_prefix=None, preamble="", choice_functions=None):
                         if opt.help != SUPPRESS
                     )
 
-                    new_pref = prefix + "_" + wordify(cmd)
                     options = all_commands[new_pref] = {
                         "cmd": cmd,
                         "help": (subparser.description or "").strip().split("\n")[0],
@@ -635,6 +733,7 @@ def complete_zsh(parser, root_prefix=None, preamble="", choice_functions=None):
                         if pref in all_commands
                     }
                     subcmds.extend([*new_subcmds, new_pref])
+                    prefix_from_signature[signature] = new_pref
                     log.debug("subcommands:%s:%s", cmd, options)
         return subcmds
 
@@ -647,7 +746,7 @@ def complete_zsh(parser, root_prefix=None, preamble="", choice_functions=None):
     subcommands = {
         prefix: options
         for prefix, options in all_commands.items()
-        if options.get("commands")
+        if options.get("commands") and "alias" not in options
     }
     subcommands.setdefault(root_prefix, all_commands[root_prefix])
     log.debug("subcommands:%s:%s", root_prefix, sorted(all_commands))
@@ -655,10 +754,8 @@ def complete_zsh(parser, root_prefix=None, preamble="", choice_functions=None):
     def command_case(prefix, options):
         name = options["cmd"]
         commands = options["commands"]
-        case_fmt_on_no_sub = (
-            """{name}) _arguments -C ${prefix}_{name_wordify}_options ;;"""
-        )
-        case_fmt_on_sub = """{name}) {prefix}_{name_wordify} ;;"""
+        case_fmt_on_no_sub = """{name}) _arguments -C ${target}_options ;;"""
+        case_fmt_on_sub = """{name}) {target} ;;"""
 
         cases = []
         for _, options in sorted(commands.items()):
@@ -666,8 +763,7 @@ def complete_zsh(parser, root_prefix=None, preamble="", choice_functions=None):
             cases.append(
                 fmt.format(
                     name=options["cmd"],
-                    name_wordify=wordify(options["cmd"]),
-                    prefix=prefix,
+                    target=options.get("alias", prefix + "_" + wordify(options["cmd"])),
                 )
             )
         cases = "\n\t".expandtabs(8).join(cases)
@@ -758,7 +854,9 @@ ${root_prefix} "$@\""""
         command_cases="\n".join(starmap(command_case, sorted(subcommands.items()))),
         command_commands="\n".join(starmap(command_list, sorted(subcommands.items()))),
         command_options="\n".join(
-            starmap(command_option, sorted(all_commands.items()))
+            command_option(prefix, options)
+            for prefix, options in sorted(all_commands.items())
+            if "alias" not in options
         ),
         preamble=preamble,
     )
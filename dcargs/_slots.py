@@ -0,0 +1,74 @@
+"""Helper for giving frozen dataclasses `__slots__`. Large configs can result in tens
+of thousands of field and argument definitions, where per-instance `__dict__`s are a
+significant portion of memory usage.
+
+`dataclasses.dataclass(slots=True)` requires Python 3.10."""
+import dataclasses
+from typing import Any, Callable, Tuple, Type, TypeVar
+
+T = TypeVar("T", bound=Type)
+
+
+def add_slots(*extra_slots: str) -> Callable[[T], T]:
+    """Class decorator that replaces a frozen dataclass with an equivalent class that
+    uses `__slots__`. Should be applied after (above) `@dataclasses.dataclass`.
+
+    `extra_slots` can be used for caching values that aren't fields; these should be
+    set via `object.__setattr__()`, and aren't pickled."""
+
+    def decorator(cls: T) -> T:
+        assert dataclasses.is_dataclass(cls)
+        assert "__slots__" not in cls.__dict__
+        field_names = tuple(field.name for field in dataclasses.fields(cls))
+
+        cls_dict = dict(cls.__dict__)
+        cls_dict["__slots__"] = field_names + extra_slots
+        if not any(hasattr(base, "__weakref__") for base in cls.__bases__):
+            cls_dict["__slots__"] += ("__weakref__",)
+        for name in field_names:
+            # Default values are stored in the generated `__init__()`. Class variables
+            # would conflict with slots.
+            cls_dict.pop(name, None)
+        # Descriptors from the original class; these are re-created for the slots.
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+
+        # Frozen dataclasses can't be unpickled via `setattr()`.
+        def __getstate__(self) -> Tuple[Any, ...]:
+            return tuple(getattr(self, name) for name in field_names)
+
+        def __setstate__(self, state: Tuple[Any, ...]) -> None:
+            for name, value in zip(field_names, state):
+                object.__setattr__(self, name, value)
+
+        cls_dict["__getstate__"] = __getstate__
+        cls_dict["__setstate__"] = __setstate__
+
+        metaclass: Any = type(cls)
+        out = metaclass(cls.__name__, cls.__bases__, cls_dict)
+        out.__qualname__ = cls.__qualname__
+
+        # The `__setattr__()` and `__delattr__()` methods generated for frozen
+        # dataclasses check against the original class, which would let attributes
+        # that aren't fields be assigned.
+        if cls.__dataclass_params__.frozen:  # type: ignore
+
+            def __setattr__(self, name: str, value: Any) -> None:
+                if type(self) is out or name in field_names:
+                    raise dataclasses.FrozenInstanceError(
+                        f"cannot assign to field {name!r}"
+                    )
+                super(out, self).__setattr__(name, value)
+
+            def __delattr__(self, name: str) -> None:
+                if type(self) is out or name in field_names:
+                    raise dataclasses.FrozenInstanceError(
+                        f"cannot delete field {name!r}"
+                    )
+                super(out, self).__delattr__(name)
+
+            out.__setattr__ = __setattr__
+            out.__delattr__ = __delattr__
+        return out
+
+    return decorator
@@ -0,0 +1,77 @@
+"""Counters for understanding where time is spent when building CLIs. Counting is a
+context variable lookup and a dictionary update, so it's always enabled."""
+from __future__ import annotations
+
+import collections
+import contextlib
+import contextvars
+import dataclasses
+from typing import Counter, Iterator, Optional
+
+
+@dataclasses.dataclass(frozen=True)
+class Stats:
+    """Counters for a single `dcargs.cli()` call. Work that's skipped because results
+    were cached isn't counted, so counts are typically lower after the first call."""
+
+    field_lists: int = 0
+    """Calls to `field_list_from_callable()`, which expands a callable into fields."""
+    nested_type_checks: int = 0
+    """Calls to `is_nested_type()`."""
+    type_hints: int = 0
+    """Calls to `get_type_hints()`."""
+    source_lookups: int = 0
+    """Calls to `inspect.getsource()`, which is used for reading field docstrings."""
+    tokenizations: int = 0
+    """Class definitions tokenized, for reading field docstrings."""
+    docstring_parses: int = 0
+    """Calls to `docstring_parser.parse()`."""
+    instantiators: int = 0
+    """Instantiators constructed from type annotations."""
+    argparse_actions: int = 0
+    """Arguments and subparser groups added to argparse parsers."""
+
+
+# Counters for the `dcargs.cli()` call that's currently running, if any.
+_current_counters: contextvars.ContextVar[
+    Optional[Counter[str]]
+] = contextvars.ContextVar("_current_counters", default=None)
+
+# Counters from the last `dcargs.cli()` call that finished.
+_last_counters: contextvars.ContextVar[Optional[Counter[str]]] = contextvars.ContextVar(
+    "_last_counters", default=None
+)
+
+
+def increment(name: str) -> None:
+    """Increment a counter. `name` should be a field of `Stats`. No-op outside of
+    `counting()`."""
+    counters = _current_counters.get()
+    if counters is not None:
+        counters[name] += 1
+
+
+@contextlib.contextmanager
+def counting() -> Iterator[Counter[str]]:
+    """Count work done within a context. When the context exits, the counts are
+    recorded for `stats()`."""
+    counters: Counter[str] = collections.Counter()
+    token = _current_counters.set(counters)
+    try:
+        yield counters
+    finally:
+        _current_counters.reset(token)
+        _last_counters.set(counters)
+
+
+def stats() -> Stats:
+    """Get counters for the most recent `dcargs.cli()` call in the current thread (or
+    asyncio task). Useful for understanding why building a CLI is slow; for example,
+    if `source_lookups` is high, most of the time is likely spent reading docstrings.
+
+    Counters are recorded even if the call exits early, for example when `--help` is
+    passed in."""
+    counters = _last_counters.get()
+    if counters is None:
+        return Stats()
+    return Stats(**counters)
@@ -1,15 +1,26 @@
 """Utilities and constants for working with strings."""
 
+import contextvars
 import functools
 import re
 import textwrap
-from typing import Iterable, List, Sequence, Tuple, Type, Union
+from typing import (
+    Collection,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import termcolor
 
 from . import _resolver
 
 dummy_field_name = "__dcargs_dummy_field__"
+help_group_flag = "--help-group"
 
 
 def _strip_dummy_field_names(parts: Iterable[str]) -> Iterable[str]:
@@ -114,12 +125,78 @@ def strip_ansi_sequences(x: str):
     return _get_ansi_pattern().sub("", x)
 
 
+def visible_len(x: str) -> int:
+    """Length of a string when printed to a terminal, ignoring ANSI sequences."""
+    # Fast path: most strings passed in here don't contain any escape sequences.
+    if "\x1b" not in x:
+        return len(x)
+    return _visible_len_with_ansi(x)
+
+
+@functools.lru_cache(maxsize=4096)
+def _visible_len_with_ansi(x: str) -> int:
+    return len(strip_ansi_sequences(x))
+
+
+def visible_index(x: str, visible_count: int) -> int:
+    """Index into `x` after `visible_count` visible characters. Slicing at this index
+    never splits an ANSI sequence."""
+    position = 0
+    for match in _get_ansi_pattern().finditer(x):
+        segment_len = match.start() - position
+        if segment_len >= visible_count:
+            break
+        visible_count -= segment_len
+        position = match.end()
+    return min(position + visible_count, len(x))
+
+
+# Whether ANSI colors should be used. This is a context variable, so concurrent
+# `dcargs.cli()` calls in different threads or tasks don't interfere with each other.
+_colors_enabled: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_colors_enabled", default=True
+)
+
+
+def colored(
+    text: str, color: Optional[str] = None, attrs: Optional[List[str]] = None
+) -> str:
+    """Same as `termcolor.colored()`, but respects the color state of the current
+    context."""
+    if not _colors_enabled.get():
+        return text
+    return termcolor.colored(text, color=color, attrs=attrs)
+
+
+def colors_enabled() -> bool:
+    """Returns True if helptext is currently rendered with ANSI colors."""
+    return colored("", "red") != ""
+
+
 def format_metavar(x: str) -> str:
-    return termcolor.colored(x, attrs=["bold"])
+    return colored(x, attrs=["bold"])
+
+
+# Choice sets larger than this are truncated in metavars and helptext.
+_MAX_CHOICES_SHOWN = 32
+
+
+def truncate_choices(choices: Collection[str]) -> Collection[str]:
+    """Shorten very large choice sets for display, by keeping the first few and the
+    last choice. Used for metavars and helptext; the full set is still accepted."""
+    if len(choices) <= _MAX_CHOICES_SHOWN:
+        return choices
+    choices = tuple(choices)
+    return choices[:8] + ("...", choices[-1])
+
+
+def choices_metavar(choices: Collection[str]) -> str:
+    """Make a metavar for a set of choices, eg `{a,b,c}`."""
+    return "{" + ",".join(map(format_metavar, truncate_choices(choices))) + "}"
 
 
 def multi_metavar_from_single(single: str) -> str:
-    if len(strip_ansi_sequences(single)) >= 32:
+    if visible_len(single) >= 32:
         # Shorten long metavars
         return f"{single} [...]"
     else:
@@ -1,4 +1,4 @@
-from typing import Type, TypeVar
+from typing import Dict, FrozenSet, Iterable, Type, TypeVar
 
 from typing_extensions import Annotated
 
@@ -17,6 +17,16 @@ def _make_marker(description: str) -> Marker:
     return _InnerMarker()
 
 
+# There are only a handful of markers, so the same few sets are shared by every field.
+_interned_marker_sets: Dict[FrozenSet[Marker], FrozenSet[Marker]] = {}
+
+
+def interned(markers: Iterable[Marker]) -> FrozenSet[Marker]:
+    """Get a canonical frozenset containing some markers."""
+    marker_set = frozenset(markers)
+    return _interned_marker_sets.setdefault(marker_set, marker_set)
+
+
 # Current design issue: markers are applied recursively to nested structures, but can't
 # be unapplied.
 
@@ -54,3 +64,12 @@ This simplifies CLI interfaces, but makes them less expressive.
 
 Can be used directly on union types, `AvoidSubcommands[Union[...]]`, or recursively
 applied to nested types."""
+
+LAZY = _make_marker("Lazy")
+Lazy = Annotated[T, LAZY]
+"""A nested type `T` can be annotated as `Lazy[T]` to defer instantiation. Arguments are
+parsed and validated as usual, but `T` is replaced with a thread-safe proxy that only
+calls the constructor the first time it's used. This is helpful for expensive objects
+that aren't needed on every code path.
+
+Fields nested within a lazy field are instantiated together with it."""
@@ -2,6 +2,12 @@
 aren't considered part of the core interface."""
 
 from ._base_configs import subcommand_type_from_defaults
-from ._serialization import from_yaml, to_yaml
+from ._serialization import from_json, from_yaml, to_json, to_yaml
 
-__all__ = ["subcommand_type_from_defaults", "to_yaml", "from_yaml"]
+__all__ = [
+    "subcommand_type_from_defaults",
+    "to_yaml",
+    "from_yaml",
+    "to_json",
+    "from_json",
+]
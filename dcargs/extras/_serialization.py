@@ -1,14 +1,32 @@
 """Type-safe, human-readable serialization helpers for dataclasses."""
 
+import collections
+import collections.abc
 import dataclasses
 import enum
-import functools
-from typing import IO, Any, Optional, Set, Type, TypeVar, Union
+import itertools
+import json
+import weakref
+from typing import (
+    IO,
+    Any,
+    AnyStr,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import yaml
-from typing_extensions import get_args, get_origin
+from typing_extensions import Annotated, Final, Literal, get_args, get_origin
 
-from .. import _fields, _resolver
+from .. import _caching, _fields, _resolver
 
 ENUM_YAML_TAG_PREFIX = "!enum:"
 DATACLASS_YAML_TAG_PREFIX = "!dataclass:"
@@ -17,56 +35,147 @@ MISSING_YAML_TAG_PREFIX = "!missing"
 DataclassType = TypeVar("DataclassType")
 
 
-def _get_contained_special_types_from_type(
-    cls: Type,
-    _parent_contained_dataclasses: Optional[Set[Type]] = None,
-) -> Set[Type]:
-    """Takes a dataclass type, and recursively searches its fields for dataclass or enum
-    types."""
-    assert _resolver.is_dataclass(cls)
-    parent_contained_dataclasses = (
-        set()
-        if _parent_contained_dataclasses is None
-        else _parent_contained_dataclasses
-    )
+@dataclasses.dataclass(frozen=True)
+class _TypeGraphNode:
+    """Node in our type graph index. Each node corresponds to a dataclass type, and
+    records the special types that are reachable via its field types and generic type
+    parameters.
+
+    Subclasses are read when the graph is walked instead of being stored: they can be
+    registered at any time, and referencing them from the index would keep
+    dynamically created classes alive."""
+
+    child_dataclasses: Tuple[Type, ...]
+    child_enums: FrozenSet[Type]
+
 
-    cls, _ = _resolver.unwrap_annotated(cls)
+def _direct_special_types(typ: Type) -> Tuple[Set[Type], Set[Type]]:
+    """Returns dataclasses and enums found in a type annotation, without recursing
+    into dataclass fields."""
+    if _resolver.is_dataclass(typ):
+        return {typ}, set()
+    elif type(typ) is enum.EnumMeta:
+        return set(), {typ}
+
+    # Handle Union, Annotated, List, etc. No-op when there are no args.
+    dataclass_types: Set[Type] = set()
+    enum_types: Set[Type] = set()
+    for arg in get_args(typ):
+        arg_dataclass_types, arg_enum_types = _direct_special_types(arg)
+        dataclass_types |= arg_dataclass_types
+        enum_types |= arg_enum_types
+    return dataclass_types, enum_types
+
+
+@_caching.cached("serialization.type_graph_node")
+def _get_type_graph_node(typ: Type) -> _TypeGraphNode:
+    cls, _ = _resolver.unwrap_annotated(typ)
     cls, type_from_typevar = _resolver.resolve_generic_types(cls)
 
-    contained_special_types = {cls}
+    dataclass_types: Set[Type] = set()
+    enum_types: Set[Type] = set()
+    for child in itertools.chain(
+        # Handle generics.
+        type_from_typevar.values(),
+        # Handle fields.
+        (field.type for field in _resolver.resolved_fields(cls)),  # type: ignore
+    ):
+        child_dataclass_types, child_enum_types = _direct_special_types(child)
+        dataclass_types |= child_dataclass_types
+        enum_types |= child_enum_types
+
+    # Entries are keyed weakly, so recursive types shouldn't reference themselves.
+    dataclass_types.discard(typ)
+    dataclass_types.discard(cls)
+    return _TypeGraphNode(
+        child_dataclasses=tuple(dataclass_types),
+        child_enums=frozenset(enum_types),
+    )
 
-    def handle_type(typ: Type) -> Set[Type]:
-        # Handle dataclasses.
-        if _resolver.is_dataclass(typ) and typ not in parent_contained_dataclasses:
-            return _get_contained_special_types_from_type(
-                typ,
-                _parent_contained_dataclasses=contained_special_types
-                | parent_contained_dataclasses,
-            )
 
-        # Handle enums.
-        elif type(typ) is enum.EnumMeta:
-            return {typ}
+@dataclasses.dataclass(frozen=True)
+class _ContainedSpecialTypes:
+    """Result of walking the type graph from a root type. Types are referenced weakly,
+    for the same reason as in `_TypeGraphNode`.
 
-        # Handle Union, Annotated, List, etc. No-op when there are no args.
-        return functools.reduce(set.union, map(handle_type, get_args(typ)), set())
+    The subclass count of each visited class is used as a generation token: results
+    are only reused while no subclasses have been registered or garbage collected."""
 
-    # Handle generics.
-    for typ in type_from_typevar.values():
-        contained_special_types |= handle_type(typ)
+    subclass_count_from_ref: Tuple[Tuple[weakref.ref, int], ...]
+    enum_refs: Tuple[weakref.ref, ...]
 
-    if cls in parent_contained_dataclasses:
-        return contained_special_types
+    def get_if_current(self) -> Optional[Set[Type]]:
+        out: Set[Type] = set()
+        for ref, subclass_count in self.subclass_count_from_ref:
+            cls = ref()
+            if cls is None or len(cls.__subclasses__()) != subclass_count:
+                return None
+            out.add(cls)
+        for ref in self.enum_refs:
+            enum_type = ref()
+            if enum_type is None:
+                return None
+            out.add(enum_type)
+        return out
 
-    # Handle fields.
-    for field in _resolver.resolved_fields(cls):  # type: ignore
-        contained_special_types |= handle_type(field.type)
 
-    # Handle subclasses.
-    for subclass in cls.__subclasses__():
-        contained_special_types |= handle_type(subclass)
+@_caching.cached("serialization.contained_special_types")
+def _get_contained_special_types_slot(
+    cls: Type,
+) -> List[Optional[_ContainedSpecialTypes]]:
+    """Slot for the most recent walk from a root type, which is replaced when it's no
+    longer current."""
+    return [None]
 
-    return contained_special_types
+
+def _get_contained_special_types_from_type(cls: Type) -> Set[Type]:
+    """Takes a dataclass type, and recursively searches its fields and subclasses for
+    dataclass or enum types.
+
+    Results are memoized per root type, and the graph is only walked again when
+    subclasses are added or removed. Field types are memoized per class, so walks
+    only need to look up subclasses."""
+    assert _resolver.is_dataclass(cls)
+
+    slot = _get_contained_special_types_slot(cls)
+    if slot[0] is not None:
+        out = slot[0].get_if_current()
+        if out is not None:
+            return out
+
+    node_classes: Dict[Type, int] = {}
+    enum_types: Set[Type] = set()
+    visited: Set[Any] = set()
+    stack = [cls]
+    while len(stack) > 0:
+        typ = stack.pop()
+
+        # Generic aliases with different parameters are distinct nodes.
+        node_cls = _resolver.unwrap_origin_strip_extras(typ)
+        visit_key: Any = typ
+        try:
+            hash(typ)
+        except TypeError:
+            visit_key = node_cls
+        if visit_key in visited:
+            continue
+        visited.add(visit_key)
+
+        node = _get_type_graph_node(typ)
+        subclasses = node_cls.__subclasses__()
+        node_classes[node_cls] = len(subclasses)
+        enum_types |= node.child_enums
+        stack.extend(node.child_dataclasses)
+        stack.extend(subclasses)
+
+    slot[0] = _ContainedSpecialTypes(
+        subclass_count_from_ref=tuple(
+            (weakref.ref(node_cls), subclass_count)
+            for node_cls, subclass_count in node_classes.items()
+        ),
+        enum_refs=tuple(map(weakref.ref, enum_types)),
+    )
+    return set(node_classes.keys()) | enum_types
 
 
 def _make_loader(cls: Type) -> Type[yaml.Loader]:
@@ -223,3 +332,467 @@ def to_yaml(instance: Any) -> str:
         YAML string.
     """
     return "# dcargs YAML.\n" + yaml.dump(instance, Dumper=_make_dumper(instance))
+
+
+# JSON serialization. In contrast to the YAML path, which resolves tags against a
+# custom loader, we compile an encoder/decoder "plan" once per type and walk values
+# directly into their target types.
+
+_Encoder = Callable[[Any], Any]
+_Decoder = Callable[[Any], Any]
+
+_NoneType = type(None)
+_JSON_MISSING = {MISSING_YAML_TAG_PREFIX: None}
+_SEQUENCE_ORIGINS = (
+    list,
+    set,
+    frozenset,
+    collections.deque,
+    collections.abc.Sequence,
+)
+_MAPPING_ORIGINS = (dict, collections.abc.Mapping)
+
+
+def _cache_plan(make: Callable[[Any], Callable]) -> Callable[[Any], Callable]:
+    """Cache encoder/decoder plans by type. Some types (eg `Annotated[]` with
+    unhashable metadata) can't be hashed; plans for these are rebuilt on each call."""
+    return _caching.cached(f"serialization.{make.__name__}")(make)
+
+
+def _special_type_from_name(typ: Type) -> Dict[str, Type]:
+    """Map names of dataclasses and enums that can appear within `typ` to types. Used
+    for resolving tagged values, which are emitted for unions and subclasses."""
+    contained: Set[Type] = set()
+    if _resolver.is_dataclass(typ):
+        contained = _get_contained_special_types_from_type(typ)
+    else:
+        for option in get_args(typ):
+            option = _resolver.unwrap_annotated(option)[0]
+            if _resolver.is_dataclass(option):
+                contained |= _get_contained_special_types_from_type(option)
+            elif isinstance(option, type) and issubclass(option, enum.Enum):
+                contained.add(option)
+    return {t.__name__: t for t in contained}
+
+
+def _tag_of(value: Any) -> Optional[Tuple[str, Any]]:
+    """Returns (tag, payload) if a decoded JSON value is a tagged dataclass or enum."""
+    if type(value) is dict and len(value) == 1:
+        ((key, payload),) = value.items()
+        if key.startswith(DATACLASS_YAML_TAG_PREFIX) or key.startswith(
+            ENUM_YAML_TAG_PREFIX
+        ):
+            return key, payload
+    return None
+
+
+def _encode_tagged(value: Any) -> Any:
+    """Encode a value with an explicit type tag, for cases where the declared type
+    alone isn't enough to reconstruct it."""
+    if dataclasses.is_dataclass(value):
+        return {
+            DATACLASS_YAML_TAG_PREFIX
+            + type(value).__name__: _get_encoder(type(value))(value)
+        }
+    elif isinstance(value, enum.Enum):
+        return {ENUM_YAML_TAG_PREFIX + type(value).__name__: value.name}
+    return _encode_dynamic(value)
+
+
+def _encode_dynamic(value: Any) -> Any:
+    """Fallback for when no type information is available, eg `Any` or unresolved
+    TypeVars. Dataclasses and enums are written without tags: there's no annotation to
+    resolve tag names against, so these values are decoded as JSON primitives."""
+    if value is _fields.MISSING_PROP:
+        return _JSON_MISSING
+    elif value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    elif dataclasses.is_dataclass(value):
+        return _get_encoder(type(value))(value)
+    elif isinstance(value, enum.Enum):
+        return value.name
+    elif isinstance(value, collections.abc.Mapping):
+        return {str(k): _encode_dynamic(v) for k, v in value.items()}
+    elif isinstance(value, (list, tuple, set, frozenset, collections.deque)):
+        return [_encode_dynamic(v) for v in value]
+    return str(value)
+
+
+def _value_matches(typ: Any, value: Any) -> bool:
+    """Check if a value can be encoded as a (union option) type."""
+    typ = _resolver.unwrap_annotated(typ)[0]
+    origin = get_origin(typ)
+    if typ is Any or isinstance(typ, TypeVar):
+        return True
+    elif typ is _NoneType:
+        return value is None
+    elif origin is Literal:
+        return value in get_args(typ)
+    elif origin is Union:
+        return any(_value_matches(option, value) for option in get_args(typ))
+    elif origin in (Final, Annotated):
+        return _value_matches(get_args(typ)[0], value)
+    elif typ is float:
+        # JSON doesn't distinguish between 1 and 1.0.
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    elif typ is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+
+    cls = _resolver.unwrap_origin_strip_extras(typ)
+    return isinstance(cls, type) and isinstance(value, cls)
+
+
+@_cache_plan
+def _get_encoder(typ: Any) -> _Encoder:
+    """Compile a function for mapping values of type `typ` to JSON-compatible
+    primitives."""
+    inner = _make_encoder(typ)
+
+    def encoder(value: Any) -> Any:
+        if value is _fields.MISSING_PROP:
+            return _JSON_MISSING
+        return inner(value)
+
+    return encoder
+
+
+def _make_encoder(typ: Any) -> _Encoder:
+    typ = _resolver.unwrap_annotated(typ)[0]
+    origin = get_origin(typ)
+    args = get_args(typ)
+
+    if origin is Final:
+        return _get_encoder(args[0])
+    elif typ is Any or isinstance(typ, TypeVar) or typ is object:
+        return _encode_dynamic
+    elif typ in (_NoneType, bool, int, float, str):
+        return lambda value: value
+    elif origin is Literal:
+        return lambda value: value.name if isinstance(value, enum.Enum) else value
+    elif origin is Union:
+        options = args
+
+        def union_encoder(value: Any) -> Any:
+            for option in options:
+                if _value_matches(option, value):
+                    if dataclasses.is_dataclass(value) or isinstance(value, enum.Enum):
+                        return _encode_tagged(value)
+                    return _get_encoder(option)(value)
+            return _encode_dynamic(value)
+
+        return union_encoder
+    elif origin is tuple or typ is tuple:
+        if len(args) == 0:
+            return _encode_dynamic
+        if Ellipsis not in args:
+            element_encoders = tuple(map(_get_encoder, args))
+            return lambda value: [
+                encode(x) for encode, x in zip(element_encoders, value)
+            ]
+        element_encoder = _get_encoder(args[0])
+        return lambda value: [element_encoder(x) for x in value]
+    elif origin in _SEQUENCE_ORIGINS or typ in _SEQUENCE_ORIGINS:
+        element_encoder = _get_encoder(args[0] if len(args) > 0 else Any)
+        return lambda value: [element_encoder(x) for x in value]
+    elif origin in _MAPPING_ORIGINS or typ in _MAPPING_ORIGINS:
+        if len(args) == 0:
+            return _encode_dynamic
+        key_encoder = _get_encoder(args[0])
+        val_encoder = _get_encoder(args[1])
+        if _resolver.unwrap_annotated(args[0])[0] is str:
+            return lambda value: {k: val_encoder(v) for k, v in value.items()}
+        # JSON objects only support string keys; other mappings are stored as lists of
+        # key/value pairs.
+        return lambda value: [
+            [key_encoder(k), val_encoder(v)] for k, v in value.items()
+        ]
+    elif isinstance(typ, type) and issubclass(typ, enum.Enum):
+        enum_type = typ
+
+        def enum_encoder(value: Any) -> Any:
+            if type(value) is not enum_type:
+                return _encode_tagged(value)
+            return value.name
+
+        return enum_encoder
+    elif _resolver.is_dataclass(typ):
+        cls, type_from_typevar = _resolver.resolve_generic_types(typ)
+        field_encoders: Optional[List[Tuple[str, _Encoder]]] = None
+
+        def dataclass_encoder(value: Any) -> Any:
+            # Subclasses and other types need to be tagged.
+            if type(value) is not cls:
+                return _encode_tagged(value)
+
+            # Field plans are compiled lazily, which lets us support recursive types.
+            nonlocal field_encoders
+            if field_encoders is None:
+                field_encoders = [
+                    (
+                        field.name,
+                        _get_encoder(
+                            _resolver.apply_type_from_typevar(
+                                field.type, type_from_typevar
+                            )
+                        ),
+                    )
+                    for field in _resolver.resolved_fields(cls)
+                    if field.init
+                ]
+            return {
+                name: encode(getattr(value, name)) for name, encode in field_encoders
+            }
+
+        return dataclass_encoder
+
+    # Any other type: we follow the same convention as `dcargs.cli()`, and assume that
+    # types can be mapped to and from strings.
+    return lambda value: str(value)
+
+
+@_cache_plan
+def _get_decoder(typ: Any) -> _Decoder:
+    """Compile a function for mapping JSON-compatible primitives to values of type
+    `typ`."""
+    inner = _make_decoder(typ)
+
+    def decoder(value: Any) -> Any:
+        if type(value) is dict and value == _JSON_MISSING:
+            return _fields.MISSING_PROP
+        return inner(value)
+
+    return decoder
+
+
+def _make_decoder(typ: Any) -> _Decoder:
+    typ = _resolver.unwrap_annotated(typ)[0]
+    origin = get_origin(typ)
+    args = get_args(typ)
+
+    if origin is Final:
+        return _get_decoder(args[0])
+    elif typ is Any or isinstance(typ, TypeVar) or typ is object:
+        return lambda value: value
+    elif typ in (_NoneType, bool, str):
+        return lambda value: value
+    elif typ is int:
+        return _decode_int
+    elif typ is float:
+        return _decode_float
+    elif origin is Literal:
+        choices = args
+
+        def literal_decoder(value: Any) -> Any:
+            for choice in choices:
+                if isinstance(choice, enum.Enum):
+                    if value == choice.name:
+                        return choice
+                elif type(choice) is type(value) and choice == value:
+                    return choice
+            raise ValueError(f"{value} does not match any choice in {typ}")
+
+        return literal_decoder
+    elif origin is Union:
+        options = args
+
+        def union_decoder(value: Any) -> Any:
+            tagged = _tag_of(value)
+            if tagged is not None:
+                # Tag names are resolved for each value, since subclasses can be
+                # defined after the plan is compiled.
+                return _decode_tagged(_special_type_from_name(typ), *tagged)
+
+            for option in options:
+                if _json_value_matches(option, value):
+                    return _get_decoder(option)(value)
+            raise ValueError(f"{value} does not match any option in {typ}")
+
+        return union_decoder
+    elif origin is tuple or typ is tuple:
+        if len(args) == 0:
+            return tuple
+        if Ellipsis not in args:
+            element_decoders = tuple(map(_get_decoder, args))
+            return lambda value: tuple(
+                decode(x) for decode, x in zip(element_decoders, value)
+            )
+        element_decoder = _get_decoder(args[0])
+        return lambda value: tuple(element_decoder(x) for x in value)
+    elif origin in _SEQUENCE_ORIGINS or typ in _SEQUENCE_ORIGINS:
+        container_type = origin if origin is not None else typ
+        if container_type is collections.abc.Sequence:
+            container_type = list
+        element_decoder = _get_decoder(args[0]) if len(args) > 0 else _get_decoder(Any)
+        return lambda value: container_type(element_decoder(x) for x in value)
+    elif origin in _MAPPING_ORIGINS or typ in _MAPPING_ORIGINS:
+        if len(args) == 0:
+            return dict
+        key_decoder = _get_decoder(args[0])
+        val_decoder = _get_decoder(args[1])
+        if _resolver.unwrap_annotated(args[0])[0] is str:
+            return lambda value: {k: val_decoder(v) for k, v in value.items()}
+        return lambda value: {key_decoder(k): val_decoder(v) for k, v in value}
+    elif isinstance(typ, type) and issubclass(typ, enum.Enum):
+        enum_type = typ
+
+        def enum_decoder(value: Any) -> Any:
+            tagged = _tag_of(value)
+            if tagged is not None:
+                return _decode_tagged(_special_type_from_name(enum_type), *tagged)
+            return enum_type[value]
+
+        return enum_decoder
+    elif _resolver.is_dataclass(typ):
+        cls, type_from_typevar = _resolver.resolve_generic_types(typ)
+        field_decoders: Optional[Dict[str, _Decoder]] = None
+
+        def dataclass_decoder(value: Any) -> Any:
+            nonlocal field_decoders
+            tagged = _tag_of(value)
+            if tagged is not None:
+                return _decode_tagged(_special_type_from_name(typ), *tagged)
+
+            if field_decoders is None:
+                field_decoders = {
+                    field.name: _get_decoder(
+                        _resolver.apply_type_from_typevar(field.type, type_from_typevar)
+                    )
+                    for field in _resolver.resolved_fields(cls)
+                    if field.init
+                }
+            return cls(
+                **{
+                    name: field_decoders[name](v)
+                    for name, v in value.items()
+                    if name in field_decoders
+                }
+            )
+
+        return dataclass_decoder
+
+    # Any other type: should be constructible from a string.
+    return typ
+
+
+def _decode_int(value: Any) -> int:
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"Expected an integer, but got {value!r}.")
+    return value
+
+
+def _decode_float(value: Any) -> float:
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise ValueError(f"Expected a number, but got {value!r}.")
+    return float(value)
+
+
+def _decode_tagged(
+    special_type_from_name: Dict[str, Type], tag: str, payload: Any
+) -> Any:
+    if tag.startswith(DATACLASS_YAML_TAG_PREFIX):
+        name = tag[len(DATACLASS_YAML_TAG_PREFIX) :]
+    else:
+        name = tag[len(ENUM_YAML_TAG_PREFIX) :]
+    if name not in special_type_from_name:
+        raise ValueError(f"Could not resolve tagged type {name}.")
+    typ = special_type_from_name[name]
+    if dataclasses.is_dataclass(typ):
+        # Go directly to the field-level decoder for this type; payloads are never
+        # doubly tagged.
+        return _get_decoder(typ)(payload)
+    return typ[payload]
+
+
+def _json_value_matches(typ: Any, value: Any) -> bool:
+    """Check if a decoded JSON value can be interpreted as an (untagged) union
+    option."""
+    typ = _resolver.unwrap_annotated(typ)[0]
+    origin = get_origin(typ)
+    if typ is Any or isinstance(typ, TypeVar):
+        return True
+    elif typ is _NoneType:
+        return value is None
+    elif typ is bool:
+        return isinstance(value, bool)
+    elif typ is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    elif typ is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    elif typ is str:
+        return isinstance(value, str)
+    elif origin is Literal:
+        return any(
+            value == (choice.name if isinstance(choice, enum.Enum) else choice)
+            and (isinstance(choice, enum.Enum) or type(choice) is type(value))
+            for choice in get_args(typ)
+        )
+    elif origin is Union:
+        return any(_json_value_matches(option, value) for option in get_args(typ))
+    elif origin is Final:
+        return _json_value_matches(get_args(typ)[0], value)
+    elif origin is tuple or typ is tuple:
+        return isinstance(value, list)
+    elif origin in _SEQUENCE_ORIGINS or typ in _SEQUENCE_ORIGINS:
+        return isinstance(value, list)
+    elif origin in _MAPPING_ORIGINS or typ in _MAPPING_ORIGINS:
+        return isinstance(value, (dict, list))
+    elif _resolver.is_dataclass(typ):
+        return isinstance(value, dict)
+    elif isinstance(typ, type) and issubclass(typ, enum.Enum):
+        return isinstance(value, str) and value in typ.__members__
+    return isinstance(value, str)
+
+
+def from_json(
+    cls: Type[DataclassType],
+    data: Union[str, bytes],
+    *,
+    loads: Callable[[Any], Any] = json.loads,
+) -> DataclassType:
+    """Re-construct a dataclass instance from a JSON string, which should be generated
+    from `dcargs.extras.to_json()`.
+
+    Decoding is driven by the type annotations of `cls`: a decoding plan is compiled
+    (and cached) once per type, and values are mapped directly into dataclasses, enums,
+    tuples, and generics. Tags are only read when the annotation alone is ambiguous, for
+    example for unions over dataclasses or subclasses of annotated types.
+
+    Args:
+        cls: Type to reconstruct.
+        data: JSON to read from.
+        loads: Deserialization backend. Any function that maps `data` to JSON-compatible
+            primitives can be used; for example, `msgpack.unpackb`.
+
+    Returns:
+        Instantiated dataclass.
+    """
+    out = _get_decoder(cls)(loads(data))
+    origin_cls = get_origin(cls)
+    assert isinstance(out, origin_cls if origin_cls is not None else cls)
+    return out
+
+
+def to_json(
+    instance: Any,
+    *,
+    dumps: Callable[[Any], AnyStr] = json.dumps,  # type: ignore
+) -> AnyStr:
+    """Serialize a dataclass; returns a JSON string that can be deserialized via
+    `dcargs.extras.from_json()`.
+
+    Like `dcargs.extras.to_yaml()`, output is human-readable and robust against code
+    reorganization: dataclasses and enums are only tagged (by name) when they can't be
+    inferred from type annotations. Values annotated as `Any` are written without type
+    information, and are decoded as JSON primitives.
+
+    Args:
+        instance: Dataclass instance to serialize.
+        dumps: Serialization backend. Any function that maps JSON-compatible primitives
+            to a string or bytes can be used; for example, `msgpack.packb`.
+
+    Returns:
+        JSON string.
+    """
+    return dumps(_get_encoder(type(instance))(instance))
@@ -1,4 +1,9 @@
+import dataclasses
 import sys
+from typing import Callable, List, Optional, Tuple
+
+import pytest
+from typing_extensions import Literal
 
 collect_ignore_glob = []
 if sys.version_info.major == 3 and sys.version_info.minor == 7:
@@ -6,3 +11,32 @@ if sys.version_info.major == 3 and sys.version_info.minor == 7:
 
 if not (sys.version_info.major == 3 and sys.version_info.minor == 10):
     collect_ignore_glob.append("*_only_py310.py")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Don't read from or write to the user's dcargs cache when running tests."""
+    monkeypatch.setenv("DCARGS_CACHE_DIR", str(tmp_path / "dcargs_cache"))
+
+
+@pytest.fixture
+def make_config() -> Callable[[str, int], type]:
+    """Factory for dynamic dataclasses, with fields `field_0`, `field_1`, ... of mixed
+    types."""
+
+    def make_config(name: str, num_fields: int) -> type:
+        fields = []
+        for i in range(num_fields):
+            typ, default = [
+                (int, 1),
+                (float, 1.0),
+                (str, "x"),
+                (Tuple[int, int], (1, 2)),
+                (Optional[List[int]], None),
+                (Literal["a", "b", "c"], "a"),
+                (bool, False),
+            ][i % 7]
+            fields.append((f"field_{i}", typ, dataclasses.field(default=default)))
+        return dataclasses.make_dataclass(name, fields)
+
+    return make_config
@@ -0,0 +1,92 @@
+import asyncio
+import dataclasses
+from typing import Dict, List, Tuple
+
+import pytest
+
+import dcargs
+
+
+def test_acli_coroutine_function():
+    async def main(x: int, y: str = "hello") -> Tuple[int, str]:
+        await asyncio.sleep(0)
+        return x, y
+
+    assert asyncio.run(dcargs.acli(main, args=["--x", "3"])) == (3, "hello")
+
+
+def test_acli_sync_callables():
+    @dataclasses.dataclass
+    class Config:
+        x: int = 5
+
+    assert asyncio.run(dcargs.acli(Config, args=[])) == Config()
+    assert asyncio.run(dcargs.acli(int, args=["3"])) == 3
+
+
+def test_acli_concurrent_siblings():
+    order: List[str] = []
+    events: Dict[str, asyncio.Event] = {}
+
+    async def connect(name: str) -> str:
+        # Each connection waits for the other one to start, so this only finishes if
+        # siblings are awaited concurrently.
+        order.append(f"start {name}")
+        events[name].set()
+        other = "b" if name == "a" else "a"
+        await asyncio.wait_for(events[other].wait(), timeout=5.0)
+        return name
+
+    async def connect_a(name: str = "a") -> str:
+        return await connect(name)
+
+    async def connect_b(name: str = "b") -> str:
+        return await connect(name)
+
+    async def main(a: connect_a, b: connect_b) -> Tuple[str, str]:  # type: ignore
+        order.append("main")
+        return a, b
+
+    async def run() -> Tuple[str, str]:
+        events.update(a=asyncio.Event(), b=asyncio.Event())
+        return await dcargs.acli(main, args=[])
+
+    assert asyncio.run(run()) == ("a", "b")
+    assert order == ["start a", "start b", "main"]
+
+
+def test_acli_nested_dependency_order():
+    calls: List[str] = []
+
+    async def load_vocab(path: str = "vocab.txt") -> List[str]:
+        await asyncio.sleep(0.01)
+        calls.append("vocab")
+        return [path]
+
+    @dataclasses.dataclass
+    class Tokenizer:
+        vocab: load_vocab  # type: ignore
+
+        def __post_init__(self) -> None:
+            # The vocabulary should already be loaded.
+            assert self.vocab == ["custom.txt"]
+            calls.append("tokenizer")
+
+    async def main(tokenizer: Tokenizer, steps: int = 3) -> Tuple[Tokenizer, int]:
+        calls.append("main")
+        return tokenizer, steps
+
+    tokenizer, steps = asyncio.run(
+        dcargs.acli(main, args=["--tokenizer.vocab.path", "custom.txt"])
+    )
+    assert tokenizer.vocab == ["custom.txt"]
+    assert steps == 3
+    assert calls == ["vocab", "tokenizer", "main"]
+
+
+def test_acli_invalid_args():
+    async def main(x: int) -> int:
+        return x
+
+    with pytest.raises(SystemExit):
+        asyncio.run(dcargs.acli(main, args=["--x", "not-an-int"]))
@@ -0,0 +1,85 @@
+import dataclasses
+import gc
+
+import dcargs
+from dcargs import _caching
+
+
+def test_cache_info_counts_hits():
+    @dataclasses.dataclass
+    class Config:
+        x: int = 3
+        """Some docstring."""
+
+    dcargs.cache_clear()
+    assert dcargs.cli(Config, args=[]) == Config()
+    misses = dcargs.cache_info()["docstrings.field_docstring"].misses
+    assert misses > 0
+    assert dcargs.cli(Config, args=["--x", "5"]) == Config(5)
+    info = dcargs.cache_info()["docstrings.field_docstring"]
+    assert info.misses == misses
+    assert info.hits > 0
+
+    dcargs.cache_clear()
+    assert all(info.currsize == 0 for info in dcargs.cache_info().values())
+
+
+def test_dynamic_dataclasses_are_not_kept_alive(make_config):
+    dcargs.cache_clear()
+    for i in range(50):
+        config = make_config(f"Config{i}", 1)
+        assert dcargs.cli(config, args=["--field-0", str(i)]).field_0 == i
+    del config
+    gc.collect()
+
+    # Entries that are only referenced weakly should be dropped after the dynamic
+    # dataclasses are garbage collected.
+    assert dcargs.cache_info()["resolver.resolved_fields"].currsize == 0
+    assert dcargs.cache_info()["docstrings.callable_description"].currsize == 0
+
+
+def test_cache_maxsize(make_config):
+    dcargs.cache_clear()
+    configs = [make_config(f"Config{i}", 1) for i in range(20)]
+    try:
+        dcargs.cache_set_maxsize(4)
+        for config in configs:
+            dcargs.cli(config, args=[])
+        assert all(info.currsize <= 4 for info in dcargs.cache_info().values())
+
+        dcargs.cache_set_maxsize(0, name="resolver.resolved_fields")
+        assert dcargs.cache_info()["resolver.resolved_fields"].currsize == 0
+        dcargs.cli(configs[0], args=[])
+        assert dcargs.cache_info()["resolver.resolved_fields"].currsize == 0
+    finally:
+        dcargs.cache_set_maxsize(_caching.DEFAULT_MAXSIZE)
+
+
+def test_unhashable_keys_are_not_cached():
+    calls = []
+
+    @_caching.cached("tests.unhashable")
+    def f(x):
+        calls.append(x)
+        return len(x)
+
+    assert f([1, 2]) == 2
+    assert f([1, 2]) == 2
+    assert f((1, 2, 3)) == 3
+    assert f((1, 2, 3)) == 3
+    assert calls == [[1, 2], [1, 2], (1, 2, 3)]
+    info = dcargs.cache_info()["tests.unhashable"]
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 1)
+
+
+def test_missing_source_is_cached():
+    # Source code can't be found for dynamic dataclasses. This should only be searched
+    # for once.
+    Config = dataclasses.make_dataclass(
+        "Config", [(f"x{i}", int, dataclasses.field(default=i)) for i in range(5)]
+    )
+    dcargs.cache_clear()
+    assert dcargs.cli(Config, args=[]) == Config()
+    info = dcargs.cache_info()["docstrings.class_tokenization"]
+    assert info.misses == 1
+    assert info.hits >= 4
@@ -381,6 +381,52 @@ def test_choices_in_tuples_2():
         dcargs.cli(A, args=["--x", "None", "False"])
 
 
+def test_choices_in_tuples_3():
+    class Color(enum.Enum):
+        RED = enum.auto()
+        GREEN = enum.auto()
+
+    @dataclasses.dataclass
+    class A:
+        x: Tuple[int, Color, Literal[1, 2]]
+
+    assert dcargs.cli(A, args=["--x", "3", "GREEN", "2"]).x == (3, Color.GREEN, 2)
+    with pytest.raises(SystemExit):
+        dcargs.cli(A, args=["--x", "3", "BLUE", "2"])
+    with pytest.raises(SystemExit):
+        dcargs.cli(A, args=["--x", "3", "GREEN", "3"])
+
+
+def test_long_scalar_sequences():
+    class Color(enum.Enum):
+        RED = enum.auto()
+        GREEN = enum.auto()
+
+    def main(
+        a: List[int],
+        b: Tuple[float, ...],
+        c: FrozenSet[Color],
+        d: Deque[Literal["x", "y"]],
+    ) -> tuple:
+        return a, b, c, d
+
+    n = 10_000
+    a, b, c, d = dcargs.cli(
+        main,
+        args=["--a", *map(str, range(n))]
+        + ["--b", *(["0.5"] * n)]
+        + ["--c", *(["RED", "GREEN"] * n)]
+        + ["--d", *(["x", "y"] * n)],
+    )
+    assert a == list(range(n))
+    assert b == (0.5,) * n
+    assert c == frozenset({Color.RED, Color.GREEN})
+    assert d == collections.deque(["x", "y"] * n)
+
+    with pytest.raises(SystemExit):
+        dcargs.cli(main, args="--a 1 2 x --b 1 --c RED --d x".split(" "))
+
+
 def test_nested_tuple_types():
     @dataclasses.dataclass
     class A:
@@ -450,3 +496,37 @@ def test_double_dict_no_annotation():
             "str": "7",
         }
     }
+
+
+def test_union_sequences():
+    def main(
+        x: List[Union[int, float, str]],
+        y: Tuple[Optional[int], Union[Literal["auto"], float]] = (None, "auto"),
+    ) -> tuple:
+        return x, y
+
+    assert dcargs.cli(main, args="--x 1 2.5 abc -3 1e5 nan".split(" "))[0][:5] == [
+        1,
+        2.5,
+        "abc",
+        -3,
+        1e5,
+    ]
+    assert dcargs.cli(main, args="--x 1 --y None 0.5".split(" "))[1] == (None, 0.5)
+    assert dcargs.cli(main, args="--x 1 --y 3 auto".split(" "))[1] == (3, "auto")
+    with pytest.raises(SystemExit):
+        dcargs.cli(main, args="--x 1 --y 3 manual".split(" "))
+
+
+def test_union_error_message():
+    def main(x: Union[int, Literal["auto"]]) -> Any:
+        return x
+
+    assert dcargs.cli(main, args=["--x", "auto"]) == "auto"
+    assert dcargs.cli(main, args=["--x", "5"]) == 5
+
+    target = io.StringIO()
+    with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
+        dcargs.cli(main, args=["--x", "manual"])
+    assert "invalid literal for int()" in target.getvalue()
+    assert "does not match choices" in target.getvalue()
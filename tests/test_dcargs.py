@@ -208,6 +208,33 @@ def test_default_factory():
     assert dcargs.cli(A, args=[]) == A()
 
 
+def test_default_factory_lazy(capsys):
+    calls = []
+
+    def factory() -> List[int]:
+        calls.append(None)
+        return [1, 2, 3]
+
+    @dataclasses.dataclass
+    class A:
+        x: List[int] = dataclasses.field(default_factory=factory)
+
+    # Factories are only called for fields that aren't overridden.
+    assert dcargs.cli(A, args=["--x", "4"]) == A(x=[4])
+    assert len(calls) == 0
+    assert dcargs.cli(A, args=[]).x == [1, 2, 3]
+    assert len(calls) == 1
+
+    # Mutable defaults aren't shared between calls.
+    assert dcargs.cli(A, args=[]).x is not dcargs.cli(A, args=[]).x
+
+    del calls[:]
+    with pytest.raises(SystemExit):
+        dcargs.cli(A, args=["--help"])
+    assert "(default: 1 2 3)" in capsys.readouterr().out
+    assert len(calls) == 1
+
+
 def test_optional():
     @dataclasses.dataclass
     class A:
@@ -329,6 +356,17 @@ def test_literal_enum():
         assert dcargs.cli(A, args=["--x", "BLUE"])
 
 
+def test_large_literal():
+    names = tuple(f"dataset_{i}" for i in range(1000))
+
+    def main(x: Literal[names], y: Literal[names] = "dataset_3") -> Tuple[str, str]:  # type: ignore
+        return x, y
+
+    assert dcargs.cli(main, args=["--x", "dataset_999"]) == ("dataset_999", "dataset_3")
+    with pytest.raises(SystemExit):
+        dcargs.cli(main, args=["--x", "dataset_1000"])
+
+
 def test_optional_literal():
     @dataclasses.dataclass
     class A:
@@ -1,12 +1,15 @@
 import contextlib
 import dataclasses
 import enum
+import gc
 import io
-from typing import Generic, List, Tuple, Type, TypeVar, Union
+import json
+import weakref
+from typing import Any, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 import pytest
 import yaml
-from typing_extensions import Annotated
+from typing_extensions import Annotated, Literal
 
 import dcargs
 
@@ -417,3 +420,231 @@ def test_superclass():
 
     wrapper1 = Wrapper(TypeASubclass(3))  # Create Wrapper object.
     assert wrapper1 == dcargs.extras.from_yaml(Wrapper, dcargs.extras.to_yaml(wrapper1))
+
+
+def _check_json_identity(cls: Type[T], instance: T) -> None:
+    assert dcargs.extras.from_json(cls, dcargs.extras.to_json(instance)) == instance
+
+
+def test_json_nested_containers():
+    class Color(enum.Enum):
+        RED = enum.auto()
+        GREEN = enum.auto()
+
+    @dataclasses.dataclass
+    class Child:
+        color: Color
+        weights: Tuple[float, ...]
+        name_from_id: Dict[int, str]
+
+    @dataclasses.dataclass
+    class Parent:
+        children: List[Child]
+        pair: Tuple[int, str]
+        tags: Set[str]
+        mode: Literal["a", "b"] = "a"
+        maybe: Optional[int] = None
+
+    instance = Parent(
+        children=[
+            Child(Color.RED, (1.0, 2.5), {1: "one"}),
+            Child(Color.GREEN, (), {}),
+        ],
+        pair=(3, "three"),
+        tags={"x", "y"},
+        mode="b",
+    )
+    _check_json_identity(Parent, instance)
+    out = dcargs.extras.from_json(Parent, dcargs.extras.to_json(instance))
+    assert isinstance(out.pair, tuple)
+    assert isinstance(out.children[0].weights, tuple)
+    assert out.children[0].color is Color.RED
+
+
+def test_json_generics_unions_and_subclasses():
+    @dataclasses.dataclass
+    class CommandOne:
+        a: int
+
+    @dataclasses.dataclass
+    class CommandTwo:
+        b: int
+
+    @dataclasses.dataclass
+    class CommandTwoSubclass(CommandTwo):
+        c: float = 3.0
+
+    T1 = TypeVar("T1")
+    T2 = TypeVar("T2")
+
+    @dataclasses.dataclass
+    class Subparser(Generic[T1, T2]):
+        command: Union[T1, T2]
+        base: CommandTwo = dataclasses.field(default_factory=lambda: CommandTwo(1))
+
+    # Unlike YAML, local generics work fine.
+    _check_json_identity(Subparser[CommandOne, CommandTwo], Subparser(CommandOne(5)))
+    _check_json_identity(
+        Subparser[CommandOne, CommandTwo],
+        Subparser(CommandTwo(7), base=CommandTwoSubclass(2, 5.0)),
+    )
+
+
+def test_json_union_of_primitives():
+    @dataclasses.dataclass
+    class Config:
+        values: List[Union[int, float, str]]
+
+    instance = Config([1, 2.5, "three"])
+    _check_json_identity(Config, instance)
+    out = dcargs.extras.from_json(Config, dcargs.extras.to_json(instance))
+    assert list(map(type, out.values)) == [int, float, str]
+
+
+def test_json_missing():
+    @dataclasses.dataclass
+    class TupleGenericVariableMissing(Generic[ScalarType]):
+        xyz: Tuple[ScalarType, ...]
+
+    x = TupleGenericVariableMissing[int](xyz=(dcargs.MISSING, 3))
+    out = dcargs.extras.from_json(
+        TupleGenericVariableMissing[int], dcargs.extras.to_json(x)
+    )
+    assert out.xyz[0] is dcargs.MISSING and out.xyz[1] == 3
+
+
+def test_json_pluggable_backend():
+    @dataclasses.dataclass
+    class Config:
+        x: int
+        y: Tuple[str, str]
+
+    calls = []
+
+    def dumps(x: Any) -> bytes:
+        calls.append("dumps")
+        return json.dumps(x).encode("utf-8")
+
+    def loads(x: bytes) -> Any:
+        calls.append("loads")
+        return json.loads(x.decode("utf-8"))
+
+    serialized = dcargs.extras.to_json(Config(1, ("a", "b")), dumps=dumps)
+    assert isinstance(serialized, bytes)
+    assert dcargs.extras.from_json(Config, serialized, loads=loads) == Config(
+        1, ("a", "b")
+    )
+    assert calls == ["dumps", "loads"]
+
+
+def test_json_any_and_numbers():
+    @dataclasses.dataclass
+    class Inner:
+        x: int
+
+    @dataclasses.dataclass
+    class Config:
+        anything: Any
+        count: int = 1
+        scale: float = 1.0
+
+    # Values annotated as `Any` are decoded as JSON primitives.
+    out = dcargs.extras.from_json(Config, dcargs.extras.to_json(Config(Inner(2))))
+    assert out == Config({"x": 2})
+
+    assert (
+        dcargs.extras.from_json(Config, '{"anything": null, "count": 2.0}').count == 2
+    )
+    assert (
+        dcargs.extras.from_json(Config, '{"anything": null, "scale": 2}').scale == 2.0
+    )
+    with pytest.raises(ValueError):
+        dcargs.extras.from_json(Config, '{"anything": null, "count": 2.9}')
+    with pytest.raises(ValueError):
+        dcargs.extras.from_json(Config, '{"anything": null, "scale": "2"}')
+
+
+def test_json_subclass_defined_after_decode():
+    @dataclasses.dataclass
+    class Base:
+        x: int
+
+    @dataclasses.dataclass
+    class Other(Base):
+        pass
+
+    @dataclasses.dataclass
+    class Wrapper:
+        model: Union[Base, int]
+
+    _check_json_identity(Wrapper, Wrapper(Other(1)))
+
+    @dataclasses.dataclass
+    class Plugin(Base):
+        y: int = 3
+
+    _check_json_identity(Wrapper, Wrapper(Plugin(1)))
+
+
+def test_contained_special_types_index_tracks_new_subclasses(monkeypatch):
+    from dcargs.extras import _serialization
+
+    @dataclasses.dataclass
+    class Base:
+        x: int
+
+    @dataclasses.dataclass
+    class Wrapper:
+        model: Base
+
+    assert _serialization._get_contained_special_types_from_type(Wrapper) == {
+        Wrapper,
+        Base,
+    }
+
+    # Repeated calls should be served from the index, without walking the graph.
+    node = _serialization._get_type_graph_node(Wrapper)
+
+    def fail(typ):
+        assert False, "Type graph should not be walked!"
+
+    with monkeypatch.context() as m:
+        m.setattr(_serialization, "_get_type_graph_node", fail)
+        assert _serialization._get_contained_special_types_from_type(Wrapper) == {
+            Wrapper,
+            Base,
+        }
+    assert _serialization._get_type_graph_node(Wrapper) is node
+
+    # New subclasses should be found without rebuilding nodes.
+    class Color(enum.Enum):
+        RED = enum.auto()
+
+    @dataclasses.dataclass
+    class Plugin(Base):
+        color: Color = Color.RED
+
+    assert _serialization._get_contained_special_types_from_type(Wrapper) == {
+        Wrapper,
+        Base,
+        Plugin,
+        Color,
+    }
+    assert _serialization._get_type_graph_node(Wrapper) is node
+
+    wrapper = Wrapper(Plugin(3))
+    assert wrapper == dcargs.extras.from_yaml(Wrapper, dcargs.extras.to_yaml(wrapper))
+    _check_json_identity(Wrapper, wrapper)
+
+
+def test_serialization_does_not_keep_types_alive():
+    refs = []
+    for i in range(50):
+        Inner = dataclasses.make_dataclass(f"Inner{i}", [("x", int)])
+        Outer = dataclasses.make_dataclass(f"Outer{i}", [("inner", Inner)])
+        dcargs.extras.to_yaml(Outer(Inner(i)))
+        refs.append(weakref.ref(Outer))
+        del Inner, Outer
+
+    gc.collect()
+    assert all(ref() is None for ref in refs)
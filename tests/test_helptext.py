@@ -1,8 +1,10 @@
+import argparse
 import contextlib
 import dataclasses
 import enum
 import io
 import pathlib
+import shutil
 from collections.abc import Callable
 from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Union, cast
 
@@ -12,6 +14,7 @@ from typing_extensions import Annotated, Literal
 
 import dcargs
 import dcargs._argparse_formatter
+import dcargs._parsers
 import dcargs._strings
 
 
@@ -593,3 +596,282 @@ def test_suppressed():
     helptext = _get_helptext(main)
     assert "--x.a" in helptext
     assert "--x.b" not in helptext
+
+
+def test_helptext_cache(monkeypatch):
+    @dataclasses.dataclass
+    class Subcommand:
+        value: int = 3
+        """Documentation for value."""
+
+    @dataclasses.dataclass
+    class OtherSubcommand:
+        other_value: int = 5
+
+    def main(command: Union[Subcommand, OtherSubcommand], flag: bool = False) -> None:
+        """Description for main."""
+
+    helptext = _get_helptext(main)
+    subcommand_helptext = _get_helptext(main, args=["command:subcommand", "--help"])
+    assert "Description for main." in helptext
+    assert "Documentation for value. (default: 3)" in subcommand_helptext
+
+    # Helptext should now be served from the cache, without building any parsers.
+    def fail(*args, **kwargs):
+        assert False, "Helptext should be cached!"
+
+    monkeypatch.setattr(dcargs._parsers.ParserSpecification, "apply", fail)
+    assert _get_helptext(main) == helptext
+    assert _get_helptext(main, args=["command:subcommand", "-h"]) == subcommand_helptext
+
+    # Different terminal widths should not share entries.
+    monkeypatch.setenv("COLUMNS", "200")
+    with pytest.raises(AssertionError):
+        _get_helptext(main)
+
+
+def test_helptext_cache_does_not_render_defaults():
+    calls: List[str] = []
+
+    def make_names() -> List[str]:
+        calls.append("names")
+        return ["a", "b"]
+
+    @dataclasses.dataclass
+    class Config:
+        names: List[str] = dataclasses.field(default_factory=make_names)
+        """Some names."""
+
+    assert "Some names. (default: a b)" in _get_helptext(Config)
+    num_calls = len(calls)
+    assert num_calls > 0
+
+    # Cache hits shouldn't format helptext, or call default factories.
+    _get_helptext(Config)
+    assert len(calls) == num_calls
+
+
+def test_helptext_cache_is_opt_in(monkeypatch):
+    monkeypatch.delenv("DCARGS_CACHE_DIR")
+    assert dcargs._disk_cache.get_cache_dir() is None
+
+
+def test_helptext_cache_eviction(monkeypatch):
+    def main(x: int = 3) -> None:
+        pass
+
+    monkeypatch.setattr(dcargs._disk_cache, "_MAX_ENTRIES_FROM_NAMESPACE", {"help": 2})
+    for columns in ("80", "100", "120"):
+        monkeypatch.setenv("COLUMNS", columns)
+        _get_helptext(main)
+    help_dir = dcargs._disk_cache.get_cache_dir() / "help"
+    assert len(list(help_dir.iterdir())) == 2
+
+    # Upgrading dcargs should invalidate cached helptext.
+    _get_helptext(main)
+    monkeypatch.setattr(dcargs._disk_cache, "_get_package_version", lambda: "999")
+
+    def fail(*args, **kwargs):
+        assert False, "Helptext should not be cached!"
+
+    monkeypatch.setattr(dcargs._parsers.ParserSpecification, "apply", fail)
+    with pytest.raises(AssertionError):
+        _get_helptext(main)
+
+
+def test_help_group():
+    @dataclasses.dataclass
+    class Encoder:
+        """Encoder config."""
+
+        layers: int = 3
+        """Number of layers."""
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Encoder
+        width: int = 32
+
+    @dataclasses.dataclass
+    class Optimizer:
+        learning_rate: float = 1e-3
+
+    @dataclasses.dataclass
+    class Config:
+        model: Model
+        optimizer: Union[Optimizer, Encoder]
+
+    helptext = _get_helptext(Config, args=["--help-group", "model.encoder"])
+    assert "model.encoder arguments" in helptext
+    assert "Encoder config." in helptext
+    assert "Number of layers. (default: 3)" in helptext
+    assert "--model.width" not in helptext
+    assert "usage" not in helptext
+
+    helptext = _get_helptext(Config, args=["--help-group=model"])
+    assert "--model.width" in helptext
+    assert "--model.encoder.layers" in helptext
+    assert "--optimizer.learning-rate" not in helptext
+
+    # Groups in subparsers should be searched as well.
+    helptext = _get_helptext(Config, args=["--help-group", "optimizer"])
+    assert "--optimizer.learning-rate" in helptext
+    assert "--optimizer.layers" in helptext
+
+    target = io.StringIO()
+    with pytest.raises(SystemExit) as e, contextlib.redirect_stderr(target):
+        dcargs.cli(Config, args=["--help-group", "decoder"])
+    assert e.value.code == 2
+    assert "decoder" in target.getvalue()
+
+    # The flag should be documented, and included in completion scripts.
+    assert "--help-group PREFIX" in _get_helptext(Config)
+    target = io.StringIO()
+    with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
+        dcargs.cli(Config, args=["--dcargs-print-completion", "bash"])
+    assert "--help-group" in target.getvalue()
+
+
+def test_help_group_field():
+    @dataclasses.dataclass
+    class Inner:
+        x: int = 1
+
+    def main(inner: Inner, help_group: str = "users") -> str:
+        return help_group
+
+    # Fields named `help_group` take precedence over the flag.
+    assert dcargs.cli(main, args=["--help-group", "admins"]) == "admins"
+    assert "--help-group STR" in _get_helptext(main)
+
+
+def test_help_group_not_added_without_groups():
+    def main(name: str = "x", count: int = 1) -> str:
+        return name
+
+    # Flat CLIs have no groups to print, so their helptext is unchanged.
+    assert "--help-group" not in _get_helptext(main)
+    target = io.StringIO()
+    with pytest.raises(SystemExit) as e, contextlib.redirect_stderr(target):
+        dcargs.cli(main, args=["--help-group", "x"])
+    assert e.value.code == 2
+    assert "unrecognized arguments" in target.getvalue()
+
+
+def test_help_group_as_option_value():
+    @dataclasses.dataclass
+    class Inner:
+        x: int = 1
+
+    def main(inner: Inner, name: str = "x") -> str:
+        return name
+
+    # `--help-group` is the value of `--name` here, so it shouldn't print helptext.
+    # argparse rejects values that look like flags.
+    target = io.StringIO()
+    with pytest.raises(SystemExit) as e, contextlib.redirect_stderr(target):
+        dcargs.cli(main, args=["--name", "--help-group", "inner"])
+    assert e.value.code == 2
+    assert "--name" in target.getvalue()
+
+
+def test_terminal_size_only_queried_for_helptext(monkeypatch):
+    @dataclasses.dataclass
+    class Inner:
+        a: int = 1
+        b: Tuple[int, int] = (1, 2)
+
+    @dataclasses.dataclass
+    class Config:
+        inner: Inner
+        c: Optional[int] = None
+
+    calls = []
+    get_terminal_size = shutil.get_terminal_size
+    monkeypatch.setattr(
+        shutil,
+        "get_terminal_size",
+        lambda *args: calls.append(args) or get_terminal_size(*args),
+    )
+    assert dcargs.cli(Config, args=["--inner.a", "3"]) == Config(Inner(a=3))
+    assert calls == []
+
+    helptext = _get_helptext(Config)
+    assert "--inner.a INT" in helptext
+    assert len(calls) > 0
+
+
+def test_large_choices_helptext():
+    LargeEnum = enum.Enum("LargeEnum", {f"CLASS_{i}": i for i in range(1000)})  # type: ignore
+
+    def main(
+        label: LargeEnum,  # type: ignore
+        names: List[Literal[tuple(f"name_{i}" for i in range(1000))]],  # type: ignore
+    ) -> None:
+        pass
+
+    helptext = _get_helptext(main)
+    assert "{CLASS_0,CLASS_1," in helptext
+    assert ",...,CLASS_999}" in helptext
+    assert "CLASS_500" not in helptext
+    assert ",...,name_999}" in helptext
+    assert "name_500" not in helptext
+
+
+def test_default_formatted_only_for_helptext():
+    calls: List[float] = []
+
+    class Value(float):
+        def __str__(self) -> str:
+            calls.append(self)
+            return super().__str__()
+
+    def main(values: List[float] = [Value(1.0), Value(2.5)]) -> List[float]:
+        return values
+
+    assert dcargs.cli(main, args=[]) == [1.0, 2.5]
+    assert dcargs.cli(main, args=["--values", "3"]) == [3.0]
+    assert calls == []
+
+    helptext = _get_helptext(main)
+    assert "(default: 1.0 2.5)" in helptext
+    assert len(calls) > 0
+
+
+def test_large_default():
+    def main(values: List[int] = list(range(1_000_000))) -> int:
+        return len(values)
+
+    assert dcargs.cli(main, args=[]) == 1_000_000
+    assert dcargs.cli(main, args=["--values", "1", "2"]) == 2
+
+
+@pytest.mark.parametrize(
+    "num_options,num_positionals,prog",
+    [(30, 0, "prog"), (3, 12, "prog"), (10, 10, "x" * 70), (0, 0, "prog")],
+)
+def test_usage_matches_argparse(
+    monkeypatch, num_options: int, num_positionals: int, prog: str
+):
+    monkeypatch.setenv("COLUMNS", "80")
+
+    def format_usage(formatter_class: Any, colors: bool) -> str:
+        metavar = dcargs._strings.colored("INT", attrs=["bold"]) if colors else "INT"
+        parser = argparse.ArgumentParser(prog=prog, formatter_class=formatter_class)
+        for i in range(num_options):
+            parser.add_argument(f"--option-{i}", metavar=metavar)
+        for i in range(num_positionals):
+            parser.add_argument(f"positional_{i}", metavar=metavar)
+        return parser.format_usage()
+
+    # Wrapped usage should match argparse, with ANSI sequences ignored.
+    expected = format_usage(argparse.HelpFormatter, colors=False)
+    formatter_class = dcargs._argparse_formatter.make_formatter_class(0)
+    assert format_usage(formatter_class, colors=False) == expected
+    assert (
+        dcargs._strings.strip_ansi_sequences(format_usage(formatter_class, colors=True))
+        == expected
+    )
+    if num_options + num_positionals > 10:
+        # Usage should be wrapped.
+        assert expected.count("\n") >= 2
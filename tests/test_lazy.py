@@ -0,0 +1,123 @@
+import dataclasses
+import pickle
+import threading
+import time
+from typing import List, Union
+
+import pytest
+
+import dcargs
+from dcargs import _lazy
+
+
+def test_lazy_nested():
+    calls: List[int] = []
+
+    class Tokenizer:
+        def __init__(self, vocab_size: int = 100) -> None:
+            calls.append(vocab_size)
+            self.vocab_size = vocab_size
+
+    @dataclasses.dataclass
+    class Config:
+        tokenizer: dcargs.conf.Lazy[Tokenizer]
+        x: int = 3
+
+    config = dcargs.cli(Config, args=["--tokenizer.vocab-size", "5"])
+    assert calls == []
+    assert config.x == 3
+    assert not _lazy.is_evaluated(config.tokenizer)  # type: ignore
+
+    assert isinstance(config.tokenizer, Tokenizer)
+    assert config.tokenizer.vocab_size == 5
+    assert config.tokenizer.vocab_size == 5
+    assert calls == [5]
+
+
+def test_lazy_validates_eagerly():
+    class Expensive:
+        def __init__(self, size: int) -> None:
+            assert False, "Should not be instantiated!"
+
+    def main(expensive: dcargs.conf.Lazy[Expensive]) -> None:
+        pass
+
+    with pytest.raises(SystemExit):
+        dcargs.cli(main, args=["--expensive.size", "not-an-int"])
+    dcargs.cli(main, args=["--expensive.size", "3"])
+
+
+def test_lazy_only_outermost_is_proxied():
+    calls: List[str] = []
+
+    @dataclasses.dataclass
+    class Inner:
+        a: int = 1
+
+        def __post_init__(self) -> None:
+            calls.append("inner")
+
+    @dataclasses.dataclass
+    class Outer:
+        inner: Inner
+        b: int = 2
+
+        def __post_init__(self) -> None:
+            calls.append("outer")
+
+    @dataclasses.dataclass
+    class Config:
+        outer: dcargs.conf.Lazy[Outer]
+
+    config = dcargs.cli(Config, args=["--outer.inner.a", "3"])
+    assert calls == []
+    assert config.outer.inner == Inner(3)
+    assert calls == ["inner", "outer", "inner"]
+    assert type(object.__getattribute__(config.outer, "_lazy_value").inner) is Inner
+    assert config == Config(Outer(Inner(3)))
+
+
+@dataclasses.dataclass(frozen=True)
+class DatasetA:
+    path: str = "a"
+
+
+@dataclasses.dataclass(frozen=True)
+class DatasetB:
+    path: str = "b"
+
+
+def test_lazy_subcommands():
+    def main(dataset: dcargs.conf.Lazy[Union[DatasetA, DatasetB]]) -> DatasetB:
+        return dataset  # type: ignore
+
+    out = dcargs.cli(main, args=["dataset:dataset-b", "--dataset.path", "c"])
+    assert not _lazy.is_evaluated(out)  # type: ignore
+    assert out == DatasetB("c")
+    assert pickle.loads(pickle.dumps(out)) == DatasetB("c")
+
+
+def test_lazy_thread_safe():
+    calls: List[int] = []
+
+    class Slow:
+        def __init__(self, x: int = 0) -> None:
+            calls.append(x)
+            time.sleep(0.05)
+            self.x = x
+
+    @dataclasses.dataclass
+    class Config:
+        slow: dcargs.conf.Lazy[Slow]
+
+    config = dcargs.cli(Config, args=[])
+    results: List[int] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(config.slow.x)) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [0] * 8
+    assert calls == [0]
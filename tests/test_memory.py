@@ -0,0 +1,102 @@
+import dataclasses
+import pickle
+import weakref
+from typing import Union
+
+import pytest
+
+import dcargs
+from dcargs import _cli
+
+
+def test_memory_report_prefixes() -> None:
+    @dataclasses.dataclass
+    class Inner:
+        a: int = 1
+
+    @dataclasses.dataclass
+    class OptionA:
+        x: int = 1
+
+    @dataclasses.dataclass
+    class OptionB:
+        y: int = 1
+
+    @dataclasses.dataclass
+    class Config:
+        inner: Inner
+        option: Union[OptionA, OptionB]
+        b: int = 2
+
+    report = dcargs.memory_report(Config)
+    assert report.spec_bytes_from_prefix.keys() == {"", "inner", "option"}
+    assert report.parser_bytes_from_prefix.keys() == {"", "inner", "option"}
+    assert all(size > 0 for size in report.spec_bytes_from_prefix.values())
+    assert all(size > 0 for size in report.parser_bytes_from_prefix.values())
+    assert "(root)" in str(report)
+
+
+def test_memory_budget(make_config) -> None:
+    num_fields = 100
+    A = make_config("A", num_fields)
+    B = make_config("B", num_fields)
+    C = make_config("C", num_fields)
+    Root = dataclasses.make_dataclass(
+        "Root", [("shared", C), ("x", Union[A, B]), ("y", Union[A, B])]
+    )
+
+    dcargs.cache_clear()
+    report = dcargs.memory_report(Root)
+
+    # The specification has one argument per field. In argparse, the subparser tree
+    # for `y` is duplicated under both subcommands for `x`.
+    num_arguments = 5 * num_fields
+    num_actions = 7 * num_fields
+
+    assert report.spec_bytes < 4096 * num_arguments
+    assert report.parser_bytes < 4096 * num_actions
+    assert sum(report.spec_bytes_from_prefix.values()) < 2048 * num_arguments
+    assert sum(report.parser_bytes_from_prefix.values()) < 1024 * num_actions
+
+
+@dataclasses.dataclass
+class PickleConfig:
+    """Config.
+
+    Args:
+        a: An integer.
+    """
+
+    a: int = 3
+    b: Union[int, str] = "b"
+
+
+def test_specification_slots_and_pickling() -> None:
+    spec = _cli._build_spec(
+        PickleConfig,
+        prog=None,
+        description=None,
+        default=None,
+        deprecated_kwargs={},
+    ).parser_definition
+    arg = spec.args[0]
+    assert arg.lowered.name_or_flag == "--a"
+    for obj in (spec, arg, arg.field, arg.lowered):
+        assert not hasattr(obj, "__dict__")
+
+    # Specifications are still frozen, and can be referenced weakly.
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        arg._lowered = None  # type: ignore
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        arg.field = None  # type: ignore
+    assert weakref.ref(spec)() is spec
+
+    # Markers sets are shared between fields.
+    assert spec.args[0].field.markers is spec.args[1].field.markers
+
+    # Cached lowered arguments aren't pickled.
+    spec_copy = pickle.loads(pickle.dumps(spec))
+    assert spec_copy == spec
+    assert spec_copy.args[0].field == arg.field
+    assert spec_copy.args[0].lowered.name_or_flag == "--a"
+    assert spec_copy.args[0].lowered.help == arg.lowered.help
@@ -6,6 +6,7 @@ from typing import Tuple
 import pytest
 
 import dcargs
+from dcargs import _fields
 
 
 def test_missing():
@@ -71,3 +72,38 @@ def test_missing_nested_default():
         args=["--child.a", "5", "--child.b", "7", "--child.c", "3"],
         default=Parent(child=dcargs.MISSING),
     ) == Parent(Child(5, 7, 3))
+
+
+def test_array_defaults():
+    np = pytest.importorskip("numpy")
+
+    # Array defaults can't be compared to sentinels via `==`, which is elementwise.
+    num_fields = 100
+    Config = dataclasses.make_dataclass(
+        "Config",
+        [
+            (
+                f"array_{i}",
+                np.ndarray,
+                dataclasses.field(default_factory=lambda: np.zeros(1000)),
+            )
+            for i in range(num_fields)
+        ]
+        + [("x", int, dataclasses.field(default=3))],
+    )
+
+    out = dcargs.cli(Config, args=["--x", "4"])
+    assert out.x == 4
+    assert all(getattr(out, f"array_{i}").shape == (1000,) for i in range(num_fields))
+
+    default = Config(**{f"array_{i}": np.ones(1000) for i in range(num_fields)})
+    out = dcargs.cli(Config, args=[], default=default)
+    assert out.x == 3
+    assert getattr(out, "array_0") is getattr(default, "array_0")
+
+
+def test_is_missing():
+    assert _fields.is_missing(dcargs.MISSING)
+    assert _fields.is_missing(dataclasses.MISSING)
+    assert not _fields.is_missing(None)
+    assert not _fields.is_missing("missing")
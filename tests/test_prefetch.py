@@ -0,0 +1,76 @@
+import contextlib
+import dataclasses
+import io
+from typing import Any, Tuple
+
+import pytest
+
+import dcargs
+import dcargs._argparse_formatter
+import dcargs._cli
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    x: int
+    """Some integer."""
+    y: Tuple[str, ...] = ("a", "b")
+
+
+def test_prefetch():
+    handle = dcargs.prefetch(Config)
+    assert handle.cli(args=["--x", "3"]) == Config(3)
+    assert handle.cli(args=["--x", "4", "--y", "c"]) == Config(4, ("c",))
+
+    handle = dcargs.prefetch(Config, default=Config(5))
+    assert handle.cli(args=[]) == Config(5)
+
+    handle = dcargs.prefetch(int)
+    assert handle.cli(args=["3"]) == 3
+
+
+def test_prefetch_reuses_parser(monkeypatch: pytest.MonkeyPatch):
+    handle = dcargs.prefetch(Config, prog="prog")
+    handle._thread.join()
+
+    def fail(*args, **kwargs):
+        assert False, "The prefetched parser should be reused!"
+
+    monkeypatch.setattr(dcargs._cli, "_build_spec", fail)
+    monkeypatch.setattr(dcargs._cli, "_build_parser", fail)
+    assert handle.cli(args=["--x", "3"], max_workers=2) == Config(3)
+
+
+def test_prefetch_fallback(monkeypatch: pytest.MonkeyPatch):
+    build_parser = dcargs._cli._build_parser
+    calls = []
+
+    def flaky_build_parser(spec):
+        calls.append(spec)
+        if len(calls) == 1:
+            raise RuntimeError("Failed in the background!")
+        return build_parser(spec)
+
+    monkeypatch.setattr(dcargs._cli, "_build_parser", flaky_build_parser)
+    handle = dcargs.prefetch(Config)
+    assert handle.cli(args=["--x", "3"]) == Config(3)
+    assert len(calls) == 2
+
+
+def test_prefetch_errors_are_raised_from_cli():
+    def main(x: Any) -> None:
+        pass
+
+    handle = dcargs.prefetch(main)
+    with pytest.raises(dcargs.UnsupportedTypeAnnotationError):
+        handle.cli(args=[])
+
+
+def test_prefetch_colors():
+    handle = dcargs.prefetch(Config)
+    target = io.StringIO()
+    with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
+        with dcargs._argparse_formatter.dummy_termcolor_context():
+            handle.cli(args=["--help"])
+    assert "Some integer." in target.getvalue()
+    assert "\x1b" not in target.getvalue()
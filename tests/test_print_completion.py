@@ -1,9 +1,14 @@
 import contextlib
 import dataclasses
 import io
+import json
+import pathlib
+import subprocess
+import sys
 from typing import Union
 
 import pytest
+from typing_extensions import Literal
 
 import dcargs
 
@@ -41,3 +46,164 @@ def test_zsh():
     with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
         dcargs.cli(Wrapper, args=["--dcargs-print-completion", "zsh"])
     assert "# AUTOMATCALLY GENERATED by `shtab`" in target.getvalue()
+
+
+def test_completion_cache(monkeypatch):
+    target = io.StringIO()
+    with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
+        dcargs.cli(Wrapper, args=["--dcargs-print-completion", "bash"])
+    script = target.getvalue()
+
+    # Second call should be served from the cache, without running shtab.
+    def fail(*args, **kwargs):
+        assert False, "Completion script should be cached!"
+
+    monkeypatch.setattr(dcargs._shtab, "complete", fail)
+    target = io.StringIO()
+    with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
+        dcargs.cli(Wrapper, args=["--dcargs-print-completion", "bash"])
+    assert target.getvalue() == script
+
+    # Changes to the CLI should invalidate the cache.
+    with pytest.raises(AssertionError):
+        dcargs.cli(Wrapper, args=["--dcargs-print-completion", "zsh"])
+    with pytest.raises(AssertionError):
+        dcargs.cli(TypeA, args=["--dcargs-print-completion", "bash"])
+
+
+def test_completion_entry_point(capsys):
+    from dcargs import __main__
+
+    __main__.main(["completion", f"{__name__}:Wrapper", "--shell", "zsh"])
+    script = capsys.readouterr().out
+    assert "# AUTOMATCALLY GENERATED by `shtab`" in script
+    assert "_shtab_dcargs_Wrapper" in script
+
+
+def test_completion_entry_point_exit_code(monkeypatch):
+    from dcargs import __main__
+
+    def fail(*args, **kwargs):
+        raise SystemExit(2)
+
+    monkeypatch.setattr(dcargs, "cli", fail)
+    with pytest.raises(SystemExit) as e:
+        __main__.main(["completion", f"{__name__}:Wrapper"])
+    assert e.value.code == 2
+
+
+@dataclasses.dataclass(frozen=True)
+class PathConfig:
+    output_dir: pathlib.Path
+    mode: Literal["fast", "slow"] = "fast"
+    supertype: Union[TypeA, TypeB] = TypeA()
+
+
+def _get_dynamic_index(f) -> dict:
+    target = io.StringIO()
+    with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
+        dcargs.cli(f, prog="prog", args=["--dcargs-print-dynamic-completion", "bash"])
+    script = target.getvalue()
+    assert "complete -F _dcargs_dynamic_prog prog" in script
+
+    (index_path,) = (dcargs._disk_cache.get_cache_dir() / "completion_index").iterdir()
+    return json.loads(index_path.read_text())
+
+
+def test_dynamic_completion(tmp_path):
+    from dcargs import _dynamic_completer
+
+    index = _get_dynamic_index(PathConfig)
+    complete = _dynamic_completer.complete
+
+    assert "--output-dir" in complete(index, ["--"])
+    assert complete(index, ["--mo"]) == ["--mode"]
+    assert complete(index, ["--mode", ""]) == ["fast", "slow"]
+    assert complete(index, ["--mode=s"]) == []
+    assert complete(index, ["supertype:type"]) == [
+        "supertype:type-a",
+        "supertype:type-b",
+    ]
+    assert "--supertype.subtype.data" in complete(index, ["supertype:type-b", "--s"])
+
+    (tmp_path / "some_dir").mkdir()
+    assert complete(index, ["--output-dir", str(tmp_path / "some")]) == [
+        str(tmp_path / "some_dir") + "/"
+    ]
+
+
+def test_dynamic_completion_errors(monkeypatch):
+    from dcargs import __main__
+
+    with pytest.raises(ValueError):
+        dcargs.cli(PathConfig, args=["--dcargs-print-dynamic-completion", "tcsh"])
+    with pytest.raises(SystemExit) as e:
+        __main__.main(
+            ["completion", f"{__name__}:PathConfig", "--shell", "tcsh", "--dynamic"]
+        )
+    assert e.value.code == 2
+
+    monkeypatch.setenv("DCARGS_CACHE_DIR", "")
+    with pytest.raises(RuntimeError):
+        dcargs.cli(PathConfig, args=["--dcargs-print-dynamic-completion", "bash"])
+
+
+def test_dynamic_completion_subprocess():
+    from dcargs import _dynamic_completer
+
+    index = _get_dynamic_index(Wrapper)
+    (index_path,) = (dcargs._disk_cache.get_cache_dir() / "completion_index").iterdir()
+    assert index["parsers"][0]["subcommands"] == [
+        {"supertype:type-a": 1, "supertype:type-b": 2}
+    ]
+
+    # The completer should run without dcargs on the path, and strip parts of the
+    # current word that the shell treats as separate words.
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-S",
+            _dynamic_completer.__file__,
+            str(index_path),
+            "prog supertype:",
+            "15",
+            ":",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+        cwd="/",
+        env={},
+    ).stdout.decode()
+    assert out.split() == [":type-a", ":type-b"]
+
+
+@dataclasses.dataclass(frozen=True)
+class TypeC:
+    c: int = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class TypeD:
+    d: int = 1
+
+
+def _three_groups(
+    first: Union[TypeA, TypeB], second: Union[TypeC, TypeD], third: Union[TypeA, TypeB]
+) -> None:
+    pass
+
+
+def test_completion_shares_identical_subparsers():
+    # 2 x 2 x 2 leaves, but only 1 + 2 + 2 + 2 distinct parsers.
+    target = io.StringIO()
+    with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
+        dcargs.cli(_three_groups, args=["--dcargs-print-completion", "bash"])
+    script = target.getvalue()
+    assert script.count("_option_strings=(") == 7
+    assert script.count("_alias=") == 4
+
+    target = io.StringIO()
+    with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
+        dcargs.cli(_three_groups, args=["--dcargs-print-completion", "zsh"])
+    script = target.getvalue()
+    assert script.count("_options=(") == 7
@@ -0,0 +1,112 @@
+import dataclasses
+import threading
+from typing import Dict, Union
+
+import pytest
+
+import dcargs
+
+
+@dataclasses.dataclass
+class Inner:
+    """Inner config.
+
+    Args:
+        b: Documented in the class docstring.
+    """
+
+    a: int = 1
+    """Documented with a field docstring."""
+    b: int = 2
+
+
+@dataclasses.dataclass
+class OptionA:
+    x: int = 3
+
+
+@dataclasses.dataclass
+class OptionB:
+    y: int = 4
+
+
+@dataclasses.dataclass
+class Config:
+    inner: Inner
+    option: Union[OptionA, OptionB]
+    c: str = "c"
+
+
+def test_stats_counts() -> None:
+    dcargs.cache_clear()
+    dcargs.cli(Config, args=["option:option-a"])
+    stats = dcargs.stats()
+
+    assert stats.field_lists > 0
+    assert stats.nested_type_checks > 0
+    assert stats.type_hints > 0
+    assert stats.source_lookups > 0
+    assert stats.tokenizations > 0
+    assert stats.docstring_parses > 0
+    assert stats.instantiators > 0
+    # Inner.a, Inner.b, c, OptionA.x, OptionB.y, and one group of subparsers.
+    assert stats.argparse_actions == 6
+
+
+def test_stats_per_call() -> None:
+    dcargs.cache_clear()
+    dcargs.cli(Config, args=["option:option-b"])
+    first = dcargs.stats()
+
+    # Expensive work is cached between calls, but argparse actions are always
+    # created.
+    dcargs.cli(Config, args=["option:option-b"])
+    second = dcargs.stats()
+    assert second.source_lookups == 0
+    assert second.tokenizations == 0
+    assert second.instantiators == 0
+    assert second.argparse_actions == first.argparse_actions
+
+    def main(x: int) -> int:
+        return x
+
+    dcargs.cli(main, args=["--x", "3"])
+    assert dcargs.stats().argparse_actions == 1
+
+
+def test_stats_recorded_on_exit() -> None:
+    with pytest.raises(SystemExit):
+        dcargs.cli(Config, args=["--help"])
+    assert dcargs.stats().field_lists > 0
+
+
+def test_stats_context_local() -> None:
+    dcargs.cli(Config, args=["option:option-a"])
+    expected = dcargs.stats()
+
+    out: Dict[str, dcargs._stats.Stats] = {}
+
+    def main(x: int = 1) -> int:
+        return x
+
+    def run() -> None:
+        out["before"] = dcargs.stats()
+        dcargs.cli(main, args=[])
+        out["after"] = dcargs.stats()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+
+    assert out["before"] == dcargs._stats.Stats()
+    assert out["after"].argparse_actions == 1
+    assert dcargs.stats() == expected
+
+
+def test_stats_prefetch() -> None:
+    dcargs.cache_clear()
+    handle = dcargs.prefetch(Config)
+    handle.cli(args=["option:option-a"])
+    stats = dcargs.stats()
+    assert stats.source_lookups > 0
+    assert stats.argparse_actions == 6
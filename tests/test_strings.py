@@ -19,3 +19,26 @@ def test_make_field_name():
         _strings.make_field_name(["hello_world", "---hello_world"])
         == "hello-world.---hello-world"
     )
+
+
+def test_visible_len():
+    assert _strings.visible_len("hello") == 5
+    assert _strings.visible_len("\x1b[1mhello\x1b[0m") == 5
+    assert _strings.visible_len("\x1b[31m\x1b[1mhello\x1b[0m world") == 11
+
+
+def test_visible_index():
+    assert _strings.visible_index("hello", 3) == 3
+    assert _strings.visible_index("\x1b[1mhello\x1b[0m", 0) == 0
+    assert _strings.visible_index("\x1b[1mhello\x1b[0m", 3) == len("\x1b[1mhel")
+    assert _strings.visible_index("\x1b[1mhello\x1b[0m", 10) == len(
+        "\x1b[1mhello\x1b[0m"
+    )
+
+
+def test_wrap_long_word_with_ansi():
+    from dcargs import _argparse_formatter
+
+    word = "".join(f"\x1b[1m{c}\x1b[0m" for c in "abcdefghij")
+    lines = _argparse_formatter._AnsiTextWrapper(width=4).wrap(word)
+    assert list(map(_strings.strip_ansi_sequences, lines)) == ["abcd", "efgh", "ij"]
@@ -0,0 +1,167 @@
+import dataclasses
+import random
+import threading
+import time
+from typing import List, Tuple
+
+import pytest
+
+import dcargs
+
+
+def test_thread_pool_concurrent_siblings():
+    # Each constructor waits for the other one to start, so this only finishes if
+    # siblings are built concurrently.
+    barrier = threading.Barrier(2, timeout=5.0)
+    thread_ids: List[int] = []
+
+    @dataclasses.dataclass
+    class Vocab:
+        path: str = "vocab.txt"
+
+        def __post_init__(self) -> None:
+            thread_ids.append(threading.get_ident())
+            barrier.wait()
+
+    @dataclasses.dataclass
+    class Index:
+        path: str = "index.bin"
+
+        def __post_init__(self) -> None:
+            thread_ids.append(threading.get_ident())
+            barrier.wait()
+
+    @dataclasses.dataclass
+    class Config:
+        vocab: Vocab
+        index: Index
+        steps: int = 3
+
+    config = dcargs.cli(Config, args=["--vocab.path", "v.txt"], max_workers=2)
+    assert (config.vocab.path, config.index.path) == ("v.txt", "index.bin")
+    assert len(set(thread_ids)) == 2
+
+
+def test_thread_pool_deterministic_positional_order():
+    def load(i: int) -> int:
+        time.sleep(random.random() * 0.01)
+        return i
+
+    def load_a(i: int = 0) -> int:
+        return load(i)
+
+    def load_b(i: int = 1) -> int:
+        return load(i)
+
+    def load_c(i: int = 2) -> int:
+        return load(i)
+
+    def main(a: load_a, b: load_b, c: load_c, /) -> Tuple[int, int, int]:  # type: ignore
+        return a, b, c
+
+    for _ in range(10):
+        assert dcargs.cli(main, args=[], max_workers=3) == (0, 1, 2)
+    assert dcargs.cli(main, args=["--b.i", "5"], max_workers=3) == (0, 5, 2)
+
+
+def test_thread_pool_errors_are_aggregated():
+    @dataclasses.dataclass
+    class A:
+        x: int = 1
+
+        def __post_init__(self) -> None:
+            raise ValueError("bad a")
+
+    @dataclasses.dataclass
+    class B:
+        x: int = 1
+
+        def __post_init__(self) -> None:
+            raise RuntimeError("bad b")
+
+    @dataclasses.dataclass
+    class Config:
+        a: A
+        b: B
+
+    with pytest.raises(dcargs.InstantiationError) as excinfo:
+        dcargs.cli(Config, args=[], max_workers=4)
+    message = str(excinfo.value)
+    assert "2 object(s)" in message
+    assert "A: ValueError: bad a" in message
+    assert "B: RuntimeError: bad b" in message
+    assert isinstance(excinfo.value.__cause__, ValueError)
+
+
+def test_thread_pool_lazy():
+    calls: List[str] = []
+
+    @dataclasses.dataclass
+    class Inner:
+        x: int = 1
+
+        def __post_init__(self) -> None:
+            calls.append("inner")
+
+    @dataclasses.dataclass
+    class Config:
+        inner: dcargs.conf.Lazy[Inner]
+
+    config = dcargs.cli(Config, args=["--inner.x", "2"], max_workers=2)
+    assert calls == []
+    assert config.inner.x == 2
+    assert calls == ["inner"]
+
+
+def test_thread_pool_main_runs_on_calling_thread():
+    thread_ids: List[int] = []
+
+    @dataclasses.dataclass
+    class Inner:
+        x: int = 1
+
+    def main(inner: Inner) -> int:
+        thread_ids.append(threading.get_ident())
+        return inner.x
+
+    assert dcargs.cli(main, args=["--inner.x", "3"], max_workers=2) == 3
+    assert thread_ids == [threading.get_ident()]
+
+    def fail(inner: Inner) -> None:
+        raise KeyError("bad main")
+
+    # Exceptions from the outermost call aren't wrapped.
+    with pytest.raises(KeyError, match="bad main"):
+        dcargs.cli(fail, args=[], max_workers=2)
+
+
+def test_thread_pool_slow_leaf_does_not_block_other_subtrees():
+    # The slow leaf only finishes once an unrelated parent has been built, which
+    # requires that parents are scheduled as soon as their own children are done.
+    parent_built = threading.Event()
+
+    @dataclasses.dataclass
+    class Slow:
+        x: int = 1
+
+        def __post_init__(self) -> None:
+            assert parent_built.wait(timeout=5.0)
+
+    @dataclasses.dataclass
+    class Leaf:
+        x: int = 1
+
+    @dataclasses.dataclass
+    class Parent:
+        leaf: Leaf
+
+        def __post_init__(self) -> None:
+            parent_built.set()
+
+    @dataclasses.dataclass
+    class Config:
+        slow: Slow
+        parent: Parent
+
+    config = dcargs.cli(Config, args=[], max_workers=2)
+    assert config.parent.leaf.x == 1
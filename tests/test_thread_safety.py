@@ -0,0 +1,127 @@
+import concurrent.futures
+import contextlib
+import dataclasses
+import enum
+import io
+import sys
+import threading
+from typing import Dict, List, Tuple
+
+import pytest
+from typing_extensions import Literal
+
+import dcargs
+import dcargs._argparse_formatter
+import dcargs._strings
+
+
+class Color(enum.Enum):
+    RED = enum.auto()
+    GREEN = enum.auto()
+
+
+@dataclasses.dataclass(frozen=True)
+class Optimizer:
+    lr: float = 1e-3
+    """Learning rate."""
+    betas: Tuple[float, float] = (0.9, 0.999)
+    schedule: Literal["cosine", "linear"] = "cosine"
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    optimizer: Optimizer
+    color: Color = Color.RED
+    """Some color."""
+    layers: Tuple[int, ...] = (64, 64)
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """Writes from each thread go to a separate buffer."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    @property
+    def buffer_for_thread(self) -> io.StringIO:
+        if not hasattr(self._local, "buffer"):
+            self._local.buffer = io.StringIO()
+        return self._local.buffer
+
+    def write(self, s: str) -> int:
+        return self.buffer_for_thread.write(s)
+
+
+def test_concurrent_cli(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Always render helptext; don't read it from the cache.
+    monkeypatch.setenv("DCARGS_CACHE_DIR", "")
+    stdout = _ThreadLocalStdout()
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    def get_helptext(colors: bool) -> str:
+        buffer = stdout.buffer_for_thread
+        buffer.seek(0)
+        buffer.truncate()
+        with pytest.raises(SystemExit), (
+            contextlib.nullcontext()
+            if colors
+            else dcargs._argparse_formatter.dummy_termcolor_context()
+        ):
+            dcargs.cli(Config, args=["--help"])
+        return buffer.getvalue()
+
+    expected_helptext = get_helptext(colors=False)
+    assert "\x1b" not in expected_helptext
+    assert "Learning rate." in expected_helptext
+
+    def task(i: int) -> None:
+        if i % 4 == 0:
+            helptext = get_helptext(colors=i % 8 == 0)
+            assert ("\x1b" in helptext) == (i % 8 == 0)
+            assert dcargs._strings.strip_ansi_sequences(helptext) == expected_helptext
+        else:
+            assert dcargs.cli(
+                Config,
+                args=[
+                    "--optimizer.lr",
+                    str(i),
+                    "--optimizer.schedule",
+                    ["cosine", "linear"][i % 2],
+                    "--color",
+                    ["RED", "GREEN"][i % 2],
+                    "--layers",
+                    *map(str, range(1 + i % 4)),
+                ],
+            ) == Config(
+                optimizer=Optimizer(lr=i, schedule=["cosine", "linear"][i % 2]),
+                color=[Color.RED, Color.GREEN][i % 2],
+                layers=tuple(range(1 + i % 4)),
+            )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(task, range(2000)))
+
+    # Global state should be restored.
+    assert dcargs._argparse_formatter._ansi_context_count == 0
+    assert dcargs._strings._colors_enabled.get()
+
+
+def test_colors_are_context_local() -> None:
+    results: Dict[str, List[bool]] = {"main": [], "other": []}
+    barrier = threading.Barrier(2)
+
+    def other() -> None:
+        barrier.wait()
+        results["other"].append(dcargs._strings.colors_enabled())
+        barrier.wait()
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    with dcargs._argparse_formatter.dummy_termcolor_context():
+        barrier.wait()
+        results["main"].append(dcargs._strings.colors_enabled())
+        barrier.wait()
+    thread.join()
+
+    assert results["main"] == [False]
+    assert results["other"] == [dcargs._strings.colors_enabled()]